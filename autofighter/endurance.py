@@ -0,0 +1,299 @@
+"""Endurance runs: waves back to back in constant memory.
+
+Plays the game's progression headlessly for as many waves as asked::
+
+    python -m autofighter.endurance --waves 1000000 --checkpoint logs/endurance.ckpt
+
+The party levels up between waves and each wave's level follows the party the
+way ``gamestates.main`` does it. Unlike the game, nothing grows with the
+number of waves played:
+
+- fighters' ``Logs`` are emptied after every wave,
+- the foes of a finished wave are rebuilt in place for the next one (see
+  :func:`autofighter.sim.wave.build_foes`),
+- photos, replays, saves and past lives never touch the disk,
+- only counters and a fixed-size window of recent :class:`Breakpoint` s are
+  kept.
+
+A lost or timed out wave is recorded as a breakpoint and the run goes on:
+party members who fell come back at full HP and DOTs/HOTs are cleared. A wave
+that raises is recorded the same way with outcome :data:`ERROR`, so a single
+bad roll does not end a long soak. Every ``checkpoint_every`` waves the whole
+run is written to a single checkpoint file, replaced atomically, and
+:meth:`Endurance.load` resumes from it.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import pickle
+import random
+import argparse
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from player import Player
+
+from autofighter.montecarlo import DEFAULT_PARTY, build_party
+from autofighter.sim.battle import Battle, WON, LOST
+from autofighter.sim.foe_cache import FoeCache
+from autofighter.sim.roster import hydrate, to_record
+from autofighter.sim.wave import NUMBER_OF_FOES, build_foes, wave_level
+
+
+ERROR = "error"
+
+
+@dataclass(frozen=True)
+class Breakpoint:
+    """A wave the party did not win."""
+
+    wave: int
+    level: int
+    party_level: float
+    outcome: str | None
+    ticks: int
+
+
+class Endurance:
+    """A headless run that plays waves one after another.
+
+    Args:
+        party: Themed names of the party members.
+        level: Level the party starts at.
+        seed: Seed of the run's random stream.
+        max_ticks: Tick budget per wave; a wave that runs out counts as a
+            timeout.
+        number_of_foes: Foes on the field at once.
+        fast_resolve: Confidence threshold passed to :class:`Battle`.
+        checkpoint: Path of the checkpoint file, or ``None`` for none.
+        checkpoint_every: Waves between checkpoints.
+        recent: How many breakpoints to keep.
+        foe_cache: Foe templates to keep (see
+            :class:`~autofighter.sim.foe_cache.FoeCache`), or 0 to build
+            every foe from scratch.
+    """
+
+    def __init__(
+        self,
+        party: tuple[str, ...] = DEFAULT_PARTY,
+        level: int = 1,
+        seed: int = 0,
+        max_ticks: int = 20000,
+        number_of_foes: int = NUMBER_OF_FOES,
+        fast_resolve: float | None = None,
+        checkpoint: str | None = None,
+        checkpoint_every: int = 1000,
+        recent: int = 100,
+        foe_cache: int = 0,
+    ) -> None:
+        self.rng = random.Random(seed)
+        self.party: list[Player] = build_party(party, level, self.rng)
+        self.foes: list[Player] = []
+
+        self.max_ticks = max_ticks
+        self.number_of_foes = number_of_foes
+        self.fast_resolve = fast_resolve
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.foe_cache = foe_cache
+        self.templates = FoeCache(foe_cache) if foe_cache else None
+
+        self.wave = 0
+        self.past_level = 1
+        self.foes_killed = 1
+        self.wins = 0
+        self.losses = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.ticks = 0
+        self.breakpoints: deque[Breakpoint] = deque(maxlen=recent)
+
+    @property
+    def party_level(self) -> float:
+        return sum(player.level for player in self.party) / len(self.party)
+
+    def next_level(self) -> int:
+        """Pick the next wave's level and advance the kill count, like the game."""
+        level = wave_level(self.party, self.foes_killed)
+
+        if level < max(round(self.past_level / 2) - 10, 1):
+            level = self.rng.randint(max(round(self.past_level / 2) - 10, 1), round(self.past_level / 2) + 10)
+        else:
+            self.past_level = level
+
+        self.foes_killed += NUMBER_OF_FOES
+        return level
+
+    def play_wave(self) -> str | None:
+        """Level the party up, fight one wave and tidy up after it."""
+        self.wave += 1
+
+        for player in self.party:
+            player.DamageDealt = 0
+            player.DamageTaken = 0
+
+        level = self.next_level()
+
+        for player in self.party:
+            player.level_up()
+
+        foelist, backup_foes_list = build_foes(level, self.number_of_foes, self.rng, reuse=self.foes, cache=self.templates)
+        self.foes = foelist + backup_foes_list
+
+        battle = Battle(list(self.party), foelist, backup_foes_list=backup_foes_list, level=level, persist=False, rng=self.rng, fast_resolve=self.fast_resolve)
+        battle.enrage_timer.printed = True
+
+        try:
+            outcome = battle.run_wave(max_ticks=self.max_ticks)
+        except Exception as e:
+            print(f"Error in wave {self.wave} (level {level}): {e!r}")
+            outcome = ERROR
+
+        self.ticks += battle.ticks
+        if outcome == WON:
+            self.wins += 1
+        elif outcome == LOST:
+            self.losses += 1
+        elif outcome == ERROR:
+            self.errors += 1
+        else:
+            self.timeouts += 1
+
+        if outcome != WON:
+            self.breakpoints.append(Breakpoint(self.wave, level, self.party_level, outcome, battle.ticks))
+
+        for player in self.party + self.foes:
+            player.Logs.clear()
+
+        for player in self.party:
+            if player.HP < 1 or outcome != WON:
+                player.HP = player.MHP
+            player.DOTS.clear()
+            player.HOTS.clear()
+
+        return outcome
+
+    def run(self, waves: int, on_wave: Callable[[Endurance, str | None], None] | None = None) -> dict[str, Any]:
+        """Play ``waves`` more waves, checkpointing along the way."""
+        for _ in range(waves):
+            outcome = self.play_wave()
+
+            if on_wave is not None:
+                on_wave(self, outcome)
+
+            if self.checkpoint is not None and self.wave % self.checkpoint_every == 0:
+                self.save(self.checkpoint)
+
+        if self.checkpoint is not None:
+            self.save(self.checkpoint)
+
+        return self.summary()
+
+    def summary(self) -> dict[str, Any]:
+        waves = max(self.wave, 1)
+        return {
+            "waves": self.wave,
+            "win_rate": self.wins / waves,
+            "loss_rate": self.losses / waves,
+            "timeout_rate": self.timeouts / waves,
+            "error_rate": self.errors / waves,
+            "mean_ticks": self.ticks / waves,
+            "party_level": self.party_level,
+            "wave_level": self.past_level,
+            "recent_breakpoints": [asdict(breakpoint) for breakpoint in self.breakpoints],
+        }
+
+    def state(self) -> dict[str, Any]:
+        """Everything needed to resume the run, as picklable data."""
+        state = {key: value for key, value in self.__dict__.items() if key not in ("rng", "party", "foes", "breakpoints", "templates")}
+        state["rng"] = self.rng.getstate()
+        state["party"] = [to_record(player) for player in self.party]
+        state["breakpoints"] = (list(self.breakpoints), self.breakpoints.maxlen)
+        return state
+
+    def save(self, path: str) -> None:
+        """Write a checkpoint to ``path``, replacing the previous one atomically."""
+        temp_path = f"{path}.tmp"
+
+        with open(temp_path, "wb") as f:
+            pickle.dump(self.state(), f)
+
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, **overrides: Any) -> Endurance:
+        """Resume a run from the checkpoint at ``path``.
+
+        ``overrides`` replace settings such as ``max_ticks`` or
+        ``checkpoint`` of the saved run.
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+
+        run = cls.__new__(cls)
+        run.rng = random.Random()
+        run.rng.setstate(state.pop("rng"))
+        run.party = [hydrate(record) for record in state.pop("party")]
+        run.foes = []
+        breakpoints, recent = state.pop("breakpoints")
+        run.breakpoints = deque(breakpoints, maxlen=recent)
+        run.__dict__.update(state)
+        run.__dict__.update(overrides)
+        run.foe_cache = getattr(run, "foe_cache", 0)
+        run.templates = FoeCache(run.foe_cache) if run.foe_cache else None
+
+        for player in run.party:
+            player.rng = run.rng
+
+        return run
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(prog="python -m autofighter.endurance", description="Play headless waves back to back in constant memory.")
+    parser.add_argument("--waves", type=int, default=1000, help="number of waves to play")
+    parser.add_argument("--party", nargs="+", default=list(DEFAULT_PARTY), help="themed names of the party members")
+    parser.add_argument("--level", type=int, default=1, help="level the party starts at")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="tick budget per wave")
+    parser.add_argument("--foes", type=int, default=NUMBER_OF_FOES, help="foes on the field at once")
+    parser.add_argument("--fast-resolve", type=float, default=None, metavar="CONFIDENCE", help="skip lopsided waves to their expected outcome above this confidence (0-1)")
+    parser.add_argument("--foe-cache", type=int, default=None, metavar="SIZE", help="reuse up to SIZE foe templates across waves (0 for none, the default; --resume keeps the saved run's)")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file to write (and resume from with --resume)")
+    parser.add_argument("--checkpoint-every", type=int, default=1000, help="waves between checkpoints")
+    parser.add_argument("--resume", action="store_true", help="continue the run saved in --checkpoint")
+    parser.add_argument("--report-every", type=int, default=100, help="waves between progress lines (0 for none)")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.resume:
+        if args.checkpoint is None:
+            parser.error("--resume needs --checkpoint")
+        overrides = {} if args.foe_cache is None else {"foe_cache": args.foe_cache}
+        run = Endurance.load(args.checkpoint, max_ticks=args.max_ticks, checkpoint=args.checkpoint, checkpoint_every=args.checkpoint_every, **overrides)
+    else:
+        run = Endurance(tuple(args.party), args.level, args.seed, args.max_ticks, args.foes, args.fast_resolve, args.checkpoint, args.checkpoint_every, foe_cache=args.foe_cache or 0)
+
+    def report(run: Endurance, outcome: str | None) -> None:
+        if args.report_every and run.wave % args.report_every == 0:
+            print(f"wave {run.wave}: level {run.past_level}, party level {run.party_level:.1f}, {run.wins} won, {run.losses} lost, {run.timeouts} timed out, {run.errors} errors")
+
+    summary = run.run(args.waves, report)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            if key != "recent_breakpoints":
+                print(f"{key:>20}: {value:.4g}" if isinstance(value, float) else f"{key:>20}: {value}")
+        for breakpoint in summary["recent_breakpoints"][-5:]:
+            print(f"{'breakpoint':>20}: wave {breakpoint['wave']} at level {breakpoint['level']} ({breakpoint['outcome']})")
+
+    return summary
+
+
+if __name__ == "__main__":
+    main()
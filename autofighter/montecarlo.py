@@ -0,0 +1,180 @@
+"""Monte Carlo wave runner.
+
+Fights many independent headless waves across a process pool and reports
+aggregate balance numbers::
+
+    python -m autofighter.montecarlo --runs 500 --party luna carly becca --level 200
+
+Every wave is described by a :class:`WaveJob` (party composition, levels and
+seed) so a run is reproducible from its seed alone.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import random
+import argparse
+
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+
+from player import Player
+
+from autofighter.sim.battle import Battle, WON, LOST
+from autofighter.sim.wave import NUMBER_OF_FOES, build_foes
+
+
+DEFAULT_PARTY = ("player", "luna", "carly", "becca", "ally")
+
+
+@dataclass(frozen=True)
+class WaveJob:
+    """One independent wave to simulate."""
+
+    party: tuple[str, ...]
+    party_level: int
+    foe_level: int
+    seed: int
+    number_of_foes: int = NUMBER_OF_FOES
+    max_ticks: int = 20000
+    arrays: bool = False
+    fast_resolve: float | None = None
+
+
+@dataclass(frozen=True)
+class WaveResult:
+    """What happened in a single :class:`WaveJob`."""
+
+    seed: int
+    outcome: str | None
+    ticks: int
+    damage_dealt: float
+    damage_taken: float
+    enrage_reached: bool
+    party_survivors: int
+    fast_resolved: bool = False
+
+    @property
+    def won(self) -> bool:
+        return self.outcome == WON
+
+
+def build_party(names: tuple[str, ...], level: int, rng: random.Random | None = None) -> list[Player]:
+    """Build fresh party members at ``level`` without touching saved lives."""
+    party: list[Player] = []
+
+    for name in names:
+        player = Player(name.replace("_", " "), rng)
+        player.set_level(level)
+        player.isplayer = True
+        party.append(player)
+
+    return party
+
+
+def run_wave(job: WaveJob) -> WaveResult:
+    """Fight ``job`` to completion and summarise the result."""
+    rng = random.Random(job.seed)
+
+    party = build_party(job.party, job.party_level, rng)
+    foelist, backup_foes_list = build_foes(job.foe_level, job.number_of_foes, rng)
+
+    battle = Battle(list(party), foelist, backup_foes_list=backup_foes_list, level=job.foe_level, persist=False, rng=rng, arrays=job.arrays, fast_resolve=job.fast_resolve)
+    # Thousands of waves reach enrage; skip the timer's one-off console notice.
+    battle.enrage_timer.printed = True
+    battle.run_wave(max_ticks=job.max_ticks)
+
+    return WaveResult(
+        seed=job.seed,
+        outcome=battle.outcome,
+        ticks=battle.ticks,
+        damage_dealt=sum(player.DamageDealt for player in party),
+        damage_taken=sum(player.DamageTaken for player in party),
+        enrage_reached=battle.enrage_timer.timed_out,
+        party_survivors=len(battle.playerlist),
+        fast_resolved=battle.fast_resolved,
+    )
+
+
+def make_jobs(
+    runs: int,
+    party: tuple[str, ...],
+    party_level: int,
+    foe_level: int,
+    seed: int = 0,
+    max_ticks: int = 20000,
+    number_of_foes: int = NUMBER_OF_FOES,
+    arrays: bool = False,
+    fast_resolve: float | None = None,
+) -> list[WaveJob]:
+    return [WaveJob(party, party_level, foe_level, seed + i, number_of_foes, max_ticks, arrays, fast_resolve) for i in range(runs)]
+
+
+def run_many(jobs: list[WaveJob], workers: int | None = None) -> list[WaveResult]:
+    """Simulate ``jobs`` in a process pool, in order.
+
+    ``workers=1`` runs in this process, which is handy for profiling.
+    """
+    if workers == 1:
+        return [run_wave(job) for job in jobs]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_wave, jobs, chunksize=chunksize))
+
+
+def summarize(results: list[WaveResult]) -> dict[str, float]:
+    """Aggregate win rate, time-to-kill, damage and enrage rate."""
+    runs = len(results)
+    if runs == 0:
+        return {"runs": 0}
+
+    wins = [result for result in results if result.won]
+
+    return {
+        "runs": runs,
+        "win_rate": len(wins) / runs,
+        "loss_rate": sum(1 for result in results if result.outcome == LOST) / runs,
+        "timeout_rate": sum(1 for result in results if result.outcome is None) / runs,
+        "mean_ticks": sum(result.ticks for result in results) / runs,
+        "mean_ticks_to_kill": sum(result.ticks for result in wins) / len(wins) if wins else float("nan"),
+        "mean_damage_dealt": sum(result.damage_dealt for result in results) / runs,
+        "mean_damage_taken": sum(result.damage_taken for result in results) / runs,
+        "enrage_rate": sum(1 for result in results if result.enrage_reached) / runs,
+        "fast_resolve_rate": sum(1 for result in results if result.fast_resolved) / runs,
+    }
+
+
+def main(argv: list[str] | None = None) -> dict[str, float]:
+    parser = argparse.ArgumentParser(prog="python -m autofighter.montecarlo", description="Simulate many headless waves and aggregate the results.")
+    parser.add_argument("--runs", type=int, default=100, help="number of waves to simulate")
+    parser.add_argument("--party", nargs="+", default=list(DEFAULT_PARTY), help="themed names of the party members")
+    parser.add_argument("--party-level", type=int, default=None, help="party level (defaults to --level)")
+    parser.add_argument("--level", type=int, default=50, help="wave level the foes are rolled around")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first wave; wave i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="tick budget per wave")
+    parser.add_argument("--foes", type=int, default=NUMBER_OF_FOES, help="foes on the field at once; the rest of the wave waits as backups")
+    parser.add_argument("--arrays", action="store_true", help="keep tick-level stats in NumPy arrays (needs NumPy)")
+    parser.add_argument("--fast-resolve", type=float, default=None, metavar="CONFIDENCE", help="skip lopsided waves to their expected outcome above this confidence (0-1)")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    party_level = args.party_level if args.party_level is not None else args.level
+    jobs = make_jobs(args.runs, tuple(args.party), party_level, args.level, args.seed, args.max_ticks, args.foes, args.arrays, args.fast_resolve)
+    summary = summarize(run_many(jobs, args.workers))
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>20}: {value:.4g}" if isinstance(value, float) else f"{key:>20}: {value}")
+
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Struct-of-arrays fighter storage for large rosters.
+
+:class:`ArrayRoster` moves the stats every tick touches (:data:`FIELDS`) out
+of each fighter's ``__dict__`` into NumPy columns, one slot per fighter, and
+turns the fighter into an :class:`ArrayPlayer`: a ``Player`` whose attributes
+in :data:`FIELDS` are views onto its slot. Every ``Player`` method keeps
+working unchanged, while the battle can run action point accumulation, HP
+regain, HP clamping and death detection as single array operations over a
+whole side of the field.
+
+Columns are ``float64``. A parallel flag column remembers whether the value
+written was an ``int``, so reads return the same Python type the object path
+would have produced and vectorized results match it exactly (for values below
+2**53).
+
+NumPy is optional; :class:`ArrayRoster` raises ``ImportError`` without it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    np = None
+
+from player import Player
+
+
+FIELDS = ("HP", "MHP", "Atk", "Def", "ActionPoints", "ActionPointsPerTick", "ActionPointsPerTurn", "Regain", "Vitality")
+
+HP, MHP, ATK, DEF, ACTION_POINTS, PER_TICK, PER_TURN, REGAIN, VITALITY = range(len(FIELDS))
+
+
+class _Column:
+    """Map one ``Player`` attribute onto a roster column."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __get__(self, player: Any, owner: type | None = None) -> Any:
+        if player is None:
+            return self
+        state = player.__dict__
+        return state["_roster"].get(self.index, state["_slot"])
+
+    def __set__(self, player: Any, value: Any) -> None:
+        state = player.__dict__
+        state["_roster"].set(self.index, state["_slot"], value)
+
+
+class ArrayPlayer(Player):
+    """A ``Player`` whose tick-level stats live in an :class:`ArrayRoster`.
+
+    Fighters become ``ArrayPlayer`` when they are bound to a roster and go
+    back to plain ``Player`` objects on :meth:`ArrayRoster.release`.
+    """
+
+    def save(self):
+        roster = self._roster
+        roster.detach(self)
+        try:
+            Player.save(self)
+        finally:
+            roster.attach(self)
+
+    def save_past_life(self):
+        roster = self._roster
+        roster.detach(self)
+        try:
+            Player.save_past_life(self)
+        finally:
+            roster.attach(self)
+
+    def do_pre_turn(self):
+        if not self._roster.take_regained(self._slot):
+            self.regain_hp()
+        if self.HOTS:
+            self.heal_over_time()
+        if self.DOTS:
+            self.damage_over_time()
+
+
+for _index, _name in enumerate(FIELDS):
+    setattr(ArrayPlayer, _name, _Column(_index))
+
+
+class ArrayRoster:
+    """NumPy columns for the fighters of a battle.
+
+    Args:
+        fighters: Fighters to bind right away.
+        capacity: Initial number of slots; the columns grow as needed.
+    """
+
+    def __init__(self, fighters: Iterable[Player] = (), capacity: int = 16) -> None:
+        if np is None:
+            raise ImportError("ArrayRoster needs NumPy")
+
+        self.fighters: list[Player | None] = []
+        self.columns = [np.zeros(capacity) for _ in FIELDS]
+        self.ints = [np.zeros(capacity, dtype=bool) for _ in FIELDS]
+        self.regained = np.zeros(capacity, dtype=bool)
+
+        for fighter in fighters:
+            self.bind(fighter)
+
+    def __len__(self) -> int:
+        return sum(fighter is not None for fighter in self.fighters)
+
+    def __contains__(self, fighter: Player) -> bool:
+        return isinstance(fighter, ArrayPlayer) and fighter.__dict__["_roster"] is self
+
+    def get(self, index: int, slot: int) -> int | float:
+        value = self.columns[index].item(slot)
+        return int(value) if self.ints[index].item(slot) else value
+
+    def set(self, index: int, slot: int, value: int | float) -> None:
+        self.columns[index][slot] = value
+        self.ints[index][slot] = isinstance(value, int)
+
+    def bind(self, fighter: Player) -> int:
+        """Move ``fighter``'s :data:`FIELDS` into a new slot and return it."""
+        if fighter in self:
+            return fighter._slot
+        if isinstance(fighter, ArrayPlayer):
+            fighter._roster.release(fighter)
+
+        slot = len(self.fighters)
+        if slot == len(self.regained):
+            self._grow()
+
+        self.fighters.append(fighter)
+        fighter.__dict__["_slot"] = slot
+        self.attach(fighter)
+        return slot
+
+    def attach(self, fighter: Player) -> None:
+        """Load ``fighter``'s plain attributes into its slot."""
+        state = fighter.__dict__
+        state["_roster"] = self
+        slot = state["_slot"]
+
+        for index, name in enumerate(FIELDS):
+            self.set(index, slot, state.pop(name))
+
+        fighter.__class__ = ArrayPlayer
+
+    def detach(self, fighter: Player) -> None:
+        """Copy ``fighter``'s slot back into plain attributes; the slot is kept."""
+        state = fighter.__dict__
+        slot = state["_slot"]
+
+        for index, name in enumerate(FIELDS):
+            state[name] = self.get(index, slot)
+
+        del state["_roster"]
+        fighter.__class__ = Player
+
+    def release(self, fighter: Player) -> None:
+        """Turn ``fighter`` back into a plain ``Player`` and free its slot."""
+        if fighter not in self:
+            return
+
+        slot = fighter._slot
+        self.detach(fighter)
+        del fighter.__dict__["_slot"]
+        self.fighters[slot] = None
+
+    def release_all(self) -> None:
+        for fighter in list(self.fighters):
+            if fighter is not None:
+                self.release(fighter)
+
+    def state(self, fighter: ArrayPlayer) -> dict[str, Any]:
+        """Return ``fighter``'s attributes as a plain ``Player`` would have them."""
+        state = {key: value for key, value in fighter.__dict__.items() if key not in ("_roster", "_slot")}
+        for index, name in enumerate(FIELDS):
+            state[name] = self.get(index, fighter._slot)
+        return state
+
+    def absorb(self, fighter: ArrayPlayer) -> None:
+        """Move plain attributes written straight into ``__dict__`` into the slot."""
+        state = fighter.__dict__
+        for index, name in enumerate(FIELDS):
+            if name in state:
+                self.set(index, state["_slot"], state.pop(name))
+
+    def slots(self, fighters: Iterable[Player]) -> np.ndarray:
+        return np.fromiter((fighter._slot for fighter in fighters), dtype=np.intp)
+
+    def take_regained(self, slot: int) -> bool:
+        """Consume the flag :meth:`regain` set for ``slot``."""
+        if self.regained[slot]:
+            self.regained[slot] = False
+            return True
+        return False
+
+    def needs_pre_turn(self, fighter: ArrayPlayer) -> bool:
+        """``False`` if ``fighter``'s pre-turn would only repeat :meth:`regain`."""
+        return bool(fighter.DOTS or fighter.HOTS) or not self.regained[fighter.__dict__["_slot"]]
+
+    def fallen(self, fighters: list[Player]) -> list[Player]:
+        """Return the fighters in ``fighters`` with less than 1 HP."""
+        slots = self.slots(fighters)
+        return [fighters[i] for i in np.flatnonzero(self.columns[HP][slots] < 1)]
+
+    def tick(self, fighters: list[Player], mod: float) -> set[int]:
+        """Vectorized :meth:`player.Player.tick` over ``fighters``.
+
+        Returns the ids of the fighters that take a turn.
+        """
+        slots = self.slots(fighters)
+        points = self.columns[ACTION_POINTS]
+
+        alive = slots[self.columns[HP][slots] >= 1]
+        points[alive] += np.round(self.columns[PER_TICK][alive] * max(mod, 1))
+
+        per_tick = self.columns[PER_TICK][alive]
+        per_turn = self.columns[PER_TURN][alive]
+        for slot in alive[per_tick >= np.round(per_turn * 0.1)]:
+            self.fighters[slot].check_action_speed()
+
+        ready = alive[points[alive] >= self.columns[PER_TURN][alive]]
+        points[ready] -= self.columns[PER_TURN][ready]
+        self.ints[ACTION_POINTS][ready] &= self.ints[PER_TURN][ready]
+
+        return {id(self.fighters[slot]) for slot in ready}
+
+    def regain(self, fighters: list[Player], threshold: np.ndarray | float = 0) -> None:
+        """Apply :meth:`player.Player.regain_hp` to every fighter above ``threshold`` HP.
+
+        The regain of the fighters' next ``do_pre_turn`` is skipped, so it
+        still happens once per pre-turn, just ahead of time.
+        """
+        slots = self.slots(fighters)
+        hp = self.columns[HP]
+        max_hp = self.columns[MHP]
+
+        self.regained[slots] = False
+        slots = slots[hp[slots] > threshold]
+
+        healing = np.minimum(max_hp[slots], (self.columns[REGAIN][slots] * self.columns[VITALITY][slots]) ** 1.25)
+        hp[slots] += np.round(healing)
+        self.regained[slots] = True
+
+        self.clamp_hp(slots)
+
+    def clamp_hp(self, slots: np.ndarray) -> None:
+        """Cap HP at MHP for ``slots``."""
+        over = slots[self.columns[HP][slots] > self.columns[MHP][slots]]
+        self.columns[HP][over] = self.columns[MHP][over]
+        self.ints[HP][over] = self.ints[MHP][over]
+
+    def _grow(self) -> None:
+        extra = max(16, len(self.regained))
+        self.columns = [np.concatenate([column, np.zeros(extra)]) for column in self.columns]
+        self.ints = [np.concatenate([flags, np.zeros(extra, dtype=bool)]) for flags in self.ints]
+        self.regained = np.concatenate([self.regained, np.zeros(extra, dtype=bool)])
@@ -0,0 +1,525 @@
+"""Headless combat engine.
+
+A :class:`Battle` owns everything that happens while a wave is fought: the
+enrage timer, roster refills from the backup lists, target selection, turn
+order, passives and kill/EXP bookkeeping.  Nothing in this module touches
+pygame, so a wave can be simulated without a window and as fast as Python
+allows.  :func:`gamestates.main` only renders the state a battle exposes.
+"""
+
+from __future__ import annotations
+
+import random
+
+from typing import Callable, TYPE_CHECKING
+
+from timerhelper import timmer
+
+from damagetypes import Generic
+from damagestate import check_passive_mod
+from damage_over_time import dot as damageovertimetype
+
+from autofighter.sim import fast_resolve
+from autofighter.sim.arrays import ArrayRoster
+from autofighter.sim.resolution import Attack, resolve
+from autofighter.sim.scheduler import ActionScheduler
+from autofighter.sim.replay import CRIT, DODGED, DOT_APPLIED, KILL, ReplayWriter
+from autofighter.sim import snapshot as snapshots
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+WON = "won"
+LOST = "lost"
+
+
+class Battle:
+    """Simulate one wave between ``playerlist`` and ``foelist``.
+
+    Args:
+        playerlist: Active party members. Mutated in place as fighters die
+            and backups join.
+        foelist: Active foes. Mutated in place like ``playerlist``.
+        backup_players_list: Allies waiting to replace fallen party members.
+        backup_foes_list: Foes waiting to replace fallen foes.
+        level: Wave level used to scale the enrage mechanic.
+        on_kill: Called with ``(dead, killer)`` whenever an attack kills.
+        on_action: Called once before every action a fighter takes.
+        persist: When ``True`` fallen party members write their past life
+            to disk, exactly like the interactive game does.
+        timeout_ticks: Ticks before the enrage mechanic starts.
+        event_scheduler: Decide turns with an :class:`ActionScheduler`
+            instead of polling ``Player.tick`` on every fighter each tick.
+        rng: Random stream for the whole wave. It is handed to every
+            fighter so damage, dodge, crit and passive rolls all draw from
+            it. Defaults to the global :mod:`random` module.
+        recorder: Optional :class:`ReplayWriter` that every action, HP
+            sample and the outcome are written to.
+        arrays: Keep tick-level stats in an :class:`ArrayRoster` and run
+            action point polling, regain, HP clamping and death checks as
+            array operations. Needs NumPy. Fighters go back to plain
+            ``Player`` objects when the wave is decided.
+        batched: Collect the attacks declared in a tick and settle them
+            together at the end of it with :func:`resolution.resolve`
+            instead of one by one as fighters act.
+        fast_resolve: Confidence threshold (0-1) above which a lopsided
+            wave is skipped straight to its expected outcome, judged from
+            the stats before the first tick and again after
+            :data:`fast_resolve.PROBE_TICKS` simulated ticks; see
+            :mod:`autofighter.sim.fast_resolve`. ``None`` always simulates.
+    """
+
+    def __init__(
+        self,
+        playerlist: list[Player],
+        foelist: list[Player],
+        backup_players_list: list[Player] | None = None,
+        backup_foes_list: list[Player] | None = None,
+        level: int = 1,
+        *,
+        on_kill: Callable[[Player, Player], None] | None = None,
+        on_action: Callable[[], None] | None = None,
+        persist: bool = True,
+        timeout_ticks: int = 1200,
+        event_scheduler: bool = True,
+        rng: random.Random | None = None,
+        recorder: ReplayWriter | None = None,
+        arrays: bool = False,
+        batched: bool = False,
+        fast_resolve: float | None = None,
+    ) -> None:
+        self.playerlist = playerlist
+        self.foelist = foelist
+        self.backup_players_list = backup_players_list if backup_players_list is not None else []
+        self.backup_foes_list = backup_foes_list if backup_foes_list is not None else []
+        self.level = level
+        self.on_kill = on_kill
+        self.on_action = on_action
+        self.persist = persist
+        self.rng = rng if rng is not None else random
+
+        if rng is not None:
+            for fighter in self.playerlist + self.foelist + self.backup_players_list + self.backup_foes_list:
+                fighter.rng = rng
+
+        self.enrage_timer = timmer(timeout_ticks)
+        self.enrage_timer.reset()
+        self.enrage_timer.start()
+
+        self.enrage_mod: float = 0.0
+        self.bleed_mod: float = 1.0
+        self.def_mod: float = 1.0
+        self.ticks: int = 0
+        self.is_deading: bool = False
+        self.outcome: str | None = None
+
+        self._enrage_dot: damageovertimetype | None = None
+
+        self.foe_schedule: ActionScheduler | None = None
+        self.player_schedule: ActionScheduler | None = None
+        if event_scheduler:
+            self.foe_schedule = ActionScheduler()
+            self.player_schedule = ActionScheduler()
+
+        self.recorder = recorder
+        self.arrays = ArrayRoster() if arrays else None
+        self.attacks: list[Attack] | None = [] if batched else None
+        self.fast_resolve_threshold = fast_resolve
+        self.fast_resolve_probe: fast_resolve.Probe | None = None
+        self.fast_resolved = False
+        self.fighters: list[Player] = []
+        self.fighter_ids: dict[int, int] = {}
+        for fighter in self.playerlist + self.backup_players_list + self.foelist + self.backup_foes_list:
+            fighter_id = self.fighter_id(fighter)
+            if recorder is not None:
+                recorder.fighter(0, fighter_id, fighter)
+
+    @property
+    def finished(self) -> bool:
+        return self.outcome is not None
+
+    def run_wave(self, max_ticks: int | None = None) -> str | None:
+        """Step until the wave is decided or ``max_ticks`` have elapsed.
+
+        Returns:
+            ``"won"``, ``"lost"`` or ``None`` if the tick budget ran out.
+        """
+        while self.step():
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+
+        return self.outcome
+
+    def step(self) -> bool:
+        """Advance the battle by one tick.
+
+        Returns:
+            ``True`` while the wave is still being fought.
+        """
+        if self.outcome is not None:
+            return False
+
+        if self.fast_resolve_threshold is not None:
+            if self.fast_resolve_probe is None:
+                self.fast_resolve_probe = fast_resolve.start_probe(self)
+                if self.try_fast_resolve():
+                    return False
+            elif self.ticks == self.fast_resolve_probe.ticks + fast_resolve.PROBE_TICKS and self.try_fast_resolve():
+                return False
+
+        self.ticks += 1
+        self.enrage_timer.tick()
+        self.enrage_timer.check_timeout()
+        self.update_enrage()
+        self._enrage_dot = None
+
+        self.remove_dead()
+        self.refill()
+
+        if len(self.foelist) < 1:
+            self.finish(WON)
+            return False
+
+        ready = self.ready_fighters(self.foe_schedule, self.foelist)
+        if self.arrays is not None:
+            self.arrays.regain(self.foelist, self.regain_thresholds(self.foelist, ready, 1))
+
+        for foe in list(self.foelist):
+            if self.takes_turn(foe, ready):
+                for _ in foe.ActionsPerTurn:
+                    self.foe_action(foe)
+            elif self.arrays is None or self.arrays.needs_pre_turn(foe):
+                if foe.HP > 0: foe.do_pre_turn()
+
+        if len(self.playerlist) < 1:
+            self.finish(LOST)
+            return False
+
+        ready = self.ready_fighters(self.player_schedule, self.playerlist)
+        if self.arrays is not None:
+            self.arrays.regain(self.playerlist)
+
+        for person in list(self.playerlist):
+            if self.takes_turn(person, ready):
+                for _ in person.ActionsPerTurn:
+                    self.player_action(person)
+            elif self.arrays is None or self.arrays.needs_pre_turn(person):
+                if person.HP > 0: person.do_pre_turn()
+
+            if self.arrays is None and person.HP > person.MHP:
+                person.HP = person.MHP
+
+        if self.arrays is not None:
+            self.arrays.clamp_hp(self.arrays.slots(self.playerlist))
+
+        if self.attacks is not None:
+            self.resolve_attacks()
+            if len(self.playerlist) < 1:
+                self.finish(LOST)
+                return False
+
+        if self.recorder is not None:
+            self.recorder.sample(self.ticks, {self.fighter_id(fighter): fighter for fighter in self.playerlist + self.foelist})
+
+        return True
+
+    def try_fast_resolve(self) -> bool:
+        """Skip to the outcome if the wave is lopsided enough. Returns ``True`` if it did."""
+        result = fast_resolve.estimate(self, self.fast_resolve_probe)
+        if not fast_resolve.worth_skipping(self, result, self.fast_resolve_threshold):
+            return False
+
+        fast_resolve.resolve(self, result)
+        self.fast_resolved = True
+        return True
+
+    def resolve_attacks(self) -> None:
+        """Settle the attacks declared this tick (batched mode)."""
+        attacks, self.attacks = self.attacks, []
+        resolve(self, attacks)
+
+    def finish(self, outcome: str) -> None:
+        self.outcome = outcome
+        if self.recorder is not None:
+            self.recorder.finish(self.ticks, outcome)
+
+        if self.arrays is not None:
+            self.arrays.release_all()
+
+    def snapshot(self) -> snapshots.BattleSnapshot:
+        """Capture the battle between ticks. See :mod:`autofighter.sim.snapshot`."""
+        return snapshots.capture(self)
+
+    def restore(self, snapshot: snapshots.BattleSnapshot) -> None:
+        """Rewind this battle to ``snapshot``, which must have been taken from it."""
+        snapshots.restore(self, snapshot)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: snapshots.BattleSnapshot, **kwargs) -> Battle:
+        """Start an independent battle from ``snapshot``, e.g. in a worker process."""
+        return snapshots.build_battle(snapshot, **kwargs)
+
+    def fighter_id(self, fighter: Player) -> int:
+        """Return the id replays and snapshots use for ``fighter``, assigning one if it is new."""
+        fighter_id = self.fighter_ids.get(id(fighter))
+
+        if fighter_id is None:
+            fighter_id = self.fighter_ids[id(fighter)] = len(self.fighters)
+            self.fighters.append(fighter)
+            if self.arrays is not None:
+                self.arrays.bind(fighter)
+
+        return fighter_id
+
+    def ready_fighters(self, schedule: ActionScheduler | None, roster: list[Player]) -> set[int] | None:
+        """Return ids of the fighters in ``roster`` that act this tick.
+
+        ``None`` means turns are polled with ``Player.tick`` instead.
+        """
+        if schedule is None:
+            if self.arrays is not None:
+                return self.arrays.tick(roster, self.bleed_mod)
+            return None
+
+        for fighter in roster:
+            if fighter not in schedule:
+                schedule.add(fighter)
+
+        schedule.set_mod(self.bleed_mod)
+        return {id(fighter) for fighter in schedule.pop_due(self.ticks)}
+
+    @staticmethod
+    def regain_thresholds(roster: list[Player], ready: set[int] | None, acting: float) -> list[float]:
+        """HP a fighter needs for its first pre-turn this tick to happen."""
+        if ready is None:
+            return [0] * len(roster)
+        return [acting if id(fighter) in ready else 0 for fighter in roster]
+
+    def takes_turn(self, fighter: Player, ready: set[int] | None) -> bool:
+        if ready is None:
+            return fighter.tick(self.bleed_mod)
+        return id(fighter) in ready
+
+    def schedules(self) -> list[ActionScheduler]:
+        return [schedule for schedule in (self.foe_schedule, self.player_schedule) if schedule is not None]
+
+    def sync_action_points(self) -> None:
+        """Settle lazily accumulated action points, e.g. before rendering."""
+        for schedule in self.schedules():
+            schedule.sync_all()
+
+    def forget(self, fighter: Player) -> None:
+        for schedule in self.schedules():
+            schedule.remove(fighter)
+
+    def update_enrage(self) -> None:
+        """Recompute the enrage multipliers from the enrage timer."""
+        enrage_mod = self.enrage_timer.get_timeout_duration()
+        level_base_enrage_mod = (self.level / max(min(self.level / 1000, 10000), 2))
+        player_base_enrage_mod = (enrage_mod * level_base_enrage_mod)
+        foe_base_enrage_mod = (enrage_mod * level_base_enrage_mod)
+
+        if enrage_mod > 10:
+            buffed_starter = ((enrage_mod - 10) * 0.0000004) + ((enrage_mod - 5) * 0.0000002)
+            bleed_mod = ((0.0000002 + buffed_starter) * (player_base_enrage_mod * foe_base_enrage_mod)) + 1
+        elif enrage_mod > 5:
+            buffed_starter = ((enrage_mod - 5) * 0.0000002)
+            bleed_mod = ((0.0000002 + buffed_starter) * (player_base_enrage_mod * foe_base_enrage_mod)) + 1
+        else:
+            bleed_mod = (0.0000002 * (player_base_enrage_mod * foe_base_enrage_mod)) + 1
+
+        def_mod = max(1, (bleed_mod * 0.0005))
+
+        if bleed_mod > 1.2:
+            def_mod = max(1, (bleed_mod * 0.002) + (bleed_mod * 0.002) + (bleed_mod * 0.001) + 1)
+
+        if bleed_mod > 2:
+            def_mod = max(1, (bleed_mod * 0.004) + (bleed_mod * 0.004) + (bleed_mod * 0.002) + 1)
+
+        self.enrage_mod = enrage_mod
+        self.bleed_mod = bleed_mod
+        self.def_mod = def_mod
+
+    def enrage_dot(self) -> damageovertimetype:
+        """Return this tick's shared enrage bleed, building it on first use."""
+        if self._enrage_dot is None:
+            bleed_mod = self.bleed_mod
+            self._enrage_dot = damageovertimetype("Enrage Bleed", min(5000, (bleed_mod ** 5) * self.level), max(300, min(6000, round(25 * bleed_mod))), Generic, "Enrage Mech", 1)
+
+        return self._enrage_dot
+
+    def remove_dead(self) -> None:
+        """Drop fallen fighters from both sides of the field."""
+        if self.is_deading:
+            for player in list(self.playerlist):
+                self.player_died(player)
+
+        if self.arrays is not None:
+            fallen_players = self.arrays.fallen(self.playerlist)
+            fallen_foes = self.arrays.fallen(self.foelist)
+        else:
+            fallen_players = [player for player in self.playerlist if player.HP < 1]
+            fallen_foes = [foe for foe in self.foelist if foe.HP < 1]
+
+        for player in fallen_players:
+            self.player_died(player)
+
+        for foe in fallen_foes:
+            self.foelist.remove(foe)
+            self.forget(foe)
+
+    def refill(self) -> None:
+        """Pull replacements from the backup lists into open slots."""
+        if len(self.playerlist) < 5:
+            if len(self.backup_players_list) > 1:
+                new_player = self.rng.choice(self.backup_players_list)
+                self.backup_players_list.remove(new_player)
+                self.playerlist.append(new_player)
+
+        if len(self.foelist) < 5:
+            if len(self.backup_foes_list) > 0:
+                new_player = self.rng.choice(self.backup_foes_list)
+                self.backup_foes_list.remove(new_player)
+                self.foelist.append(new_player)
+
+    def player_died(self, player: Player) -> None:
+        if self.persist:
+            player.save_past_life()
+        self.playerlist.remove(player)
+        self.forget(player)
+
+    def pick_player_target(self) -> Player:
+        """Pick the party member a foe swings at."""
+        max_def = 0
+        target_to_damage = self.rng.choice(self.playerlist)
+
+        for target in self.playerlist:
+            if target.Def > max_def:
+                max_def = target.Def
+            else:
+                target_to_damage = target
+
+        return target_to_damage
+
+    def attack(self, source: Player, target: Player) -> None:
+        """Resolve one hit from ``source`` on ``target``."""
+        hp_before = target.HP
+        dots_before = [(dot.name, dot.damage) for dot in target.DOTS] if self.recorder is not None else None
+
+        pre_damage_to_deal = source.deal_damage(self.bleed_mod, target.Type)
+        crit = source.last_crit
+        damage_to_deal = check_passive_mod(self.foelist, self.playerlist, source, target, pre_damage_to_deal)
+        hit = target.take_damage(self.bleed_mod, damage_to_deal)
+
+        for schedule in self.schedules():
+            schedule.touch(source)
+            schedule.touch(target)
+
+        damage_done = max(hp_before - target.HP, 0)
+        source.DamageDealt += damage_done
+        target.DamageTaken += damage_done
+
+        if self.recorder is not None:
+            self.record_attack(source, target, damage_done, crit, hit, dots_before)
+
+    def record_attack(self, source: Player, target: Player, damage_done: float, crit: bool, hit: bool, dots_before: list) -> None:
+        flags = 0
+        if crit:
+            flags |= CRIT
+        if not hit:
+            flags |= DODGED
+        if [(dot.name, dot.damage) for dot in target.DOTS] != dots_before:
+            flags |= DOT_APPLIED
+
+        source_id = self.fighter_id(source)
+        target_id = self.fighter_id(target)
+
+        if target.HP < 1:
+            flags |= KILL
+
+        self.recorder.action(self.ticks, source_id, target_id, damage_done, target.HP, flags)
+
+        if target.HP < 1:
+            self.recorder.fighter(self.ticks, target_id, target)
+            self.recorder.fighter(self.ticks, source_id, source)
+
+    def foe_action(self, foe: Player) -> None:
+        if self.on_action is not None:
+            self.on_action()
+
+        if self.bleed_mod > 1.5:
+            foe.RushStat = 0
+            foe.gain_damage_over_time(self.enrage_dot(), 1.1 * self.bleed_mod)
+
+        if foe.HP > 1:
+            foe.do_pre_turn()
+
+            if len(self.playerlist) > 0:
+                target_to_damage = self.pick_player_target()
+
+                if self.attacks is not None:
+                    if target_to_damage.HP > 0:
+                        self.attacks.append(Attack(foe, target_to_damage))
+                    return
+
+                if target_to_damage.HP > 0:
+                    self.attack(foe, target_to_damage)
+
+                if target_to_damage.HP < 1:
+                    self.player_died(target_to_damage)
+                    if self.on_kill is not None:
+                        self.on_kill(target_to_damage, foe)
+
+    def player_action(self, person: Player) -> None:
+        if self.on_action is not None:
+            self.on_action()
+
+        if self.bleed_mod > 1.5:
+            person.gain_damage_over_time(self.enrage_dot(), 1.1 * self.bleed_mod)
+
+        if self.bleed_mod > 1.2:
+            person.RushStat = 0
+
+        if person.HP > 0:
+            person.do_pre_turn()
+
+            if len(self.foelist) > 0:
+                target_to_damage = self.rng.choice(self.foelist)
+
+                if self.attacks is not None:
+                    if target_to_damage.HP > 0:
+                        self.attacks.append(Attack(person, target_to_damage))
+                    return
+
+                if target_to_damage.HP > 0:
+                    self.attack(person, target_to_damage)
+
+                if target_to_damage.HP < 1:
+                    self.foelist.remove(target_to_damage)
+                    self.forget(target_to_damage)
+                    if self.on_kill is not None:
+                        self.on_kill(target_to_damage, person)
+                    self.award_kill(person, target_to_damage)
+
+                elif target_to_damage.HP > target_to_damage.MHP:
+                    target_to_damage.HP = target_to_damage.MHP
+
+    def award_kill(self, person: Player, dead: Player) -> None:
+        """Hand out EXP to the party and backups for ``person``'s kill."""
+        person.Kills += 1
+        total_rushmod = 0
+
+        if self.bleed_mod < 100:
+            person.RushStat += 1
+
+        for player in self.playerlist:
+            total_rushmod += max(1, player.RushStat)
+
+        for player in self.playerlist:
+            if person.PlayerName == player.PlayerName:
+                player.gain_exp(mod=self.bleed_mod * total_rushmod, foe_level=dead.level)
+            else:
+                player.gain_exp(mod=self.bleed_mod * total_rushmod, foe_level=max(5, round(dead.level * 1.25)))
+        for player in self.backup_players_list:
+            player.gain_exp(mod=(self.bleed_mod * total_rushmod) * 0.25, foe_level=max(1, round(dead.level * 0.25)))
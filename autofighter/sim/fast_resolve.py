@@ -0,0 +1,219 @@
+"""Analytic fast-resolve for lopsided waves.
+
+:func:`estimate` turns both sides' stats into an expected damage rate from
+the same formulas combat uses (:meth:`player.Player.deal_damage`,
+:meth:`player.Player.damage_mitigation`, dodge and crit odds, action point
+gain) and from that the ticks each side needs to wipe out the other,
+regain included.
+
+Most damage in this game comes from passives and DOTs, which that model
+cannot see, so a battle first plays a short :class:`Probe` of
+:data:`PROBE_TICKS` real ticks. The HP each side actually lost during the
+probe gives an observed rate, and each side is credited with the larger of
+its observed and analytic rate. The estimate is only trusted when one side
+is far ahead:
+
+    confidence = 1 - faster / slower
+
+:func:`resolve` then skips the wave to its expected end: the losing side
+falls, kills and EXP are handed out through :meth:`Battle.award_kill` as if
+the fight had been played, and a winning party takes its expected damage.
+"""
+
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from autofighter.sim.resolution import dealt_factor, taken_factor
+
+if TYPE_CHECKING:
+    from player import Player
+    from autofighter.sim.battle import Battle
+
+
+PROBE_TICKS = 50
+
+
+@dataclass(frozen=True)
+class Probe:
+    """Every fighter's HP when the probe started, by ``id``."""
+
+    ticks: int
+    hp: dict[int, float]
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Expected rest of a wave from its current state."""
+
+    party_ticks: float
+    foe_ticks: float
+    party_rate: float
+    foe_rate: float
+
+    @property
+    def winner(self) -> str:
+        """``"won"`` if the party is expected to finish first, else ``"lost"``."""
+        return "won" if self.party_ticks <= self.foe_ticks else "lost"
+
+    @property
+    def ticks(self) -> float:
+        return min(self.party_ticks, self.foe_ticks)
+
+    @property
+    def confidence(self) -> float:
+        slower = max(self.party_ticks, self.foe_ticks)
+        if slower == math.inf:
+            return 1.0 if self.ticks < math.inf else 0.0
+        return 1 - self.ticks / slower
+
+
+def expected_hit(source: Player, target: Player, damage_mod: float = 1) -> float:
+    """Expected HP ``source`` removes from ``target`` with one action."""
+    damage = (source.Atk * source.Vitality) * 0.05 * dealt_factor(source)
+    damage = source.Type.damage_mod(damage, target.Type)
+
+    crit_odds = min(max(source.CritRate, 0), 1)
+    damage *= (1 - crit_odds) + crit_odds * source.CritDamageMod * max(1, source.CritRate)
+    damage *= damage_mod
+
+    hit_odds = 1 - min(max(target.DodgeOdds / damage_mod, 0), 1)
+    return hit_odds * target.damage_mitigation(damage) * taken_factor(target)
+
+
+def actions_per_tick(fighter: Player, damage_mod: float = 1) -> float:
+    return fighter.action_point_gain(damage_mod) / max(fighter.ActionPointsPerTurn, 1) * len(fighter.ActionsPerTurn)
+
+
+def regain_per_tick(fighter: Player) -> float:
+    return min(fighter.MHP, (max(fighter.Regain, 0) * fighter.Vitality) ** 1.25)
+
+
+def defender_rate(attackers: list[Player], defender: Player, field_size: int, damage_mod: float = 1) -> float:
+    """Expected HP per tick ``attackers`` strip from ``defender``, net of regain."""
+    damage = sum(actions_per_tick(attacker, damage_mod) * expected_hit(attacker, defender, damage_mod) for attacker in attackers)
+    return damage / max(field_size, 1) - regain_per_tick(defender)
+
+
+def side_ticks(rates: list[float], defenders: list[Player], field_size: int) -> float:
+    """Ticks needed to fell ``defenders`` at ``rates``."""
+    if not defenders:
+        return 0.0
+
+    times = [max(defender.HP, 0) / rate if rate > 0 else math.inf for defender, rate in zip(defenders, rates)]
+    return max(max(times), sum(times) / max(field_size, 1))
+
+
+def start_probe(battle: Battle) -> Probe:
+    fighters = battle.playerlist + battle.foelist
+    return Probe(battle.ticks, {id(fighter): fighter.HP for fighter in fighters})
+
+
+def estimate(battle: Battle, probe: Probe | None = None) -> Estimate:
+    """Estimate how long each side of ``battle`` needs to defeat the other.
+
+    With a ``probe`` taken earlier in the same battle, the HP each fighter
+    lost since then sets a floor under its analytic rate.
+    """
+    mod = max(battle.bleed_mod, 1)
+    elapsed = battle.ticks - probe.ticks if probe is not None else 0
+
+    def rates(attackers: list[Player], field: list[Player], backups: list[Player]) -> list[float]:
+        result = []
+        for defender in field + backups:
+            rate = defender_rate(attackers, defender, len(field), mod)
+            if elapsed > 0 and defender in field and id(defender) in probe.hp:
+                rate = max(rate, (probe.hp[id(defender)] - defender.HP) / elapsed)
+            result.append(rate)
+        return result
+
+    foes = battle.foelist + battle.backup_foes_list
+    party = battle.playerlist + battle.backup_players_list
+    party_rates = rates(battle.playerlist, battle.foelist, battle.backup_foes_list)
+    foe_rates = rates(battle.foelist, battle.playerlist, battle.backup_players_list)
+
+    return Estimate(
+        party_ticks=side_ticks(party_rates, foes, len(battle.foelist)),
+        foe_ticks=side_ticks(foe_rates, party, len(battle.playerlist)),
+        party_rate=sum(max(rate, 0) for rate in party_rates[: len(battle.foelist)]),
+        foe_rate=sum(max(rate, 0) for rate in foe_rates[: len(battle.playerlist)]),
+    )
+
+
+def worth_skipping(battle: Battle, result: Estimate, threshold: float) -> bool:
+    """Whether ``result`` is decisive enough to skip ``battle`` to its end.
+
+    Waves that would run into the enrage timer are always simulated, since
+    enrage changes both sides' damage.
+    """
+    return result.confidence >= threshold and result.ticks <= battle.enrage_timer.timeout_ticks
+
+
+def resolve(battle: Battle, result: Estimate) -> str:
+    """Skip ``battle`` to the outcome ``result`` predicts and finish it."""
+    ticks = max(math.ceil(result.ticks), 1)
+    battle.ticks += ticks
+    battle.enrage_timer.current_tick += ticks
+    battle.enrage_timer.total_ticks += ticks
+
+    if result.winner == "won":
+        _party_wins(battle, result, ticks)
+    else:
+        _foes_win(battle, result)
+
+    battle.finish(result.winner)
+    return result.winner
+
+
+def _spread(damage: float, fighters: list[Player]) -> None:
+    share = damage / len(fighters)
+    for fighter in fighters:
+        taken = min(round(share), max(fighter.HP - 1, 0))
+        fighter.HP -= taken
+        fighter.DamageTaken += taken
+
+
+def _party_wins(battle: Battle, result: Estimate, ticks: int) -> None:
+    party = list(battle.playerlist)
+    weights = [actions_per_tick(player, battle.bleed_mod) for player in party]
+    if not any(weights):
+        weights = [1] * len(party)
+
+    _spread(result.foe_rate * ticks, party)
+
+    while battle.foelist or battle.backup_foes_list:
+        foe = (battle.foelist or battle.backup_foes_list)[0]
+        (battle.foelist if foe in battle.foelist else battle.backup_foes_list).remove(foe)
+        battle.forget(foe)
+
+        killer = battle.rng.choices(party, weights)[0]
+        killer.DamageDealt += max(foe.HP, 0)
+        foe.DamageTaken += max(foe.HP, 0)
+        foe.HP = 0
+
+        if battle.on_kill is not None:
+            battle.on_kill(foe, killer)
+        battle.award_kill(killer, foe)
+
+
+def _foes_win(battle: Battle, result: Estimate) -> None:
+    foes = list(battle.foelist)
+
+    # Backups keep joining until one is left, exactly like Battle.refill.
+    while len(battle.backup_players_list) > 1:
+        player = battle.rng.choice(battle.backup_players_list)
+        battle.backup_players_list.remove(player)
+        battle.playerlist.append(player)
+
+    for player in list(battle.playerlist):
+        killer = battle.rng.choice(foes)
+        killer.DamageDealt += max(player.HP, 0)
+        player.DamageTaken += max(player.HP, 0)
+        player.HP = 0
+
+        battle.player_died(player)
+        if battle.on_kill is not None:
+            battle.on_kill(player, killer)
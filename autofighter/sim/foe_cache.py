@@ -0,0 +1,283 @@
+"""Foe templates reused across waves.
+
+Every wave builds about 16 foes from scratch: ``set_level``, then the lady,
+name and adjective modifiers of :func:`foe_passive_builder.build_foe_stats`.
+The same characters and adjectives come back wave after wave at almost the
+same levels. :class:`FoeCache` builds one template per ``(character,
+adjectives, level bucket)`` and clones it.
+
+Level buckets are geometric (:func:`level_bucket`): every bucket spans
+:data:`LEVEL_BUCKET_RATIO` of its level, so a level 2000 foe shares its
+template with about 40 neighbours and a level 10000 foe with about 200. A template is built at the middle of its bucket from a seed
+derived from its key, so a foe comes out the same whether its template was
+cached, evicted or built fresh.
+
+A template is a foe built in full, with how its passives move each of the
+stats ``set_level`` rolls (see :class:`FoeTemplate`). A clone copies the
+template and replays, from its own ``seed`` and at its own level, the draws
+a new foe starts with (see :class:`Rolls`): its action points, damage type,
+the HP, Def, Atk, Regain and crit rate gains of ``set_level`` and its items.
+The template's post-passive stats are then moved by how far those draws
+take ``set_level`` from the template's. Item upgrades come from the
+template, and stats ``set_level`` derives from the level alone, such as
+Vitality, are the bucket middle's, within about 1%.
+
+Foes at or below :data:`ITEM_LEVEL` are cheap to build and are built in
+full. So are Carly, whose passive trades stats by its own dice, and Mimics,
+who copy the Player.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+import random
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from damagetypes import DamageType, get_damage_type
+from foe_passive_builder import build_foe_stats
+from items import ItemType
+from player import Player, roll_level_gains, starting_max_blessing
+
+from autofighter.traits import resolve_traits
+from autofighter.sim.wave import FoeSpec, build_foe, recycle
+
+
+FOE_CACHE_SIZE = 2048
+LEVEL_BUCKET_RATIO = 1.02
+
+# ``Player.set_level`` fills every item slot above this level, right after
+# rolling its gains.
+ITEM_LEVEL = 1000
+ITEM_SLOTS = starting_max_blessing + 1
+
+# Stats ``set_level`` rolls per foe, and the stats the passives derive from them.
+ROLLED_STATS = ("MHP", "Atk", "Def", "Regain", "CritRate")
+PASSIVE_STATS = ROLLED_STATS + ("DodgeOdds",)
+WHOLE_STATS = frozenset({"MHP", "Atk", "Def"})
+
+# Passives that roll their own dice (Carly) or copy someone else (Mimic).
+UNCACHED = frozenset({"carly", "mimic"})
+
+
+def level_bucket(level: int, ratio: float = LEVEL_BUCKET_RATIO) -> int:
+    """Index of the geometric bucket ``level`` falls in."""
+    return math.floor(math.log(max(level, 1)) / math.log(ratio))
+
+
+def bucket_level(bucket: int, ratio: float = LEVEL_BUCKET_RATIO) -> int:
+    """Level a template for ``bucket`` is built at: the bucket's middle."""
+    return max(round(ratio ** (bucket + 0.5)), 1)
+
+
+@dataclass
+class Rolls:
+    """The first draws of a foe built from ``name``, ``level`` and ``seed``.
+
+    They come in the order ``Player.__init__`` and ``Player.set_level`` make
+    them from ``rng``, so for ``random.Random(seed)`` they are the draws
+    :func:`autofighter.sim.wave.build_foe` makes for a spec with that
+    ``seed``. ``items`` are the items before their upgrades.
+    """
+
+    action_points: int
+    damage_type: DamageType
+    gains: tuple[int, int, int, float, float]
+    items: list[ItemType]
+
+    @classmethod
+    def replay(cls, name: str, level: int, rng: random.Random) -> Rolls:
+        action_points = rng.randint(150, 655)
+        damage_type = get_damage_type(name, rng)
+        gains = roll_level_gains(level, rng)
+        items = [ItemType(rng) for _ in range(ITEM_SLOTS)] if level > ITEM_LEVEL else []
+        return cls(action_points, damage_type, gains, items)
+
+
+def _base_stats(foe: Player, level: int, rolls: Rolls, start: tuple[int, int, int]) -> tuple[int, int, int]:
+    """MHP, Atk and Def ``set_level`` gives ``foe`` for ``rolls`` from ``start``."""
+    hp_up, def_up, atk_up, _, _ = rolls.gains
+    return foe.level_base_stats(level, hp_up, def_up, atk_up, start, 1 + (level * 0.00002))
+
+
+def _copy_foe(source: Player, foe: Player | None = None, items: list[ItemType] | None = None) -> Player:
+    """``source``'s stats on ``foe`` (a new ``Player`` by default), sharing no lists.
+
+    The copy gets ``items``, or copies of ``source``'s items without them.
+    """
+    foe = Player.__new__(Player) if foe is None else recycle(foe)
+
+    foe.__dict__.update(source.__dict__)
+    for name, value in source.__dict__.items():
+        if isinstance(value, list):
+            setattr(foe, name, list(value))
+
+    if items is None:
+        items = [copy.copy(item) for item in source.Items]
+        for item in items:
+            item.type = list(item.type)
+    foe.Items = items
+
+    return foe
+
+
+def _passives(rolled: Player) -> Player:
+    foe = _copy_foe(rolled)
+    build_foe_stats(foe)
+    return foe
+
+
+@dataclass
+class FoeTemplate:
+    """A foe built in full at ``level``, and how its passives respond.
+
+    ``foe`` is the built foe and ``rolls`` its draws. ``rolled`` holds its
+    ``ROLLED_STATS`` after ``set_level``, ``base`` the MHP, Atk and Def
+    :func:`_base_stats` gives for ``rolls``, and ``slopes[i][j]`` how much
+    ``ROLLED_STATS[i]`` moves ``PASSIVE_STATS[j]`` through the passives.
+    ``upgrades`` and ``boosts`` are what ``set_level`` and then the passives
+    added to each item's power, and ``renames`` the ``(name, type)`` the
+    passives gave an item, if any.
+    """
+
+    foe: Player
+    rolls: Rolls
+    start: tuple[int, int, int]
+    rolled: tuple[float, ...]
+    base: tuple[int, int, int]
+    slopes: list[list[float]]
+    upgrades: list[float]
+    boosts: list[float]
+    renames: list[tuple[str, list[str]] | None]
+
+    @classmethod
+    def build(cls, spec: FoeSpec) -> FoeTemplate:
+        rolled = Player(spec.name, random.Random(spec.seed))
+        start = (rolled.MHP, rolled.Atk, rolled.Def)
+        rolled.set_level(spec.level)
+
+        rolls = Rolls.replay(spec.name, spec.level, random.Random(spec.seed))
+        base = _base_stats(rolled, spec.level, rolls, start)
+        foe = _passives(rolled)
+
+        slopes = []
+        for stat in ROLLED_STATS:
+            value = getattr(rolled, stat)
+            step = max(abs(value) * 0.01, 1 if stat in WHOLE_STATS else 1e-6)
+            nudged = _copy_foe(rolled)
+            setattr(nudged, stat, value + step)
+            nudged = _passives(nudged)
+            slopes.append([(getattr(nudged, out) - getattr(foe, out)) / step for out in PASSIVE_STATS])
+
+        return cls(
+            foe,
+            rolls,
+            start,
+            tuple(getattr(rolled, stat) for stat in ROLLED_STATS),
+            base,
+            slopes,
+            [upgraded.power - item.power for item, upgraded in zip(rolls.items, rolled.Items)],
+            [built.power - upgraded.power for upgraded, built in zip(rolled.Items, foe.Items)],
+            [
+                (built.name, built.type) if built.name != upgraded.name else None
+                for upgraded, built in zip(rolled.Items, foe.Items)
+            ],
+        )
+
+    def clone(self, spec: FoeSpec, foe: Player | None = None) -> Player:
+        """A foe for ``spec`` from this template and ``spec``'s own rolls."""
+        rng = random.Random(spec.seed)
+        rolls = Rolls.replay(spec.name, spec.level, rng)
+        foe = _copy_foe(self.foe, foe, rolls.items)
+
+        # The rolled items with the template's upgrades give the base stats;
+        # what the passives did to the items comes after.
+        for item, upgrade in zip(foe.Items, self.upgrades):
+            item.power += upgrade
+        base = _base_stats(foe, spec.level, rolls, self.start)
+
+        for item, boost, rename in zip(foe.Items, self.boosts, self.renames):
+            item.power += boost
+            if rename is not None:
+                item.name, item.type = rename[0], list(rename[1])
+
+        mhp, atk, defense, regain, crit_rate = self.rolled
+        shifts = (
+            mhp * (base[0] / self.base[0] - 1),
+            atk * (base[1] / self.base[1] - 1),
+            defense * (base[2] / self.base[2] - 1),
+            regain * (rolls.gains[3] / self.rolls.gains[3] - 1),
+            rolls.gains[4] - self.rolls.gains[4],
+        )
+        stats = [getattr(self.foe, stat) for stat in PASSIVE_STATS]
+        for shift, slope in zip(shifts, self.slopes):
+            for index, change in enumerate(slope):
+                stats[index] += shift * change
+        for stat, value in zip(PASSIVE_STATS, stats):
+            setattr(foe, stat, int(value) if stat in WHOLE_STATS else value)
+
+        foe.HP = foe.MHP
+        foe.level = spec.level
+        foe.ActionPointsPerTurn = rolls.action_points
+        foe.Type = rolls.damage_type
+        foe.rng = rng
+
+        return foe
+
+
+class FoeCache:
+    """LRU cache of foe templates.
+
+    Args:
+        maxsize: Templates to keep; the least recently used one is dropped
+            beyond that.
+        ratio: Width of a level bucket, as the ratio of its top to its
+            bottom.
+    """
+
+    def __init__(self, maxsize: int = FOE_CACHE_SIZE, ratio: float = LEVEL_BUCKET_RATIO) -> None:
+        self.maxsize = maxsize
+        self.ratio = ratio
+        self.templates: OrderedDict[tuple[str, tuple[str, ...], int], FoeTemplate] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def key(self, spec: FoeSpec) -> tuple[str, tuple[str, ...], int]:
+        return spec.themed_name, resolve_traits(spec.name).adjectives, level_bucket(spec.level, self.ratio)
+
+    def template(self, spec: FoeSpec) -> FoeTemplate:
+        """The template for ``spec``'s key, built if it is not cached."""
+        key = self.key(spec)
+        template = self.templates.get(key)
+
+        if template is not None:
+            self.hits += 1
+            self.templates.move_to_end(key)
+            return template
+
+        self.misses += 1
+        character, adjectives, bucket = key
+        seed = random.Random(f"{character}|{','.join(adjectives)}|{bucket}").getrandbits(64)
+        template = FoeTemplate.build(FoeSpec(spec.name, character, bucket_level(bucket, self.ratio), seed, 0))
+
+        self.templates[key] = template
+        while len(self.templates) > self.maxsize:
+            self.templates.popitem(last=False)
+
+        return template
+
+    def build(self, spec: FoeSpec, foe: Player | None = None) -> Player:
+        """A foe for ``spec`` cloned from its template.
+
+        ``foe`` is a fallen foe to build into instead of a new ``Player``,
+        as in :func:`autofighter.sim.wave.build_foe`.
+        """
+        if spec.level <= ITEM_LEVEL or spec.themed_name in UNCACHED:
+            return build_foe(spec, foe=foe)
+
+        return self.template(spec).clone(spec, foe)
@@ -0,0 +1,76 @@
+"""Frame pacing for rendered battles.
+
+The simulation advances in fixed ticks that are independent of the display.
+A :class:`FramePacer` decides how many ticks run between two rendered frames
+and applies the frame limiter exactly once per frame, so a fighter with three
+actions no longer costs three frames.
+"""
+
+from __future__ import annotations
+
+import time
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from autofighter.sim.battle import Battle
+
+
+@dataclass
+class FramePacer:
+    """Fixed-timestep scheduler that drives a :class:`Battle` from the render loop.
+
+    Attributes:
+        fps_cap: Rendered frames per second.
+        turbo: Simulation ticks advanced per rendered frame. The default of
+            one keeps the game's usual battle speed; ``config.json`` opts
+            into more.
+        uncapped: Ignore ``turbo`` and simulate as many ticks as fit into one
+            frame's time budget, rendering at ``fps_cap``.
+    """
+
+    fps_cap: int = 65
+    turbo: int = 1
+    uncapped: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict) -> "FramePacer":
+        return cls(
+            fps_cap=max(int(config.get("fps_cap", cls.fps_cap)), 1),
+            turbo=max(int(config.get("turbo", cls.turbo)), 1),
+            uncapped=bool(config.get("uncapped", cls.uncapped)),
+        )
+
+    def frame_budget(self) -> float:
+        """Seconds available to one rendered frame."""
+        return 1 / self.fps_cap
+
+    def advance(self, battle: Battle) -> int:
+        """Run the ticks belonging to one rendered frame.
+
+        Returns:
+            Number of ticks simulated.
+        """
+        ticks = 0
+
+        if self.uncapped:
+            deadline = time.perf_counter() + self.frame_budget()
+            while True:
+                running = battle.step()
+                ticks += 1
+                if not running or time.perf_counter() >= deadline:
+                    break
+            return ticks
+
+        for _ in range(self.turbo):
+            running = battle.step()
+            ticks += 1
+            if not running:
+                break
+
+        return ticks
+
+    def limit(self, clock) -> float:
+        """Apply the frame limiter once for the frame that was just rendered."""
+        return clock.tick(self.fps_cap) / 1000
@@ -0,0 +1,334 @@
+"""Compact binary combat replays.
+
+A :class:`ReplayWriter` attached to a :class:`autofighter.sim.battle.Battle`
+appends fixed-size, struct-packed records to a binary stream. Fighters are
+declared once with an integer id and referenced by that id afterwards::
+
+    header   b"AFR\\x01"
+    fighter  tick, id, isplayer, level, MHP, HP, Atk, Def, Regain, Vitality,
+             CritRate, CritDamageMod, DodgeOdds, name
+    action   tick, source id, target id, damage, target HP, flags
+    hp       tick, id, HP
+    outcome  tick, outcome
+
+Fighters are declared when the battle starts and again, with their stats at
+that moment, when they die or score a kill. ``hp`` samples catch damage and
+healing that happen outside actions (DOTs, HOTs, regain).
+
+:func:`read_replay`, :func:`summarize` and :class:`ReplayPlayer` work purely
+from the log, so a wave can be re-aggregated or stepped through at any speed
+without re-running combat::
+
+    python -m autofighter.sim.replay logs/last_wave.afr
+"""
+
+from __future__ import annotations
+
+import sys
+import struct
+
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator, NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+MAGIC = b"AFR\x01"
+
+KIND_FIGHTER = 1
+KIND_ACTION = 2
+KIND_HP = 3
+KIND_OUTCOME = 4
+
+CRIT = 1
+DODGED = 2
+KILL = 4
+DOT_APPLIED = 8
+
+OUTCOMES = {None: 0, "won": 1, "lost": 2}
+OUTCOME_NAMES = {code: name for name, code in OUTCOMES.items()}
+
+_KIND = struct.Struct("<B")
+_FIGHTER = struct.Struct("<IHBIdddddddddH")
+_ACTION = struct.Struct("<IHHddB")
+_HP = struct.Struct("<IHd")
+_OUTCOME = struct.Struct("<IB")
+
+
+class FighterRecord(NamedTuple):
+    tick: int
+    fighter: int
+    isplayer: bool
+    level: int
+    MHP: float
+    HP: float
+    Atk: float
+    Def: float
+    Regain: float
+    Vitality: float
+    CritRate: float
+    CritDamageMod: float
+    DodgeOdds: float
+    name: str
+
+
+class ActionRecord(NamedTuple):
+    tick: int
+    source: int
+    target: int
+    damage: float
+    target_hp: float
+    flags: int
+
+    @property
+    def crit(self) -> bool:
+        return bool(self.flags & CRIT)
+
+    @property
+    def dodged(self) -> bool:
+        return bool(self.flags & DODGED)
+
+    @property
+    def kill(self) -> bool:
+        return bool(self.flags & KILL)
+
+    @property
+    def dot_applied(self) -> bool:
+        return bool(self.flags & DOT_APPLIED)
+
+
+class HpRecord(NamedTuple):
+    tick: int
+    fighter: int
+    HP: float
+
+
+class OutcomeRecord(NamedTuple):
+    tick: int
+    outcome: str | None
+
+
+Record = FighterRecord | ActionRecord | HpRecord | OutcomeRecord
+
+
+class ReplayWriter:
+    """Append replay records to a binary stream.
+
+    Args:
+        stream: Writable binary file object.
+        hp_interval: Ticks between ``hp`` samples. Only fighters whose HP
+            changed since their last sample are written.
+    """
+
+    def __init__(self, stream: BinaryIO, hp_interval: int = 10) -> None:
+        self.stream = stream
+        self.hp_interval = max(1, hp_interval)
+        self._last_hp: dict[int, float] = {}
+        self.stream.write(MAGIC)
+
+    @classmethod
+    def open(cls, path: str, hp_interval: int = 10) -> ReplayWriter:
+        return cls(open(path, "wb"), hp_interval)
+
+    def fighter(self, tick: int, fighter_id: int, player: Player) -> None:
+        name = player.PlayerName.encode("utf-8")[:0xFFFF]
+        self.stream.write(_KIND.pack(KIND_FIGHTER))
+        self.stream.write(_FIGHTER.pack(
+            tick, fighter_id, player.isplayer, min(max(int(player.level), 0), 0xFFFFFFFF),
+            player.MHP, player.HP, player.Atk, player.Def, player.Regain, player.Vitality,
+            player.CritRate, player.CritDamageMod, player.DodgeOdds, len(name),
+        ))
+        self.stream.write(name)
+        self._last_hp[fighter_id] = player.HP
+
+    def action(self, tick: int, source_id: int, target_id: int, damage: float, target_hp: float, flags: int) -> None:
+        self.stream.write(_KIND.pack(KIND_ACTION))
+        self.stream.write(_ACTION.pack(tick, source_id, target_id, damage, target_hp, flags))
+        self._last_hp[target_id] = target_hp
+
+    def sample(self, tick: int, fighters: dict[int, Player]) -> None:
+        """Write ``hp`` records for fighters whose HP changed, every ``hp_interval`` ticks."""
+        if tick % self.hp_interval:
+            return
+
+        for fighter_id, player in fighters.items():
+            if self._last_hp.get(fighter_id) != player.HP:
+                self.stream.write(_KIND.pack(KIND_HP))
+                self.stream.write(_HP.pack(tick, fighter_id, player.HP))
+                self._last_hp[fighter_id] = player.HP
+
+    def finish(self, tick: int, outcome: str | None) -> None:
+        self.stream.write(_KIND.pack(KIND_OUTCOME))
+        self.stream.write(_OUTCOME.pack(tick, OUTCOMES.get(outcome, 0)))
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated replay record")
+    return data
+
+
+def read_replay(stream: BinaryIO) -> Iterator[Record]:
+    """Yield every record of a replay stream in order."""
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not an AutoFighter replay")
+
+    while True:
+        kind_byte = stream.read(1)
+        if not kind_byte:
+            return
+
+        kind = kind_byte[0]
+
+        if kind == KIND_ACTION:
+            yield ActionRecord(*_ACTION.unpack(_read_exact(stream, _ACTION.size)))
+        elif kind == KIND_HP:
+            yield HpRecord(*_HP.unpack(_read_exact(stream, _HP.size)))
+        elif kind == KIND_FIGHTER:
+            *values, name_length = _FIGHTER.unpack(_read_exact(stream, _FIGHTER.size))
+            values[2] = bool(values[2])
+            name = _read_exact(stream, name_length).decode("utf-8")
+            yield FighterRecord(*values, name)
+        elif kind == KIND_OUTCOME:
+            tick, code = _OUTCOME.unpack(_read_exact(stream, _OUTCOME.size))
+            yield OutcomeRecord(tick, OUTCOME_NAMES.get(code))
+        else:
+            raise ValueError(f"Unknown replay record kind {kind}")
+
+
+def load_replay(path: str) -> list[Record]:
+    with open(path, "rb") as f:
+        return list(read_replay(f))
+
+
+@dataclass
+class FighterSummary:
+    name: str
+    isplayer: bool
+    level: int = 0
+    damage_dealt: float = 0
+    damage_taken: float = 0
+    actions: int = 0
+    crits: int = 0
+    dodges: int = 0
+    kills: int = 0
+    dots_applied: int = 0
+    died_at: int | None = None
+
+
+@dataclass
+class ReplaySummary:
+    outcome: str | None = None
+    ticks: int = 0
+    fighters: dict[int, FighterSummary] = field(default_factory=dict)
+
+
+def summarize(records: list[Record]) -> ReplaySummary:
+    """Re-aggregate a wave from its replay."""
+    summary = ReplaySummary()
+
+    for record in records:
+        if isinstance(record, ActionRecord):
+            source = summary.fighters[record.source]
+            target = summary.fighters[record.target]
+            source.actions += 1
+            source.damage_dealt += record.damage
+            target.damage_taken += record.damage
+            source.crits += record.crit
+            target.dodges += record.dodged
+            source.dots_applied += record.dot_applied
+
+            if record.kill:
+                source.kills += 1
+                target.died_at = record.tick
+
+            summary.ticks = max(summary.ticks, record.tick)
+        elif isinstance(record, FighterRecord):
+            fighter = summary.fighters.setdefault(record.fighter, FighterSummary(record.name, record.isplayer))
+            fighter.level = record.level
+        elif isinstance(record, OutcomeRecord):
+            summary.outcome = record.outcome
+            summary.ticks = record.tick
+
+    return summary
+
+
+@dataclass
+class FighterState:
+    name: str
+    isplayer: bool
+    MHP: float
+    HP: float
+
+
+class ReplayPlayer:
+    """Step through a replay and expose fighter HP at any tick.
+
+    ``advance(ticks)`` moves forward by any number of ticks at once, so a
+    renderer can play a wave back at whatever speed it likes.
+    """
+
+    def __init__(self, records: list[Record]) -> None:
+        self.records = records
+        self.tick = 0
+        self.fighters: dict[int, FighterState] = {}
+        self.events: list[ActionRecord] = []
+        self._index = 0
+
+    @property
+    def finished(self) -> bool:
+        return self._index >= len(self.records)
+
+    def advance(self, ticks: int = 1) -> list[ActionRecord]:
+        """Apply every record up to ``tick + ticks``; return the actions applied."""
+        self.tick += ticks
+        self.events = []
+
+        while self._index < len(self.records):
+            record = self.records[self._index]
+            if record.tick > self.tick:
+                break
+
+            if isinstance(record, FighterRecord):
+                self.fighters[record.fighter] = FighterState(record.name, record.isplayer, record.MHP, record.HP)
+            elif isinstance(record, ActionRecord):
+                self.fighters[record.target].HP = record.target_hp
+                self.events.append(record)
+            elif isinstance(record, HpRecord):
+                self.fighters[record.fighter].HP = record.HP
+
+            self._index += 1
+
+        return self.events
+
+    def frames(self, speed: int = 1) -> Iterator[tuple[int, dict[int, FighterState]]]:
+        """Yield ``(tick, fighters)`` every ``speed`` ticks until the log ends."""
+        while not self.finished:
+            self.advance(speed)
+            yield self.tick, self.fighters
+
+
+def main(argv: list[str] | None = None) -> ReplaySummary:
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else "logs/last_wave.afr"
+
+    summary = summarize(load_replay(path))
+
+    print(f"{path}: {summary.outcome or 'unfinished'} after {summary.ticks} ticks")
+    for fighter in summary.fighters.values():
+        side = "ally" if fighter.isplayer else "foe"
+        died = f", died at tick {fighter.died_at}" if fighter.died_at is not None else ""
+        print(f"  [{side}] {fighter.name} (lv {fighter.level}): dealt {fighter.damage_dealt:.0f}, taken {fighter.damage_taken:.0f}, "
+              f"{fighter.actions} actions, {fighter.crits} crits, {fighter.dodges} dodges, {fighter.kills} kills{died}")
+
+    return summary
+
+
+if __name__ == "__main__":
+    main()
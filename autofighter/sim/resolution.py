@@ -0,0 +1,221 @@
+"""Batched damage resolution.
+
+With ``Battle(..., batched=True)`` fighters only *declare* attacks during
+their turns. :func:`resolve` then settles every attack declared in the tick
+in four phases, always in declaration order (foes first, then the party, each
+in roster order):
+
+1. **Rolls** – base damage, item multipliers, type modifiers, crit and
+   variance for every attack at once. Rolls are drawn from each source's
+   random stream in the same order :meth:`player.Player.deal_damage` uses.
+2. **Passives** – :func:`damagestate.check_passive_mod` for each attack. This
+   stays per attack since passives change stats and apply DOTs/HOTs.
+3. **Mitigation** – dodge rolls, then mitigation and defense items for every
+   attack at once, using the stats the passives left behind.
+4. **Apply** – HP loss in declaration order. Damage aimed at a fighter that
+   already fell this tick is lost. Kills, death saves and EXP are handled
+   once, after all HP has been applied.
+
+Every declared attack swings, so a fighter killed earlier in the same tick
+still lands the attack it declared. The arithmetic of phases 1 and 3 runs on
+NumPy arrays for large batches when NumPy is installed and as plain Python
+otherwise; both give the same floats.
+"""
+
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    np = None
+
+from damagestate import check_passive_mod
+
+from autofighter.sim.replay import CRIT, DODGED, DOT_APPLIED, KILL
+
+if TYPE_CHECKING:
+    from player import Player
+    from autofighter.sim.battle import Battle
+
+
+VECTOR_MIN = 64
+
+
+@dataclass(slots=True)
+class Attack:
+    """One attack declared during a tick."""
+
+    source: Player
+    target: Player
+    damage: float = 0
+    crit: bool = False
+    hit: bool = True
+    dots_applied: bool = False
+
+
+def dealt_factor(player: Player) -> float:
+    """Combined multiplier of ``player``'s damage items (see :func:`items.on_damage_dealt`)."""
+    factor = 1.0
+    for item in player.Items:
+        if "damage" in str(item.name).lower():
+            factor *= item.power
+    return factor
+
+
+def taken_factor(player: Player) -> float:
+    """Combined multiplier of ``player``'s defense items (see :func:`items.on_damage_taken`).
+
+    Like ``on_damage_taken``, an item whose effect raises (a power of
+    exactly 1) leaves the damage unchanged.
+    """
+    factor = 1.0
+    for item in player.Items:
+        if "defense" in str(item.name).lower():
+            try:
+                factor *= 1 + 1 / math.log2(item.power)
+            except (ValueError, ZeroDivisionError):
+                pass
+    return factor
+
+
+def _multiply(*columns: list[float]) -> list[float]:
+    if np is not None and len(columns[0]) >= VECTOR_MIN:
+        product = np.asarray(columns[0], dtype=float)
+        for column in columns[1:]:
+            product = product * np.asarray(column, dtype=float)
+        return product.tolist()
+
+    product = list(columns[0])
+    for column in columns[1:]:
+        product = [value * factor for value, factor in zip(product, column)]
+    return product
+
+
+def roll_damage(attacks: list[Attack], damage_mod: float) -> None:
+    """Phase 1: outgoing damage of every attack."""
+    base = [(attack.source.Atk * attack.source.Vitality) * 0.05 for attack in attacks]
+    items = [dealt_factor(attack.source) for attack in attacks]
+    types = [attack.source.Type.damage_mod(1, attack.target.Type) for attack in attacks]
+
+    crits = []
+    variance = []
+    for attack in attacks:
+        source = attack.source
+        attack.crit = source.CritRate >= source.rng.random()
+        crits.append(source.CritDamageMod * max(1, source.CritRate) if attack.crit else 1)
+        variance.append(source.rng.uniform(0.95, 1.05) * damage_mod)
+
+    for attack, damage in zip(attacks, _multiply(base, items, types, crits, variance)):
+        attack.damage = damage
+
+
+def apply_passives(battle: Battle, attacks: list[Attack]) -> None:
+    """Phase 2: passives, one attack at a time."""
+    for attack in attacks:
+        target = attack.target
+        dots_before = [(dot.name, dot.damage) for dot in target.DOTS] if battle.recorder is not None else None
+
+        attack.damage = check_passive_mod(battle.foelist, battle.playerlist, attack.source, target, attack.damage)
+
+        if dots_before is not None:
+            attack.dots_applied = [(dot.name, dot.damage) for dot in target.DOTS] != dots_before
+
+
+def mitigate(attacks: list[Attack], damage_mod: float) -> None:
+    """Phase 3: dodge rolls, mitigation and defense items."""
+    for attack in attacks:
+        target = attack.target
+        attack.hit = not (target.DodgeOdds / damage_mod >= target.rng.random())
+
+    defense = [attack.target.mitigation_buff() * attack.target.Def for attack in attacks]
+    floors = [1 / attack.target.Def for attack in attacks]
+
+    if np is not None and len(attacks) >= VECTOR_MIN:
+        mitigated = np.maximum(np.asarray([attack.damage for attack in attacks], dtype=float) / np.asarray(defense), floors).tolist()
+    else:
+        mitigated = [max(attack.damage / divisor, floor) for attack, divisor, floor in zip(attacks, defense, floors)]
+
+    items = [taken_factor(attack.target) for attack in attacks]
+    for attack, damage in zip(attacks, _multiply(mitigated, items)):
+        attack.damage = damage if attack.hit else 0
+
+
+def resolve(battle: Battle, attacks: list[Attack]) -> None:
+    """Settle every attack declared this tick on ``battle``."""
+    if not attacks:
+        return
+
+    roll_damage(attacks, battle.bleed_mod)
+    apply_passives(battle, attacks)
+    mitigate(attacks, battle.bleed_mod)
+
+    kills: list[tuple[Player, Player]] = []
+
+    for attack in attacks:
+        source, target = attack.source, attack.target
+        if target.HP < 1:
+            continue
+
+        hp_before = target.HP
+        if attack.hit:
+            target.HP -= round(attack.damage)
+
+        for schedule in battle.schedules():
+            schedule.touch(source)
+            schedule.touch(target)
+
+        damage_done = max(hp_before - target.HP, 0)
+        source.DamageDealt += damage_done
+        target.DamageTaken += damage_done
+
+        if target.HP < 1:
+            kills.append((target, source))
+
+        if battle.recorder is not None:
+            record(battle, attack, damage_done)
+
+    for dead, killer in kills:
+        if dead.isplayer:
+            if dead in battle.playerlist:
+                battle.player_died(dead)
+            if battle.on_kill is not None:
+                battle.on_kill(dead, killer)
+        else:
+            if dead in battle.foelist:
+                battle.foelist.remove(dead)
+                battle.forget(dead)
+            if battle.on_kill is not None:
+                battle.on_kill(dead, killer)
+            battle.award_kill(killer, dead)
+
+    for foe in battle.foelist:
+        if foe.HP > foe.MHP:
+            foe.HP = foe.MHP
+
+
+def record(battle: Battle, attack: Attack, damage_done: float) -> None:
+    flags = 0
+    if attack.crit:
+        flags |= CRIT
+    if not attack.hit:
+        flags |= DODGED
+    if attack.dots_applied:
+        flags |= DOT_APPLIED
+
+    target = attack.target
+    source_id = battle.fighter_id(attack.source)
+    target_id = battle.fighter_id(target)
+
+    if target.HP < 1:
+        flags |= KILL
+
+    battle.recorder.action(battle.ticks, source_id, target_id, damage_done, target.HP, flags)
+
+    if target.HP < 1:
+        battle.recorder.fighter(battle.ticks, target_id, target)
+        battle.recorder.fighter(battle.ticks, source_id, attack.source)
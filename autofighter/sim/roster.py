@@ -0,0 +1,115 @@
+"""Process-pool roster construction.
+
+``set_level``, ``load_past_lives``, ``build_foe_stats`` and ``level_up`` are
+CPU-bound pure-Python loops, so running them on threads only serialises them
+on the GIL. :class:`RosterPool` runs them in worker processes instead.
+
+Fighters cross the process boundary as stat records: a plain ``dict`` of the
+player's attributes without pygame surfaces, active DOTs/HOTs or the random
+stream, and with the damage type reduced to its name. :func:`hydrate` turns a
+record back into a :class:`player.Player` in the main process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+
+from itertools import repeat
+from typing import Any, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+
+from player import Player
+
+from damagetypes import DamageType, Generic, all_damage_types
+
+from autofighter.sim.arrays import ArrayPlayer
+from autofighter.sim.wave import FoeSpec, build_foe, recycle
+
+
+TRANSIENT_FIELDS = ("photodata", "DOTS", "HOTS", "rng")
+
+DAMAGE_TYPES: dict[str, DamageType] = {damage_type.name: damage_type for damage_type in [Generic] + all_damage_types}
+
+
+def to_record(player: Player) -> dict[str, Any]:
+    """Return the picklable stat record of ``player``."""
+    state = player._roster.state(player) if isinstance(player, ArrayPlayer) else player.__dict__
+    record = {key: value for key, value in state.items() if key not in TRANSIENT_FIELDS}
+    record["Type"] = player.Type.name
+    return record
+
+
+def blank(player: Player) -> Player:
+    """Give an empty ``player`` the transient fields :func:`hydrate` keeps."""
+    player.photodata = ""
+    player.DOTS = []
+    player.HOTS = []
+    return player
+
+
+def hydrate(record: dict[str, Any], player: Player | None = None) -> Player:
+    """Load ``record`` into ``player`` (or a new :class:`Player`).
+
+    Photo data, DOTs, HOTs and the random stream of an existing ``player``
+    are kept. The damage type is resolved back to the shared module-level
+    instance, since damage types are compared by identity.
+    """
+    if player is None:
+        player = blank(Player.__new__(Player))
+
+    player.__dict__.update(record)
+    player.Type = DAMAGE_TYPES.get(record["Type"], Generic)
+
+    if isinstance(player, ArrayPlayer):
+        player._roster.absorb(player)
+
+    return player
+
+
+def foe_record(spec: FoeSpec, past_lives: bool = False) -> dict[str, Any]:
+    """Worker side of :meth:`RosterPool.build_foes`."""
+    return to_record(build_foe(spec, past_lives))
+
+
+def level_up_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Worker side of :meth:`RosterPool.level_up`: level up, then save."""
+    player = hydrate(record)
+    player.level_up()
+    player.save()
+    return to_record(player)
+
+
+class RosterPool:
+    """Build foes and level up allies in worker processes.
+
+    Args:
+        workers: Worker processes, defaulting to the CPU count.
+        mp_context: Multiprocessing context. ``spawn`` is the default because
+            the game forks from a process that already runs pygame and
+            background threads.
+    """
+
+    def __init__(self, workers: int | None = None, mp_context: BaseContext | None = None) -> None:
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context or multiprocessing.get_context("spawn"))
+
+    def build_foes(self, specs: list[FoeSpec], past_lives: bool = False, reuse: list[Player | None] | None = None) -> list[Player]:
+        """Build one foe per spec in parallel, in order.
+
+        Records are loaded into the matching ``reuse`` entries (fallen foes of
+        an earlier wave) where given, instead of new objects.
+        """
+        records = self._executor.map(foe_record, specs, repeat(past_lives))
+        reuse = reuse or [None] * len(specs)
+        return [hydrate(record, None if foe is None else blank(recycle(foe))) for record, foe in zip(records, reuse)]
+
+    def level_up(self, players: Iterable[Player]) -> None:
+        """Level up and save ``players`` in parallel, updating them in place."""
+        players = list(players)
+        records = self._executor.map(level_up_record, [to_record(player) for player in players])
+
+        for player, record in zip(players, records):
+            hydrate(record, player)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,165 @@
+"""Event-driven action scheduling.
+
+Polling every fighter each tick with :meth:`player.Player.tick` only adds
+``ActionPointsPerTick`` and compares the total against
+``ActionPointsPerTurn``. :class:`ActionScheduler` instead computes the tick on
+which each fighter will next reach its threshold and keeps fighters in a
+priority queue, so the cost scales with actions taken rather than with
+fighters times ticks.
+
+Action points are accumulated lazily: a fighter's ``ActionPoints`` are only
+brought up to date when it acts, when its speed changes, or on
+:meth:`ActionScheduler.sync_all`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class _Entry:
+    __slots__ = ("fighter", "synced", "gain", "speed", "version")
+
+    def __init__(self, fighter: Player, synced: int) -> None:
+        self.fighter = fighter
+        self.synced = synced
+        self.gain = 0
+        self.speed: tuple[float, float] = (0, 0)
+        self.version = 0
+
+
+class ActionScheduler:
+    """Priority queue of fighters keyed by the tick of their next action.
+
+    One scheduler serves one side of the field. ``now`` is the last tick
+    whose action points have been granted to every fighter in the queue.
+    """
+
+    def __init__(self, mod: float = 1, now: int = 0) -> None:
+        self.now = now
+        self.mod = max(mod, 1)
+        self._heap: list[tuple[int, int, int, _Entry]] = []
+        self._entries: dict[int, _Entry] = {}
+        self._counter = itertools.count()
+
+    def __contains__(self, fighter: Player) -> bool:
+        return id(fighter) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, fighter: Player) -> None:
+        """Start scheduling ``fighter`` from the next tick on."""
+        if fighter in self:
+            return
+
+        entry = _Entry(fighter, self.now)
+        self._entries[id(fighter)] = entry
+        self._rekey(entry)
+
+    def remove(self, fighter: Player) -> None:
+        """Stop scheduling ``fighter``, settling its action points first."""
+        entry = self._entries.pop(id(fighter), None)
+        if entry is not None:
+            self._sync(entry, self.now)
+            entry.version += 1
+
+    def set_mod(self, mod: float) -> None:
+        """Change the enrage multiplier used from the next tick on."""
+        mod = max(mod, 1)
+        if mod == self.mod:
+            return
+
+        self.mod = mod
+        for entry in self._entries.values():
+            if entry.fighter.action_point_gain(mod) != entry.gain:
+                self._sync(entry, self.now)
+                self._rekey(entry)
+
+    def touch(self, fighter: Player) -> None:
+        """Re-key ``fighter`` if its action point rate changed."""
+        entry = self._entries.get(id(fighter))
+        if entry is None:
+            return
+
+        if (fighter.ActionPointsPerTick, fighter.ActionPointsPerTurn) != entry.speed:
+            self._sync(entry, self.now)
+            self._rekey(entry)
+
+    def pop_due(self, tick: int) -> list[Player]:
+        """Advance to ``tick`` and return the fighters that act on it.
+
+        Each returned fighter has already paid ``ActionPointsPerTurn`` for
+        the turn, mirroring a ``True`` result from ``Player.tick``.
+        """
+        self.now = tick
+        actors: list[Player] = []
+
+        while self._heap and self._heap[0][0] <= tick:
+            _, _, version, entry = heapq.heappop(self._heap)
+            if version != entry.version:
+                continue
+
+            fighter = entry.fighter
+
+            if fighter.HP < 1:
+                # Fallen fighters gain nothing until they are cleaned up.
+                self._sync(entry, tick - 1)
+                entry.synced = tick
+                self._rekey(entry)
+                continue
+
+            self._sync(entry, tick)
+            fighter.check_action_speed()
+
+            if fighter.ActionPoints >= fighter.ActionPointsPerTurn:
+                fighter.ActionPoints -= fighter.ActionPointsPerTurn
+                actors.append(fighter)
+
+            self._rekey(entry)
+
+        return actors
+
+    def sync_all(self) -> None:
+        """Bring every fighter's ``ActionPoints`` up to ``now``."""
+        for entry in self._entries.values():
+            self._sync(entry, self.now)
+
+    def _sync(self, entry: _Entry, tick: int) -> None:
+        if tick > entry.synced:
+            entry.fighter.ActionPoints += entry.gain * (tick - entry.synced)
+            entry.synced = tick
+
+    def _rekey(self, entry: _Entry) -> None:
+        fighter = entry.fighter
+        entry.gain = fighter.action_point_gain(self.mod)
+        entry.speed = (fighter.ActionPointsPerTick, fighter.ActionPointsPerTurn)
+        entry.version += 1
+
+        if fighter.needs_speed_check():
+            wait = 1
+        elif entry.gain > 0:
+            wait = self._ticks_until_turn(fighter.ActionPoints, fighter.ActionPointsPerTurn, entry.gain)
+        else:
+            return
+
+        heapq.heappush(self._heap, (entry.synced + wait, next(self._counter), entry.version, entry))
+
+    @staticmethod
+    def _ticks_until_turn(action_points: float, per_turn: float, gain: int) -> int:
+        """Smallest ``k >= 1`` with ``action_points + gain * k >= per_turn``."""
+        wait = max(1, math.ceil((per_turn - action_points) / gain))
+
+        while wait > 1 and action_points + gain * (wait - 1) >= per_turn:
+            wait -= 1
+        while action_points + gain * wait < per_turn:
+            wait += 1
+
+        return wait
@@ -0,0 +1,229 @@
+"""Battle snapshots for branching simulations.
+
+:func:`capture` flattens a :class:`autofighter.sim.battle.Battle` into a
+:class:`BattleSnapshot`: one stat record per fighter (see
+:func:`autofighter.sim.roster.to_record`), DOT/HOT stacks, roster membership
+by fighter id, the enrage timer, battle scalars and the state of every random
+stream in play. Immutable values are shared with the live fighters and only
+the containers combat mutates (DOT/HOT stacks, item lists, action lists) are
+copied, so a snapshot costs a handful of small dicts per fighter instead of a
+``copy.deepcopy`` that drags pygame surfaces along.
+
+A snapshot holds no ``Player`` objects and pickles cleanly, so it can be sent
+to worker processes and turned into an independent battle with
+:func:`build_battle`.
+"""
+
+from __future__ import annotations
+
+import copy
+import random
+
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+from player import Player
+
+from damagetypes import Generic
+
+from autofighter.sim.roster import DAMAGE_TYPES, hydrate, to_record
+from autofighter.sim.scheduler import ActionScheduler
+
+if TYPE_CHECKING:
+    from autofighter.sim.battle import Battle
+
+
+BATTLE_FIELDS = ("level", "persist", "ticks", "enrage_mod", "bleed_mod", "def_mod", "is_deading", "outcome")
+ROSTERS = ("playerlist", "foelist", "backup_players_list", "backup_foes_list")
+
+
+@dataclass(frozen=True)
+class BattleSnapshot:
+    """Flat, picklable state of a battle at the end of a tick."""
+
+    battle: dict[str, Any]
+    timer: dict[str, Any]
+    fighters: tuple[dict[str, Any], ...]
+    rosters: dict[str, tuple[int, ...]]
+    rng_states: tuple[Any, ...]
+    battle_rng: int
+    fighter_rngs: tuple[int | None, ...]
+    event_scheduler: bool
+
+    @property
+    def ticks(self) -> int:
+        return self.battle["ticks"]
+
+
+def _effect_state(effect: Any, type_field: str) -> tuple[type, dict[str, Any]]:
+    state = {key: value for key, value in effect.__dict__.items() if key != "_photodata"}
+    state[type_field] = getattr(effect, type_field).name
+    return type(effect), state
+
+
+def _effect(cls: type, state: dict[str, Any], type_field: str) -> Any:
+    effect = cls.__new__(cls)
+    effect.__dict__.update(state)
+    effect.__dict__[type_field] = DAMAGE_TYPES.get(state[type_field], Generic)
+    if isinstance(getattr(cls, "photodata", None), property):
+        effect._photodata = None
+    return effect
+
+
+def _fighter_state(player: Player) -> dict[str, Any]:
+    record = to_record(player)
+
+    for key, value in record.items():
+        if isinstance(value, list):
+            record[key] = list(value)
+
+    record["Items"] = [copy.copy(item) for item in player.Items]
+    record["DOTS"] = [_effect_state(dot, "damage_type") for dot in player.DOTS]
+    record["HOTS"] = [_effect_state(hot, "healing_type") for hot in player.HOTS]
+    return record
+
+
+def _load_fighter(record: dict[str, Any], player: Player | None = None) -> Player:
+    record = dict(record)
+    dots = record.pop("DOTS")
+    hots = record.pop("HOTS")
+
+    for key, value in record.items():
+        if isinstance(value, list):
+            record[key] = list(value)
+
+    record["Items"] = [copy.copy(item) for item in record["Items"]]
+
+    player = hydrate(record, player)
+    player.DOTS = [_effect(cls, state, "damage_type") for cls, state in dots]
+    player.HOTS = [_effect(cls, state, "healing_type") for cls, state in hots]
+    return player
+
+
+def capture(battle: Battle) -> BattleSnapshot:
+    """Flatten ``battle`` into a :class:`BattleSnapshot`."""
+    battle.sync_action_points()
+
+    streams: list[Any] = []
+    stream_index: dict[int, int] = {}
+
+    def index_of(rng: Any) -> int:
+        if id(rng) not in stream_index:
+            stream_index[id(rng)] = len(streams)
+            streams.append(rng)
+        return stream_index[id(rng)]
+
+    for roster in ROSTERS:
+        for fighter in getattr(battle, roster):
+            battle.fighter_id(fighter)
+
+    fighter_rngs = tuple(index_of(fighter.__dict__["rng"]) if "rng" in fighter.__dict__ else None for fighter in battle.fighters)
+
+    return BattleSnapshot(
+        battle={key: getattr(battle, key) for key in BATTLE_FIELDS},
+        timer=dict(battle.enrage_timer.__dict__),
+        fighters=tuple(_fighter_state(fighter) for fighter in battle.fighters),
+        rosters={roster: tuple(battle.fighter_id(fighter) for fighter in getattr(battle, roster)) for roster in ROSTERS},
+        rng_states=tuple(rng.getstate() for rng in streams) + (random.getstate(),),
+        battle_rng=index_of(battle.rng) if battle.rng is not random else -1,
+        fighter_rngs=fighter_rngs,
+        event_scheduler=bool(battle.schedules()),
+    )
+
+
+def _reset_battle(battle: Battle, snapshot: BattleSnapshot, fighters: list[Player], streams: list[Any]) -> None:
+    for key, value in snapshot.battle.items():
+        setattr(battle, key, value)
+
+    battle.enrage_timer.__dict__.update(snapshot.timer)
+    battle._enrage_dot = None
+    battle.fast_resolve_probe = None
+
+    for roster, ids in snapshot.rosters.items():
+        getattr(battle, roster)[:] = [fighters[fighter_id] for fighter_id in ids]
+
+    for fighter, rng_index in zip(fighters, snapshot.fighter_rngs):
+        if rng_index is None:
+            fighter.__dict__.pop("rng", None)
+        else:
+            fighter.rng = streams[rng_index]
+
+    battle.rng = streams[snapshot.battle_rng] if snapshot.battle_rng >= 0 else random
+
+    battle.fighters = list(fighters)
+    battle.fighter_ids = {id(fighter): fighter_id for fighter_id, fighter in enumerate(fighters)}
+
+    if battle.arrays is not None:
+        for fighter in fighters:
+            battle.arrays.bind(fighter)
+
+    if snapshot.event_scheduler:
+        battle.foe_schedule = ActionScheduler(now=battle.ticks)
+        battle.player_schedule = ActionScheduler(now=battle.ticks)
+    else:
+        battle.foe_schedule = battle.player_schedule = None
+
+
+def restore(battle: Battle, snapshot: BattleSnapshot) -> None:
+    """Rewind ``battle`` (the one ``snapshot`` was taken from) in place.
+
+    Fighters, their random streams and the global :mod:`random` state are
+    put back exactly, so the battle replays the same ticks again.
+    """
+    fighters = [_load_fighter(record, player) for record, player in zip(snapshot.fighters, battle.fighters)]
+
+    streams = _live_streams(battle, snapshot)
+    for rng, state in zip(streams, snapshot.rng_states):
+        rng.setstate(state)
+    random.setstate(snapshot.rng_states[-1])
+
+    _reset_battle(battle, snapshot, fighters, streams)
+
+
+def _live_streams(battle: Battle, snapshot: BattleSnapshot) -> list[Any]:
+    streams: list[Any] = [None] * (len(snapshot.rng_states) - 1)
+
+    for fighter, rng_index in zip(battle.fighters, snapshot.fighter_rngs):
+        if rng_index is not None and streams[rng_index] is None:
+            streams[rng_index] = fighter.__dict__.get("rng")
+
+    if snapshot.battle_rng >= 0 and streams[snapshot.battle_rng] is None:
+        streams[snapshot.battle_rng] = battle.rng
+
+    return [rng if rng is not None else random.Random() for rng in streams]
+
+
+def build_battle(snapshot: BattleSnapshot, **kwargs: Any) -> Battle:
+    """Create an independent :class:`Battle` that continues from ``snapshot``.
+
+    Fighters are fresh ``Player`` objects without photo data and every random
+    stream is a new ``random.Random`` in the captured state. Streams that
+    used the global :mod:`random` module get a private copy as well, so
+    branches never disturb each other. ``kwargs`` (hooks, ``recorder``) are
+    passed to :class:`Battle`.
+    """
+    from autofighter.sim.battle import Battle
+
+    fighters = [_load_fighter(record) for record in snapshot.fighters]
+
+    streams: list[Any] = []
+    for state in snapshot.rng_states:
+        rng = random.Random()
+        rng.setstate(state)
+        streams.append(rng)
+
+    global_stream = streams[-1]
+    battle = Battle([], [], persist=snapshot.battle["persist"], event_scheduler=snapshot.event_scheduler, **kwargs)
+    _reset_battle(battle, snapshot, fighters, streams[:-1])
+
+    for fighter, rng_index in zip(fighters, snapshot.fighter_rngs):
+        if rng_index is None:
+            fighter.rng = global_stream
+    if snapshot.battle_rng < 0:
+        battle.rng = global_stream
+
+    if battle.recorder is not None:
+        for fighter_id, fighter in enumerate(fighters):
+            battle.recorder.fighter(battle.ticks, fighter_id, fighter)
+
+    return battle
@@ -0,0 +1,299 @@
+"""Foe roster construction shared by the game loop and headless tools.
+
+Building a wave (picking names, ``set_level``, past lives, foe passives and
+photos) can take seconds at high levels. :class:`WavePipeline` builds the next
+wave on a worker while the current one is being fought, so starting a wave is
+usually just a swap.
+"""
+
+from __future__ import annotations
+
+import random
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from themedstuff import themed_ajt
+from themedstuff import themed_names
+
+from player import Player
+from foe_passive_builder import build_foe_stats
+
+if TYPE_CHECKING:
+    from autofighter.sim.roster import RosterPool
+    from autofighter.sim.foe_cache import FoeCache
+
+
+NUMBER_OF_FOES = 4
+PAST_LIVES_LEVEL = 20000
+
+
+@dataclass
+class Wave:
+    """A fully built foe roster for one wave."""
+
+    level: int
+    foelist: list[Player] = field(default_factory=list)
+    backup_foes_list: list[Player] = field(default_factory=list)
+
+    @property
+    def all_foes(self) -> list[Player]:
+        return self.foelist + self.backup_foes_list
+
+
+def wave_level(playerlist: list[Player], foes_killed: int) -> int:
+    """Return the wave level the party's progress calls for."""
+    level_sum = 0
+
+    for player in playerlist:
+        level_sum += player.level
+
+    return round((level_sum + foes_killed) / (len(playerlist)))
+
+
+def pick_foe_names(level: int, rng: random.Random | None = None) -> list[tuple[str, str]]:
+    """Pick the foes for a wave at ``level``.
+
+    Returns:
+        ``(display_name, themed_name)`` pairs in spawn order. The first
+        :data:`NUMBER_OF_FOES` entries take the field, the rest are backups.
+        ``themed_name`` is the lowercase key used for photos and passives.
+    """
+    rng = rng or random
+    temp_foe_themed_names: list[str] = []
+
+    for item in themed_names:
+        temp_foe_themed_names.append(item)
+
+    rng.shuffle(temp_foe_themed_names)
+
+    if level < 1000:
+        temp_foe_themed_names.remove("Carly".lower())
+
+    if level < 2000:
+        temp_foe_themed_names.remove("Mezzy".lower())
+        temp_foe_themed_names.remove("Mimic".lower())
+
+    if level < 10000:
+        temp_foe_themed_names.remove("Luna".lower())
+
+    picked: list[tuple[str, str]] = []
+
+    while len(temp_foe_themed_names) > 0:
+        themed_name = rng.choice(temp_foe_themed_names).capitalize()
+        temp_foe_themed_names.remove(themed_name.lower())
+        themed_title = rng.choice(themed_ajt).capitalize()
+
+        foe_pre_name = f"{themed_title} {themed_name.replace("_", " ")}"
+
+        picked.append((foe_pre_name, themed_name.lower()))
+
+    return picked
+
+
+def mimic_source(players: list[Player]) -> bytes | None:
+    """The save a Mimic foe copies: the party's "Player", from memory.
+
+    Mimics used to read ``lives/Player.dat``, which the level-up workers
+    rewrite while the next wave is being built, so a Mimic could read half
+    a file. ``None`` when "Player" is not in ``players``; the Mimic then
+    reads the file, which nothing is writing.
+    """
+    for player in players:
+        if player.PlayerName.lower() == "player":
+            return player.save_data()
+
+    return None
+
+
+def foe_level(level: int, rng: random.Random | None = None) -> int:
+    """Roll the level of a single foe in a wave at ``level``."""
+    return (rng or random).randint(max(level - 10, 1), level + 55)
+
+
+@dataclass(frozen=True)
+class FoeSpec:
+    """Everything needed to build one foe, decided up front.
+
+    ``seed`` drives the foe's construction and ``battle_seed`` its rolls in
+    combat, so a foe comes out the same wherever it is built. ``mimic`` is
+    the save a Mimic foe copies (see :func:`mimic_source`).
+    """
+
+    name: str
+    themed_name: str
+    level: int
+    seed: int
+    battle_seed: int
+    mimic: bytes | None = field(default=None, repr=False)
+
+
+def plan_foes(level: int, rng: random.Random | None = None) -> list[FoeSpec]:
+    """Pick names, levels and seeds for every foe of a wave at ``level``."""
+    rng = rng or random
+    specs: list[FoeSpec] = []
+
+    for foe_pre_name, themed_name in pick_foe_names(level, rng):
+        specs.append(FoeSpec(foe_pre_name, themed_name, foe_level(level, rng), rng.getrandbits(64), rng.getrandbits(64)))
+
+    return specs
+
+
+def recycle(foe: Player) -> Player:
+    """Strip ``foe`` back to an empty object that can be built into a new foe."""
+    foe.__dict__.clear()
+    return foe
+
+
+def build_foe(spec: FoeSpec, past_lives: bool = False, foe: Player | None = None) -> Player:
+    """Build and level one foe from ``spec`` and apply its foe passives.
+
+    ``foe`` is a fallen foe from an earlier wave to build into instead of a
+    new ``Player``; the result is the same either way.
+    """
+    if foe is None:
+        foe = Player(spec.name, random.Random(spec.seed))
+    else:
+        Player.__init__(recycle(foe), spec.name, random.Random(spec.seed))
+
+    foe.set_level(spec.level)
+
+    if past_lives:
+        foe.load_past_lives()
+
+    build_foe_stats(foe, spec.mimic)
+
+    return foe
+
+
+def build_foes(
+    level: int,
+    number_of_foes: int = NUMBER_OF_FOES,
+    rng: random.Random | None = None,
+    *,
+    past_lives: bool = False,
+    photos: bool = False,
+    pool: RosterPool | None = None,
+    reuse: list[Player] | None = None,
+    cache: FoeCache | None = None,
+    mimic: bytes | None = None,
+) -> tuple[list[Player], list[Player]]:
+    """Build a levelled ``(foelist, backup_foes_list)`` pair.
+
+    The roster is planned from ``rng`` and each foe is then built from its
+    own :class:`FoeSpec`, either here or on ``pool``; both give the same foes.
+    Foe passives from :func:`foe_passive_builder.build_foe_stats` are applied
+    last. ``past_lives`` lets foes above :data:`PAST_LIVES_LEVEL` absorb saved
+    past lives and ``photos`` picks a photo path for each foe; both touch the
+    disk, so headless runs leave them off.
+
+    ``reuse`` hands over foes of a finished wave; they are rebuilt in place
+    (see :func:`build_foe`) so long runs do not allocate a new roster per
+    wave. Extra foes beyond ``reuse`` are created as usual.
+
+    With a ``cache``, foes are cloned from its templates (see
+    :class:`autofighter.sim.foe_cache.FoeCache`) unless they load past lives.
+    A Mimic copies ``mimic`` (see :func:`mimic_source`) when it is given.
+    """
+    specs = plan_foes(level, rng)
+    if mimic is not None:
+        specs = [replace(spec, mimic=mimic) if spec.themed_name == "mimic" else spec for spec in specs]
+    load_lives = past_lives and level > PAST_LIVES_LEVEL
+    reuse = list(reuse or ())[: len(specs)]
+    reuse += [None] * (len(specs) - len(reuse))
+
+    if cache is not None and not load_lives:
+        foes = [cache.build(spec, foe) for spec, foe in zip(specs, reuse)]
+    elif pool is None:
+        foes = [build_foe(spec, load_lives, foe) for spec, foe in zip(specs, reuse)]
+    else:
+        foes = pool.build_foes(specs, load_lives, reuse)
+
+    foelist: list[Player] = []
+    backup_foes_list: list[Player] = []
+
+    for i, (spec, foe) in enumerate(zip(specs, foes)):
+        foe.rng = random.Random(spec.battle_seed)
+
+        if photos:
+            foe.set_photo(spec.themed_name)
+
+        if i < number_of_foes:
+            foelist.append(foe)
+        else:
+            backup_foes_list.append(foe)
+
+    return foelist, backup_foes_list
+
+
+def build_wave(
+    level: int,
+    load_photo: Callable[[Player], None] | None = None,
+    rng: random.Random | None = None,
+    pool: RosterPool | None = None,
+    mimic: bytes | None = None,
+    cache: FoeCache | None = None,
+) -> Wave:
+    """Build everything the game needs for a wave at ``level``.
+
+    ``load_photo`` is called for each foe once its stats are final, so image
+    decoding happens on the same worker as the rest of the build. Foes are
+    cloned from ``cache`` or built on ``pool`` as in :func:`build_foes`, and
+    a Mimic copies ``mimic``.
+    """
+    foelist, backup_foes_list = build_foes(level, rng=rng, past_lives=True, photos=True, pool=pool, cache=cache, mimic=mimic)
+    wave = Wave(level, foelist, backup_foes_list)
+
+    if load_photo is not None:
+        for foe in wave.all_foes:
+            load_photo(foe)
+
+    return wave
+
+
+class WavePipeline:
+    """Build waves ahead of time on a background worker.
+
+    Call :meth:`prefetch` with the level the next wave is expected to have as
+    soon as the current wave starts, then :meth:`request` with the real level
+    once it is known. A prefetched wave is used when its level is within
+    ``tolerance`` of the real one (foe levels are rolled from ``level - 10``
+    to ``level + 55`` anyway); otherwise it is dropped and the wave is built
+    on demand.
+
+    Keyword arguments of both are passed on to ``builder``. Anything a build
+    needs from the live party (such as :func:`mimic_source`) should be taken
+    there, on the calling thread, rather than read by the worker while the
+    party levels up.
+    """
+
+    def __init__(self, builder: Callable[..., Wave] = build_wave, tolerance: int = 10) -> None:
+        self.builder = builder
+        self.tolerance = tolerance
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wave")
+        self._pending: tuple[int, Future[Wave]] | None = None
+
+    def prefetch(self, level: int, **kwargs: Any) -> None:
+        """Start building a wave at ``level`` in the background."""
+        if self._pending is not None:
+            self._pending[1].cancel()
+
+        self._pending = (level, self._executor.submit(self.builder, level, **kwargs))
+
+    def request(self, level: int, **kwargs: Any) -> Future[Wave]:
+        """Return a future for a wave at ``level``, reusing a close prefetch."""
+        if self._pending is not None:
+            predicted, future = self._pending
+            self._pending = None
+
+            if abs(predicted - level) <= self.tolerance:
+                return future
+
+            future.cancel()
+
+        return self._executor.submit(self.builder, level, **kwargs)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
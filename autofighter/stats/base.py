@@ -0,0 +1,38 @@
+"""Closed form of the base stat (HP, Def, Atk) diminishing returns.
+
+:meth:`player.Player.check_base_stats` used to walk a threshold table rebuilt
+on every call. The functions here compute the same numbers directly, so the
+hot paths (``level_up``, past lives, passives and ``damagestate``) do
+constant work per call.
+"""
+
+from __future__ import annotations
+
+
+STATS_TO_START_LOWER = 50
+MAX_BASE_GAIN = 1000
+
+
+def base_stat_divisor(stat_total: float) -> float:
+    """Divisor :meth:`player.Player.check_base_stats` applies at ``stat_total``.
+
+    The original table maps thresholds ``0, 100, ..., 4400`` (then ``50``) to
+    ``(10 + stat_total // 1000) ** max(0.7 * (i + 1), 1.0)`` and uses the
+    first threshold ``stat_total`` exceeds. Thresholds are checked in
+    insertion order, so any positive total stops at ``0``, whose exponent is
+    ``1.0``; a total of 0 or less exceeds none of them.
+    """
+    if stat_total > 0:
+        return max((10 + stat_total // 1000) ** 1.0 * (stat_total // STATS_TO_START_LOWER), 1)
+    return 1
+
+
+def diminish_base_gain(stat_total: float, desired_increase: float) -> int:
+    """Diminished base stat gain, clamped to ``1..MAX_BASE_GAIN``.
+
+    ``desired_increase`` should already include item bonuses.
+    """
+    if stat_total > 0:
+        desired_increase = desired_increase / base_stat_divisor(stat_total)
+
+    return max(min(int(desired_increase), MAX_BASE_GAIN), 1)
@@ -0,0 +1,264 @@
+"""Bulk level-ups.
+
+High-level waves can hand a fighter hundreds of levels of EXP at once, and
+:meth:`player.Player.level_up` used to pay for each level with nine random
+draws, three :meth:`~player.Player.check_base_stats` calls and a stat tier
+pick. :func:`bulk_level_up` applies the same levels in a handful of NumPy
+operations:
+
+- :func:`levels_gained` binary-searches the fighter's cached
+  :class:`ExpCurve`, so the final level is what the loop reaches and the EXP
+  left over matches it up to float rounding.
+- Stat tiers for every level are drawn at once from
+  :func:`foe_passive_builder.stat_pick_options`, and each stat only draws for
+  the levels whose tier raises it.
+- HP, Def and Atk gains are diminished by the stat they are added to. The
+  divisor only changes when the stat crosses a multiple of
+  :data:`~autofighter.stats.base.STATS_TO_START_LOWER`, so gains are settled
+  a whole run of levels at a time, up to the next crossing.
+- Regain, crit rate and crit damage take the sum of their draws through
+  :mod:`autofighter.stats.curves` (the ``*_after`` functions, crit rate
+  spending gains above :data:`CRIT_RATE_FULL_GAIN` last); dodge odds is
+  raised level by level through the constant-time
+  :func:`~autofighter.stats.curves.dodge_odds_gain`, and only when a single
+  draw is large enough to take a step.
+- Items are added in level order, after the stats, and the upgrades of
+  the remaining levels go through :meth:`items.ItemType.upgrade_many`. :meth:`player.Player.level_up` only takes this path once a fighter
+  holds all :data:`MAX_BLESSINGS` items, so a new item never has to count
+  toward the gains of the levels after it.
+
+Draws come from a NumPy generator seeded from the fighter's ``rng``, so a
+seeded fighter levels up reproducibly. The result is statistically
+equivalent to the loop rather than identical: the loop interleaves all draws
+in one stream, and here Mitigation and Vitality (which grow by about 1e-9 a
+level) are held at their starting values while the level's draws are scaled.
+The per-level loop stays available as :meth:`player.Player.level_up_each`.
+"""
+
+from __future__ import annotations
+
+import math
+import bisect
+import functools
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    np = None
+
+from items import ItemType, on_stat_gain, split_upgrades
+from foe_passive_builder import stat_pick_options
+
+from autofighter.stats.base import MAX_BASE_GAIN, STATS_TO_START_LOWER, base_stat_divisor
+from autofighter.stats.curves import crit_damage_after, crit_rate_after, dodge_odds_gain
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+BULK_LEVELS = 32
+MAX_BLESSINGS = 5  # player.starting_max_blessing
+FULL_GAINS_LEVEL = 500
+LATE_GAINS_LEVEL = 300
+CRIT_RATE_FULL_GAIN = 0.25
+
+
+def exp_needed(level: int, exp_mod: float) -> float:
+    """EXP :meth:`player.Player.exp_to_levelup` asks for at ``level``."""
+    return min(max((level ** 1.55) / (exp_mod ** 0.55), 1), 10 ** 10)
+
+
+class ExpCurve:
+    """The EXP curve of one ``EXPMod``, filled in as higher levels are asked for.
+
+    ``needed[level]`` is :func:`exp_needed` and ``paid[level]`` the sum of
+    ``needed`` below ``level``. ``level_up`` keeps going from ``level`` while
+    the EXP left covers the current level's cost, then pays the next one's,
+    so after ``g`` levels it has paid ``paid[level + g + 1] - paid[level + 1]``
+    and carries on while that plus ``needed[level + g]`` fits in the EXP.
+    ``reach[l] = paid[l + 1] + needed[l]`` only grows, which makes the number
+    of levels gained a binary search.
+    """
+
+    def __init__(self, exp_mod: float) -> None:
+        self.exp_mod = exp_mod
+        self.needed: list[float] = []
+        self.paid: list[float] = []
+        self.reach: list[float] = []
+
+    def extend(self, level: int) -> None:
+        """Fill the tables up to at least ``level``, doubling as they grow."""
+        total = self.paid[-1] + self.needed[-1] if self.paid else 0.0
+
+        for at in range(len(self.needed), max(level + 1, 2 * len(self.needed), 64)):
+            cost = exp_needed(at, self.exp_mod)
+            self.needed.append(cost)
+            self.paid.append(total)
+            total += cost
+            self.reach.append(total + cost)
+
+    def exp_to_levelup(self, level: int) -> float:
+        if level < 0 or level != int(level):
+            return exp_needed(level, self.exp_mod)
+        if level >= len(self.needed):
+            self.extend(level)
+        return self.needed[level]
+
+    def levels_gained(self, level: int, exp: float) -> tuple[int, float]:
+        """Levels a fighter at ``level`` with ``exp`` gains, and the EXP left over."""
+        if level < 0 or level != int(level) or not math.isfinite(exp):
+            return _walk_levels(level, exp, self.exp_mod)
+
+        if level + 1 >= len(self.needed):
+            self.extend(level + 1)
+
+        budget = exp + self.paid[level + 1]
+        while self.reach[-1] <= budget:
+            self.extend(2 * len(self.needed))
+
+        top = bisect.bisect_right(self.reach, budget, lo=level)
+        paid = self.paid[top] + self.needed[top] - self.paid[level + 1]
+        return top - level, max(exp - paid, 0)
+
+
+def _walk_levels(level: int, exp: float, exp_mod: float) -> tuple[int, float]:
+    gained = 0
+
+    while exp >= exp_needed(level + gained, exp_mod):
+        gained += 1
+        exp = max(exp - exp_needed(level + gained, exp_mod), 0)
+
+    return gained, exp
+
+
+@functools.lru_cache(maxsize=32)
+def exp_curve(exp_mod: float) -> ExpCurve:
+    """The shared :class:`ExpCurve` for ``exp_mod``.
+
+    Curves are keyed by ``EXPMod``, so a fighter whose ``EXPMod`` changes
+    simply reads another curve.
+    """
+    return ExpCurve(exp_mod)
+
+
+def levels_gained(level: int, exp: float, exp_mod: float) -> tuple[int, float]:
+    """Levels a fighter at ``level`` with ``exp`` gains, and the EXP left over."""
+    return exp_curve(exp_mod).levels_gained(level, exp)
+
+
+def bulk_available() -> bool:
+    return np is not None
+
+
+def _base_gains(stat: int, desired: np.ndarray, halved: np.ndarray) -> int:
+    """Total a base stat grows by over ``desired`` gains applied in order.
+
+    Mirrors ``check_base_stats`` level by level: each gain is divided by the
+    divisor at the stat's current value and clamped to ``1..MAX_BASE_GAIN``
+    (then halved where ``halved`` is set).
+    """
+    start = stat
+    done = 0
+
+    while done < len(desired):
+        if stat > 0:
+            gains = desired[done:] / base_stat_divisor(stat)
+            boundary = (stat // STATS_TO_START_LOWER + 1) * STATS_TO_START_LOWER
+        else:
+            gains = desired[done:]
+            boundary = 1
+
+        gains = np.clip(np.trunc(gains), 1, MAX_BASE_GAIN).astype(np.int64)
+        gains = np.where(halved[done:], gains // 2, gains)
+        totals = np.cumsum(gains)
+
+        # Every level up to and including the one that crosses the boundary
+        # used the current divisor.
+        take = min(int(np.searchsorted(totals, boundary - stat)) + 1, len(totals))
+        stat += int(totals[take - 1])
+        done += take
+
+    return stat - start
+
+
+def bulk_level_up(player: Player, mod: float = 1) -> int:
+    """Apply every level ``player``'s EXP pays for; returns the number gained."""
+    gained, exp = levels_gained(player.level, player.EXP, player.EXPMod)
+    if gained == 0:
+        player.check_stats()
+        return 0
+
+    gen = np.random.default_rng(player.rng.getrandbits(64))
+
+    mod_fixed = on_stat_gain(player.Items, (mod * 0.35) + 1) * player.Vitality * (player.level / 1000)
+    int_mod = max(round(mod_fixed * (player.level / 100)), 1)
+    scale = max(mod_fixed / 10000, 1)
+    late_scale = max(mod_fixed / 1000000, 1)
+    item_gain = on_stat_gain(player.Items, 1.0)
+
+    levels = np.arange(player.level + 1, player.level + gained + 1)
+    if "player" in player.PlayerName.lower():
+        choices = np.full(gained, 9)
+    else:
+        choices = gen.choice(stat_pick_options(player), size=gained)
+
+    allround = choices == 9
+    halved = allround & (levels <= FULL_GAINS_LEVEL)
+
+    def base_stat(stat: int, tier: int, low: int, high: int) -> int:
+        picked = (choices == tier) | allround
+        draws = gen.integers(low, high * int_mod, endpoint=True, size=int(picked.sum()))
+        desired = np.round(draws * player.Vitality) * item_gain
+        return _base_gains(stat, desired, halved[picked])
+
+    hp_up = base_stat(player.MHP, 1, 5, 10)
+    player.MHP += hp_up
+    player.HP += hp_up
+    player.Def += base_stat(player.Def, 2, 2, 5)
+    player.Atk += base_stat(player.Atk, 3, 2, 5)
+
+    picked = int(((choices == 4) | allround).sum())
+    player.Regain += float(gen.uniform(0.0000001, 0.0000005, picked).sum())
+
+    picked = int(((choices == 5) | allround).sum())
+    points = gen.uniform(0.001, 0.0025, picked) * scale
+    small = points <= CRIT_RATE_FULL_GAIN
+    player.CritRate = float(crit_rate_after(player.CritRate, points[small].sum()))
+    player.CritRate = float(crit_rate_after(player.CritRate, points[~small].sum(), free=False))
+
+    picked = int(((choices == 6) | allround).sum())
+    player.CritDamageMod = float(crit_damage_after(player.CritDamageMod, gen.uniform(0.004, 0.008, picked).sum() * scale))
+
+    picked = int(((choices == 7) | allround).sum())
+    if dodge_odds_gain(min(player.DodgeOdds, 0), 0.00004 * scale) > 0:
+        for dodge_up in gen.uniform(0.000002, 0.00004, picked) * scale:
+            player.DodgeOdds += dodge_odds_gain(player.DodgeOdds, float(dodge_up))
+
+    item_choices = choices[(choices == 8) | allround]
+    added = min(max(MAX_BLESSINGS - len(player.Items), 0), len(item_choices))
+    for _ in range(added):
+        player.Items.append(ItemType(player.rng))
+
+    upgrade_one = int((item_choices[added:] == 8).sum())
+    upgrade_all = len(item_choices) - added - upgrade_one
+    if upgrade_one:
+        for item, times in zip(player.Items, split_upgrades(upgrade_one, len(player.Items), player.rng)):
+            item.upgrade_many(mod_fixed * 25, times, player.rng)
+    if upgrade_all:
+        for item in player.Items:
+            item.upgrade_many(mod_fixed, upgrade_all, player.rng)
+
+    late = int((levels > LATE_GAINS_LEVEL).sum())
+    if late:
+        player.Mitigation += float(gen.uniform(0.0000000001, 0.0000000002, late).sum()) / player.Mitigation * late_scale
+        player.Vitality += float(gen.uniform(0.000000001, 0.000000002, late).sum()) / player.Vitality * late_scale
+        player.ActionPointsPerTick += 0.002 * late
+        player.EffectRES += 0.0000002 * late
+        player.EffectHitRate += 0.000001 * late
+
+    player.level += gained
+    player.EXP = exp
+    player.check_stats()
+    return gained
@@ -0,0 +1,120 @@
+"""Closed forms of the stat-for-stat trades in character passives.
+
+Luna's and Carly's passives (for foes in :mod:`foe_passive_builder` and for
+the player in ``plugins/passives/``) used to trade stats one small step per
+loop iteration, so a high-level foe spun for seconds or minutes. The
+functions here do those trades in bulk:
+
+- :func:`steps_above` counts how many steps a ``while stat > floor`` loop
+  takes.
+- :func:`base_stat_after` applies many ``check_base_stats`` gains of the same
+  size at once, a run of equal gains at a time.
+- :func:`uniform_sum` replaces a run of ``rng.uniform`` draws by their sum.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+from typing import TYPE_CHECKING
+
+from items import on_stat_gain
+
+from autofighter.stats.base import diminish_base_gain
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+UNIFORM_BATCH = 16
+
+
+def steps_above(value: float, floor: float, step: float = 1) -> int:
+    """How many times ``while value > floor: value -= step`` runs.
+
+    Exact for integer ``value`` and ``step`` (what HP is), and for floats up
+    to the rounding the loop itself would accumulate.
+    """
+    if step <= 0 or value <= floor:
+        return 0
+
+    steps = math.ceil((value - floor) / step)
+
+    # The division can land one step either side of the boundary.
+    while steps > 0 and value - (steps - 1) * step <= floor:
+        steps -= 1
+    while value - steps * step > floor:
+        steps += 1
+
+    return steps
+
+
+def shed_hp_for_dodge(player: Player, dodge_buff: float, keep: float = 0.25, dodge_per_hp: float = 0.001) -> float:
+    """Lower ``player``'s MHP to ``keep`` of itself, one point at a time.
+
+    Every point shed adds ``dodge_per_hp * Vitality`` to ``dodge_buff``,
+    which is returned.
+    """
+    removed = steps_above(player.MHP, player.MHP * keep)
+    player.MHP -= removed
+    return dodge_buff + removed * (dodge_per_hp * player.Vitality)
+
+
+def _gain_drops_at(stat: float, desired: float, gain: int) -> float | None:
+    """First ``stat + k`` (``k`` a whole number) whose gain is below ``gain``.
+
+    Gains never grow as the stat does, so this is a doubling search followed
+    by a binary search. ``None`` once the gain is already the minimum of 1.
+    """
+    if gain <= 1:
+        return None
+
+    low, high = 0, 1
+    while diminish_base_gain(stat + high, desired) >= gain:
+        low, high = high, high * 2
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if diminish_base_gain(stat + middle, desired) >= gain:
+            low = middle
+        else:
+            high = middle
+
+    return stat + high
+
+
+def base_stat_after(player: Player, stat: float, stat_gain: float, steps: int) -> float:
+    """``stat`` after ``steps`` rounds of ``stat += player.check_base_stats(stat, stat_gain)``.
+
+    The gain only changes at a handful of totals (at most one per whole gain
+    from 1000 down to 1), so the steps are applied a run of equal gains at a
+    time.
+    """
+    desired = on_stat_gain(player.Items, stat_gain)
+
+    while steps > 0:
+        gain = diminish_base_gain(stat, desired)
+        end = _gain_drops_at(stat, desired, gain)
+
+        taken = steps if end is None else min(steps, math.ceil((end - stat) / gain))
+        stat += taken * gain
+        steps -= taken
+
+    return stat
+
+
+def uniform_sum(rng, count: int, low: float, high: float) -> float:
+    """Sum of ``count`` draws of ``rng.uniform(low, high)``.
+
+    Fewer than :data:`UNIFORM_BATCH` draws are made one by one. Beyond that
+    the sum is drawn from the normal distribution with its mean and
+    variance, kept within ``count * low`` and ``count * high``.
+    """
+    rng = rng or random
+
+    if count < UNIFORM_BATCH:
+        return sum(rng.uniform(low, high) for _ in range(count))
+
+    total = rng.gauss(count * (low + high) / 2, (high - low) * math.sqrt(count / 12))
+    return min(max(total, count * low), count * high)
@@ -0,0 +1,68 @@
+"""Themed traits of a fighter, read off its name once.
+
+Foe modifiers (:mod:`foe_passive_builder`) and combat passives
+(:func:`damagestate.check_passive_mod`) are keyed on the character, the
+adjective and, for the ladies, the element a fighter's name mentions. They
+used to find out with a ``themed_names[i] in name.lower()`` scan per check,
+which added up to more than a hundred scans per foe build and a dozen per
+hit. :func:`resolve_traits` does every scan once per distinct name and
+:attr:`player.Player.traits` hands out the cached result.
+
+Matching keeps the substring rules the checks had, so ``"Cruel Luna"`` has
+the ``luna`` and ``cruel`` traits. Underscores and spaces are treated alike,
+so ``lady_echo`` matches the ``"Lady Echo"`` display name.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from dataclasses import dataclass
+
+from themedstuff import themed_ajt, themed_names
+
+
+LADY = "lady"
+LADY_ELEMENTS = ("light", "dark", "fire", "ice")
+
+CHARACTER_ORDER = {name: index for index, name in enumerate(themed_names)}
+
+
+def _normalize(text: str) -> str:
+    return text.lower().replace("_", " ")
+
+
+_CHARACTER_KEYS = [(name, _normalize(name)) for name in themed_names]
+
+
+@dataclass(frozen=True)
+class Traits:
+    """The themed words a fighter's name contains.
+
+    ``characters`` and ``adjectives`` follow the order of
+    :data:`themedstuff.themed_names` and :data:`themedstuff.themed_ajt`, which
+    is the order their modifiers apply in. ``elements`` is only filled in
+    for a lady.
+    """
+
+    characters: tuple[str, ...]
+    adjectives: tuple[str, ...]
+    lady: bool
+    elements: tuple[str, ...]
+
+    def __contains__(self, trait: str) -> bool:
+        return trait in self.characters or trait in self.adjectives
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_traits(name: str) -> Traits:
+    """The :class:`Traits` of a fighter called ``name``."""
+    name = _normalize(name)
+    lady = LADY in name
+
+    return Traits(
+        characters=tuple(key for key, word in _CHARACTER_KEYS if word in name),
+        adjectives=tuple(adjective for adjective in themed_ajt if adjective in name),
+        lady=lady,
+        elements=tuple(element for element in LADY_ELEMENTS if element in name) if lady else (),
+    )
@@ -38,7 +38,17 @@ class dot:
         self.source: Optional[str] = source
         self.metadata: Optional[Dict[str, Any]] = metadata
         self.tick_interval: int = tick_interval
-        self.photodata = pygame.image.load(self.set_photo())
+        self.photo: Optional[str] = None
+        self._photodata = None
+
+    @property
+    def photodata(self):
+        """The DOT icon, picked and loaded the first time it is drawn."""
+        if self._photodata is None:
+            if self.photo is None:
+                self.photo = self.set_photo()
+            self._photodata = pygame.image.load(self.photo)
+        return self._photodata
 
     def set_photo(self):
         return set_themed_dot_photo(self.damage_type.name.lower())
@@ -5,7 +5,6 @@ handled separately in :mod:`foe_passive_builder` when foes load at runtime.
 """
 
 import math
-import random
 
 from player import Player
 
@@ -14,7 +13,7 @@ from healing_over_time import hot as healingovertimetype
 
 from colorama import Fore, Style
 
-from themedstuff import themed_names
+from autofighter.traits import CHARACTER_ORDER
 
 from damagetypes import Light, Dark, Wind, Lightning, Fire, Ice, Generic
 
@@ -60,7 +59,7 @@ def check_damage_type_passive(alllist: list[Player], source: Player, target: Pla
                     if player.HP > player.MHP * 0.25:
                         source.above_threshold_ticks += 1
                         player.gain_damage_over_time(damageovertimetype("Abyssal Weakness", source.above_threshold_ticks ** 1.05, round(55 * source.above_threshold_ticks), source.Type, source.PlayerName, 1), source.above_threshold_ticks ** 0.55)
-                        source.Atk += source.check_base_stats(source.Atk, random.randint(95, 105) * source.above_threshold_ticks)
+                        source.Atk += source.check_base_stats(source.Atk, source.rng.randint(95, 105) * source.above_threshold_ticks)
     
     if source.Type == Wind:
         target.gain_damage_over_time(damageovertimetype("Gale Erosion", mited_damage_dealt ** 1.05, 325, source.Type, source.PlayerName, 1), source.effecthittate())
@@ -137,7 +136,7 @@ def check_passive_mod(foelist: list[Player], playerlist: list[Player], source: P
         alllist.append(player)
 
     if getattr(source, "BleedChance", 0) > 0:
-        if random.random() < source.BleedChance:
+        if source.rng.random() < source.BleedChance:
             bleed_dot = damageovertimetype(
                 "Bleed",
                 source.deal_damage(0.05, target.Type),
@@ -148,160 +147,209 @@ def check_passive_mod(foelist: list[Player], playerlist: list[Player], source: P
             )
             target.gain_damage_over_time(bleed_dot, source.effecthittate())
 
-    if themed_names[0] in source.PlayerName.lower():
-        if source.Regain > 10:
-            source.Regain -= 0.01 * source.above_threshold_ticks
-            source.DodgeOdds += 0.001 * source.above_threshold_ticks
-            source.MHP += 500 * source.above_threshold_ticks
-            source.HP += 500 * source.above_threshold_ticks
-            source.Atk += 50 * source.above_threshold_ticks
-            source.Def += 1 * source.above_threshold_ticks
-        
-        if source.Mitigation > 1:
-            source.DodgeOdds += 0.001 * source.above_threshold_ticks
-            source.Mitigation -= 0.001 * source.above_threshold_ticks
-            source.EffectRES += 0.01 * source.above_threshold_ticks
-            source.EffectHitRate += 0.01 * source.above_threshold_ticks
-
-        if themed_names[0] in target.PlayerName.lower():
-            if random.random() > 0.999:
-                log(random.choice([red, green, blue]), f"{source.PlayerName} tried to hit {target.PlayerName}! {random.choice([red, green, blue])}Why would I hit myself user... {random.choice([red, green, blue])}you think I am dumb?")
-            
-            mited_damage_dealt = mited_damage_dealt / 4
+    for passive in _passives(source, target):
+        mited_damage_dealt = passive(foelist, alllist, source, target, mited_damage_dealt)
+
+    mited_damage_dealt = check_damage_type_passive(alllist, source, target, mited_damage_dealt)
+    
+    return max(mited_damage_dealt, 1)
+
+def _luna(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    if source.Regain > 10:
+        source.Regain -= 0.01 * source.above_threshold_ticks
+        source.DodgeOdds += 0.001 * source.above_threshold_ticks
+        source.MHP += 500 * source.above_threshold_ticks
+        source.HP += 500 * source.above_threshold_ticks
+        source.Atk += 50 * source.above_threshold_ticks
+        source.Def += 1 * source.above_threshold_ticks
+
+    if source.Mitigation > 1:
+        source.DodgeOdds += 0.001 * source.above_threshold_ticks
+        source.Mitigation -= 0.001 * source.above_threshold_ticks
+        source.EffectRES += 0.01 * source.above_threshold_ticks
+        source.EffectHitRate += 0.01 * source.above_threshold_ticks
+
+    if "luna" in target.traits:
+        if source.rng.random() > 0.999:
+            log(source.rng.choice([red, green, blue]), f"{source.PlayerName} tried to hit {target.PlayerName}! {source.rng.choice([red, green, blue])}Why would I hit myself user... {source.rng.choice([red, green, blue])}you think I am dumb?")
+
+        mited_damage_dealt = mited_damage_dealt / 4
+    else:
+        if source.HP > source.MHP * 0.25:
+            hp_diff = source.HP - source.MHP * 0.25
+            reduction_factor = hp_diff / (source.MHP * 0.75)
+
+            scaled_reduction = reduction_factor ** 0.65 * 0.05
+
+            # Introduce a multiplier that increases with time above 25% HP
+            source.above_threshold_ticks += 1
+
+            multiplier = 1 + (source.above_threshold_ticks ** 0.5) * 0.01 
+
+            source.HP -= round(source.MHP * scaled_reduction * multiplier)
+
+            mited_damage_dealt = mited_damage_dealt * (((source.MHP - source.HP) + 1) * 4)
+            target.gain_damage_over_time(damageovertimetype("Twilight Decay", mited_damage_dealt ** 0.65, 175, source.Type, source.PlayerName, 2), source.effecthittate())
         else:
-            if source.HP > source.MHP * 0.25:
-                hp_diff = source.HP - source.MHP * 0.25
-                reduction_factor = hp_diff / (source.MHP * 0.75)
-                
-                scaled_reduction = reduction_factor ** 0.65 * 0.05
-
-                # Introduce a multiplier that increases with time above 25% HP
-                source.above_threshold_ticks += 1
-                
-                multiplier = 1 + (source.above_threshold_ticks ** 0.5) * 0.01 
-                
-                source.HP -= round(source.MHP * scaled_reduction * multiplier)
-
-                mited_damage_dealt = mited_damage_dealt * (((source.MHP - source.HP) + 1) * 4)
-                target.gain_damage_over_time(damageovertimetype("Twilight Decay", mited_damage_dealt ** 0.65, 175, source.Type, source.PlayerName, 2), source.effecthittate())
-            else:
-                source.above_threshold_ticks = 1
-                mited_damage_dealt = mited_damage_dealt * (((source.MHP - source.HP) + 1) * 2)
-                target.gain_damage_over_time(damageovertimetype("Impact Echo", mited_damage_dealt ** 0.35, 175, source.Type, source.PlayerName, 1), source.effecthittate())
-
-    if themed_names[1] in source.PlayerName.lower():
-        hp_percentage = source.HP / source.MHP
-
-        if source.DodgeOdds > 0.5:
-            source.Def += source.check_base_stats(source.Def, round(source.DodgeOdds ** 2)) + round(source.DodgeOdds)
-            source.DodgeOdds = 0
+            source.above_threshold_ticks = 1
+            mited_damage_dealt = mited_damage_dealt * (((source.MHP - source.HP) + 1) * 2)
+            target.gain_damage_over_time(damageovertimetype("Impact Echo", mited_damage_dealt ** 0.35, 175, source.Type, source.PlayerName, 1), source.effecthittate())
 
-        for player in alllist:
-            if source.isplayer == player.isplayer:
-                if player.PlayerName is not source.PlayerName:
-                    if player.HP < player.MHP * 0.65:
-                        source.take_damage(1, source.MHP * 0.05)
-                        player.heal_damage(source.deal_damage(1, Generic) * 0.025)
+    return mited_damage_dealt
 
-                    if player.Def > source.Def:
-                        player.Def -= 1
-                        source.Def += source.check_base_stats(source.Def, player.level)
 
+def _carly(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    hp_percentage = source.HP / source.MHP
 
-    elif themed_names[1] in target.PlayerName.lower():
-        hp_percentage = source.HP / source.MHP
+    if source.DodgeOdds > 0.5:
+        source.Def += source.check_base_stats(source.Def, round(source.DodgeOdds ** 2)) + round(source.DodgeOdds)
+        source.DodgeOdds = 0
 
-        if hp_percentage < 0.75:
-            damage_reduction = (1 - hp_percentage) * 0.95
-            mited_damage_dealt *= (1 - damage_reduction)
+    for player in alllist:
+        if source.isplayer == player.isplayer:
+            if player.PlayerName is not source.PlayerName:
+                if player.HP < player.MHP * 0.65:
+                    source.take_damage(1, source.MHP * 0.05)
+                    player.heal_damage(source.deal_damage(1, Generic) * 0.025)
 
-        if hp_percentage < 0.55:
-            mited_damage_dealt = carly_mit_adder(target, mited_damage_dealt)
+                if player.Def > source.Def:
+                    player.Def -= 1
+                    source.Def += source.check_base_stats(source.Def, player.level)
 
-        if hp_percentage < 0.25:
-            mited_damage_dealt = carly_mit_adder(target, mited_damage_dealt)
-        
-        if mited_damage_dealt > 100:
-            mited_damage_dealt = 100
-            
-    if themed_names[2] in source.PlayerName.lower():
-        for player in alllist:
-            if source.isplayer == player.isplayer:
-                if player.PlayerName is not source.PlayerName:
-                    if player.HP < source.MHP * 0.55:
-                        player.heal_damage(source.Atk * 0.005)
-                        player.gain_healing_over_time(healingovertimetype(f"{source.PlayerName}\'s Heal", round(player.MHP * 0.01), 5, player.Type, source.PlayerName, 1))
-                    
-                    if len(player.DOTS) > 0:
-                        to_be_moved = random.choice(player.DOTS)
+    return mited_damage_dealt
 
-                        player.DOTS.remove(to_be_moved)
 
-                        random.choice(foelist).gain_damage_over_time(to_be_moved, source.effecthittate())
+def _carly_hit(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    hp_percentage = source.HP / source.MHP
 
-    if themed_names[3] in source.PlayerName.lower():
-        if target.MHP > source.MHP:
-            source.MHP += random.randint(5, 15)
-            target.MHP -= 1
+    if hp_percentage < 0.75:
+        damage_reduction = (1 - hp_percentage) * 0.95
+        mited_damage_dealt *= (1 - damage_reduction)
 
-    if themed_names[4] in source.PlayerName.lower():
-        pass
+    if hp_percentage < 0.55:
+        mited_damage_dealt = carly_mit_adder(target, mited_damage_dealt)
 
-    if themed_names[5] in source.PlayerName.lower():
-        pass
+    if hp_percentage < 0.25:
+        mited_damage_dealt = carly_mit_adder(target, mited_damage_dealt)
 
-    if themed_names[6] in source.PlayerName.lower():
-        pass
+    if mited_damage_dealt > 100:
+        mited_damage_dealt = 100
 
-    if themed_names[7] in source.PlayerName.lower():
-        if source.HP < source.MHP * 0.85:
-            mited_damage_dealt = mited_damage_dealt + ((source.MHP / 4) / (target.Def * 2))
+    return mited_damage_dealt
 
-    if themed_names[8] in source.PlayerName.lower():
-        if source.Atk > 1000:
-            source.Regain += 0.05
-            source.Atk -= 1
-        if source.Def > 1000:
-            source.Regain += 0.05
-            source.Def -= 1
 
-    if themed_names[9] in source.PlayerName.lower():
-        pass
+def _becca(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    for player in alllist:
+        if source.isplayer == player.isplayer:
+            if player.PlayerName is not source.PlayerName:
+                if player.HP < source.MHP * 0.55:
+                    player.heal_damage(source.Atk * 0.005)
+                    player.gain_healing_over_time(healingovertimetype(f"{source.PlayerName}\'s Heal", round(player.MHP * 0.01), 5, player.Type, source.PlayerName, 1))
 
-    if themed_names[14].replace("_", " ") in source.PlayerName.lower():
-        source.Type = Lightning
+                if len(player.DOTS) > 0:
+                    to_be_moved = source.rng.choice(player.DOTS)
 
-        if source.ActionPointsPerTick < 100:
-            source.ActionPointsPerTick += 1
+                    player.DOTS.remove(to_be_moved)
 
-        if source.ActionPointsPerTurn > 600:
-            source.ActionPointsPerTurn = 600
-        
-        if source.EXP < source.exp_to_levelup():
-            source.EXP += max(source.exp_to_levelup() * 0.01, 1)
+                    source.rng.choice(foelist).gain_damage_over_time(to_be_moved, source.effecthittate())
 
-        if source.EffectHitRate <= 200:
-            source.EffectHitRate += 0.25
-        
-        if len(source.DOTS) > 0:
-            for dot in source.DOTS:
-                dot.turns -= 1
-            
-    if themed_names[15] in source.PlayerName.lower():
+    return mited_damage_dealt
 
-        if random.random() > 0.95:
-            source.Type = random.choice([Dark, Light, Lightning])
 
-        for player in alllist:
-            if source.isplayer == player.isplayer:
-                if player.PlayerName is not source.PlayerName:
-                    if source.Def > 1000:
-                        player.Def += 10
-                        source.Def -= 1
-    
-    mited_damage_dealt = check_damage_type_passive(alllist, source, target, mited_damage_dealt)
-    
-    return max(mited_damage_dealt, 1)
+def _ally(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    if target.MHP > source.MHP:
+        source.MHP += source.rng.randint(5, 15)
+        target.MHP -= 1
+
+    return mited_damage_dealt
+
+
+def _mezzy(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    if source.HP < source.MHP * 0.85:
+        mited_damage_dealt = mited_damage_dealt + ((source.MHP / 4) / (target.Def * 2))
+
+    return mited_damage_dealt
+
+
+def _graygray(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    if source.Atk > 1000:
+        source.Regain += 0.05
+        source.Atk -= 1
+    if source.Def > 1000:
+        source.Regain += 0.05
+        source.Def -= 1
+
+    return mited_damage_dealt
+
+
+def _lady_echo(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    source.Type = Lightning
+
+    if source.ActionPointsPerTick < 100:
+        source.ActionPointsPerTick += 1
+
+    if source.ActionPointsPerTurn > 600:
+        source.ActionPointsPerTurn = 600
+
+    if source.EXP < source.exp_to_levelup():
+        source.EXP += max(source.exp_to_levelup() * 0.01, 1)
+
+    if source.EffectHitRate <= 200:
+        source.EffectHitRate += 0.25
+
+    if len(source.DOTS) > 0:
+        for dot in source.DOTS:
+            dot.turns -= 1
+
+    return mited_damage_dealt
+
+
+def _kboshi(foelist: list[Player], alllist: list[Player], source: Player, target: Player, mited_damage_dealt: float) -> float:
+    if source.rng.random() > 0.95:
+        source.Type = source.rng.choice([Dark, Light, Lightning])
+
+    for player in alllist:
+        if source.isplayer == player.isplayer:
+            if player.PlayerName is not source.PlayerName:
+                if source.Def > 1000:
+                    player.Def += 10
+                    source.Def -= 1
+
+    return mited_damage_dealt
+
+
+SOURCE_PASSIVES = {
+    "luna": _luna,
+    "carly": _carly,
+    "becca": _becca,
+    "ally": _ally,
+    "mezzy": _mezzy,
+    "graygray": _graygray,
+    "lady_echo": _lady_echo,
+    "kboshi": _kboshi,
+}
+
+TARGET_PASSIVES = {
+    "carly": _carly_hit,
+}
+
+def _passives(source: Player, target: Player) -> list:
+    """Passives a hit from ``source`` on ``target`` triggers, in character order.
+
+    A character's target passive only applies when the source is not the
+    same character.
+    """
+    characters = source.traits.characters
+    passives = [(character, SOURCE_PASSIVES[character]) for character in characters if character in SOURCE_PASSIVES]
+
+    for character in target.traits.characters:
+        if character in TARGET_PASSIVES and character not in characters:
+            passives.append((character, TARGET_PASSIVES[character]))
+
+    if len(passives) > 1:
+        passives.sort(key=lambda passive: CHARACTER_ORDER[passive[0]])
+
+    return [passive for _, passive in passives]
 
 def carly_mit_adder(target: Player, mited_damage_dealt: float):
     for item in target.Items:
@@ -70,10 +70,10 @@ Ice = DamageType("ice", "fire", (0, 255, 255))
 
 all_damage_types = [Light, Dark, Wind, Lightning, Fire, Ice]
 
-def random_damage_type():
-    return random.choice(all_damage_types)
+def random_damage_type(rng=None):
+    return (rng or random).choice(all_damage_types)
 
-def get_damage_type(name: str):
+def get_damage_type(name: str, rng=None):
     damage_type_list = []
 
     if "Luna".lower() in name.lower():
@@ -84,6 +84,6 @@ def get_damage_type(name: str):
             damage_type_list.append(damage_type)
     
     if len(damage_type_list) > 0:
-        return random.choice(damage_type_list)
+        return (rng or random).choice(damage_type_list)
     
-    return random_damage_type()
\ No newline at end of file
+    return random_damage_type(rng)
\ No newline at end of file
@@ -12,56 +12,145 @@ loaded at runtime. Player passives live in dedicated plugins under
 
 from __future__ import annotations
 
-import random
+import functools
 
 from typing import TYPE_CHECKING
 
-from themedstuff import themed_ajt
-from themedstuff import themed_names
+from autofighter.stats.modifiers import IDENTITY, StatModifier, compile_table
+from autofighter.stats.transfers import base_stat_after, shed_hp_for_dodge, steps_above, uniform_sum
 
 if TYPE_CHECKING:
     from player import Player
 
 
-def player_stat_picker(player: Player) -> int:
-    """Return a random stat tier based on the foe's themed name."""
-    if themed_names[0] in player.PlayerName.lower():
-        return random.choice([5, 6, 7, 9])
-
-    if themed_names[1] in player.PlayerName.lower():
-        return random.choice([2, 2, 2, 2, 2, 2, 2, 2, 9])
-        
-    if themed_names[2] in player.PlayerName.lower():
-        return random.choice([1, 3, 5, 6, 9])
-
-    if themed_names[3] in player.PlayerName.lower():
-        return random.choice([1, 2, 3, 9])
+STAT_PICKS = {
+    "luna": [5, 6, 7, 9],
+    "carly": [2, 2, 2, 2, 2, 2, 2, 2, 9],
+    "becca": [1, 3, 5, 6, 9],
+    "ally": [1, 2, 3, 9],
+    "hilander": [6, 6, 6, 6, 6, 6, 9],
+    "chibi": [9],
+    "mimic": [9],
+    "mezzy": [1, 9],
+    "graygray": [4, 9],
+    "bubbles": [8, 9],
+}
+
+# Stats each adjective changes: CritRate is added to, every other stat is
+# multiplied (see autofighter.stats.modifiers).
+ADJECTIVE_TABLE = {
+    "atrocious": {"MHP": 1.9, "Atk": 1.1},
+    "baneful": {"Atk": 1.95, "CritDamageMod": 1.05},
+    "barbaric": {"MHP": 1.1, "Def": 1.9},
+    "beastly": {"MHP": 1.05, "Atk": 1.05},
+    "belligerent": {"Atk": 1.1, "DodgeOdds": 1.9},
+    "bloodthirsty": {"MHP": 0.9, "Atk": 1.2},
+    "brutal": {"DodgeOdds": 1.9, "CritRate": 0.1},
+    "callous": {"Def": 1.1, "DodgeOdds": 1.9},
+    "cannibalistic": {"MHP": 1.05},
+    "cowardly": {"MHP": 1.2, "Atk": 0.8},
+    "cruel": {"CritDamageMod": 1.05},
+    "cunning": {"DodgeOdds": 1.1},
+    "dangerous": {"Atk": 1.05, "CritRate": 0.05},
+    "demonic": {"MHP": 1.9, "Atk": 1.15},
+    "depraved": {"Atk": 1.1, "Def": 0.9},
+    "destructive": {"Atk": 1.1, "CritRate": 0.05},
+    "diabolical": {"Atk": 1.1, "DodgeOdds": 1.9},
+    "disgusting": {"Def": 1.9},
+    "dishonorable": {"Atk": 1.05, "Def": 1.95},
+    "dreadful": {"Atk": 1.05},
+    "eerie": {"DodgeOdds": 1.05},
+    "evil": {"MHP": 1.95, "Atk": 1.05},
+    "execrable": {"MHP": 1.9},
+    "fiendish": {"DodgeOdds": 1.9, "CritRate": 0.1},
+    "filthy": {"Def": 1.95},
+    "foul": {"Def": 1.95, "DodgeOdds": 1.95},
+    "frightening": {"Atk": 1.05, "DodgeOdds": 1.95},
+    "ghastly": {"MHP": 1.95, "DodgeOdds": 1.05},
+    "ghoulish": {"MHP": 1.95, "Atk": 1.05},
+    "gruesome": {"Atk": 1.05, "CritDamageMod": 1.05},
+    "heinous": {"Atk": 1.1, "CritDamageMod": 1.1},
+    "hideous": {"MHP": 1.1, "Def": 1.9},
+    "homicidal": {"Atk": 1.15},
+    "horrible": {"Atk": 1.02, "CritRate": 0.02},
+    "hostile": {"Atk": 1.05, "Def": 1.95},
+    "inhumane": {"CritDamageMod": 1.1},
+    "insidious": {"Atk": 1.05, "DodgeOdds": 1.05},
+    "intimidating": {"Atk": 1.95, "Def": 1.05},
+    "malevolent": {"DodgeOdds": 1.95, "CritDamageMod": 1.05},
+    "malicious": {"Atk": 1.07},
+    "monstrous": {"MHP": 1.1, "Atk": 1.1},
+    "murderous": {"CritRate": 0.15},
+    "nasty": {"Atk": 1.05, "Def": 1.95, "DodgeOdds": 1.95},
+    "nefarious": {"CritDamageMod": 1.05, "CritRate": 0.05},
+    "noxious": {"MHP": 1.95, "Atk": 1.05},
+    "obscene": {"Def": 1.9, "DodgeOdds": 1.9},
+    "odious": {"Def": 1.95},
+    "ominous": {"CritDamageMod": 1.03, "CritRate": 0.02},
+    "pernicious": {"MHP": 1.95, "CritRate": 0.05},
+    "perverted": {"Def": 1.9, "DodgeOdds": 1.1},
+    "poisonous": {"MHP": 1.93, "Atk": 1.07},
+    "predatory": {"DodgeOdds": 1.1, "CritRate": 0.05},
+    "premeditated": {"CritRate": 0.1},
+    "primal": {"MHP": 1.05, "Atk": 1.05, "Def": 1.95},
+    "primitive": {"Atk": 1.05, "Def": 1.95},
+    "profane": {"MHP": 1.9, "CritDamageMod": 1.1},
+    "psychopathic": {"Atk": 1.1, "DodgeOdds": 1.9, "CritDamageMod": 1.1},
+    "rabid": {"Atk": 1.1, "Def": 1.9},
+    "relentless": {"Atk": 1.05, "DodgeOdds": 1.9, "CritRate": 0.05},
+    "repulsive": {"Def": 1.9, "DodgeOdds": 1.1},
+    "ruthless": {"CritDamageMod": 1.15},
+    "sadistic": {"Atk": 1.02, "CritDamageMod": 1.08},
+    "savage": {"MHP": 1.1, "Atk": 1.1, "Def": 1.9},
+    "scary": {"Atk": 1.95, "DodgeOdds": 1.05, "CritDamageMod": 1.05},
+    "sinister": {"DodgeOdds": 1.05, "CritDamageMod": 1.05},
+    "sociopathic": {"Atk": 1.15, "DodgeOdds": 1.9},
+    "spiteful": {"MHP": 1.93, "Atk": 1.07},
+    "squalid": {"MHP": 1.05, "Def": 1.95},
+    "terrifying": {"Atk": 1.9, "Def": 1.1},
+    "threatening": {"Atk": 1.05, "Def": 1.95, "DodgeOdds": 1.95},
+    "treacherous": {"Atk": 1.05, "DodgeOdds": 1.05, "CritRate": 0.05},
+    "ugly": {"MHP": 1.9, "Def": 1.1},
+    "unholy": {"MHP": 5.0, "Atk": 2.0, "CritDamageMod": 0.8},
+    "venomous": {"MHP": 1.9, "Atk": 1.1},
+    "vicious": {"Atk": 1.1, "CritRate": 0.05},
+    "villainous": {"Atk": 1.05, "DodgeOdds": 1.95, "CritRate": 0.05},
+    "violent": {"Atk": 1.15, "Def": 0.85},
+    "wicked": {"Atk": 1.08, "CritDamageMod": 1.02},
+    "wrongful": {"Atk": 1.05, "Def": 1.95, "CritDamageMod": 1.05},
+    "xenophobic": {"Def": 1.1},
+}
+
+ADJECTIVE_MODIFIERS = compile_table(ADJECTIVE_TABLE)
+
+
+def stat_pick_options(player: Player) -> list[int]:
+    """Stat tiers :func:`player_stat_picker` chooses from for ``player``."""
+    for character in player.traits.characters:
+        if character in STAT_PICKS:
+            return STAT_PICKS[character]
+
+    return [9]
 
-    if themed_names[4] in player.PlayerName.lower():
-        return random.choice([6, 6, 6, 6, 6, 6, 9])
 
-    if themed_names[5] in player.PlayerName.lower():
-        return 9
-
-    if themed_names[6] in player.PlayerName.lower():
-        return 9
-
-    if themed_names[7] in player.PlayerName.lower():
-        return random.choice([1, 9])
+def player_stat_picker(player: Player) -> int:
+    """Return a random stat tier based on the foe's themed name."""
+    options = stat_pick_options(player)
 
-    if themed_names[8] in player.PlayerName.lower():
-        return random.choice([4, 9])
+    if len(options) == 1:
+        return options[0]
 
-    if themed_names[9] in player.PlayerName.lower():
-        return random.choice([8, 9])
+    return player.rng.choice(options)
 
-    return 9
 
+def build_foe_stats(player: Player, mimic: bytes | None = None) -> None:
+    """Apply passive bonuses for foe characters based on their traits.
 
-def build_foe_stats(player: Player) -> None:
-    """Apply passive bonuses for foe characters based on their traits."""
+    ``mimic`` is the save (see :meth:`player.Player.save_data`) a Mimic foe
+    copies. Without it the Mimic reads ``lives/Player.dat``.
+    """
     _apply_high_level_lady(player)
-    _apply_themed_name_modifiers(player)
+    _apply_themed_name_modifiers(player, mimic)
     _apply_themed_adj_modifiers(player)
 
 
@@ -69,27 +158,11 @@ def build_foe_stats(player: Player) -> None:
 def _apply_high_level_lady(player: Player) -> None:
     """Boost high-level "Lady" foes with extra stats."""
     if player.level > 2500:
-        if "lady" in player.PlayerName.lower():
-
-            if "light" in player.PlayerName.lower():
-                player.Regain *= 2
-                player.Mitigation += 4
-                player.Vitality *= 1.5
-
-            if "dark" in player.PlayerName.lower():
-                player.Regain /= 2
-                player.Mitigation /= 5
-                player.Vitality *= 2.5
+        traits = player.traits
 
-            if "fire" in player.PlayerName.lower():
-                player.Regain /= 2
-                player.Mitigation *= 2
-                player.Atk *= 4
-
-            if "ice" in player.PlayerName.lower():
-                player.Regain *= 2
-                player.Mitigation *= 5
-                player.Vitality *= 2.5
+        if traits.lady:
+            for element in traits.elements:
+                LADY_MODIFIERS[element](player)
 
             player.MHP *= 10
             player.Atk *= 2
@@ -99,423 +172,175 @@ def _apply_high_level_lady(player: Player) -> None:
             player.EffectRES += 2
 
 
-def _apply_themed_name_modifiers(player: Player) -> None:
-    """Tweak foe stats based on specific character names."""
-    if themed_names[0] in player.PlayerName.lower():
-        dodge_buff = 0.35
-        max_hp_debuff = player.MHP / 4
-
-        while player.MHP > max_hp_debuff:
-            dodge_buff = dodge_buff + (0.001 * player.Vitality)
-            player.MHP = player.MHP - 1
-
-        player.Atk = int(player.Atk * 1)
-        player.Def = int(player.Def * 2)
-        player.gain_crit_rate(0.00001 * player.level)
-        player.DodgeOdds += dodge_buff * player.Vitality
-
-    if themed_names[1] in player.PlayerName.lower():
-        def_to_add = 10000
-
-        player.MHP *= 10
-        player.Mitigation *= 10
-        player.EffectRES += 255
-
-        max_hp_debuff = max(player.MHP - random.randint(5 * player.level, 15 * player.level), 10)
-        max_crit_rate = player.CritRate / 100
-        max_atk_stat = round(player.Atk * 0.95)
-        item_buff = random.uniform(0.4, 0.9)
-
-        while player.Vitality > max(0.2, player.Vitality / player.level):
-            item_buff += random.uniform(0.01, 0.3)
-            player.Vitality = player.Vitality - 0.001
-
-        while player.MHP > max_hp_debuff:
-            player.Def += player.check_base_stats(player.Def, def_to_add)
-            player.MHP = player.MHP - 1
-
-        while player.CritRate > max_crit_rate:
-            player.Def += player.check_base_stats(player.Def, def_to_add)
-            player.CritRate -= player.CritRate / 15
-
-        while player.Atk > max_atk_stat:
-            player.Def += player.check_base_stats(player.Def, def_to_add)
-            player.Atk = player.Atk - 1
-
-        while player.Regain > 5:
-            player.Def += player.check_base_stats(player.Def, def_to_add)
-            player.Regain = player.Regain - 0.001
-
-        player.Atk = int(player.Atk) + 1
-        player.Def += player.check_base_stats(player.Def, int(player.Def * player.level) + 1)
-
-        player.gain_crit_damage((0.0002 * player.level))
-
-        while player.Def > 25000:
-            item_buff += random.uniform(0.05, 0.25)
-            player.Def = player.Def - 5
-        
-        for item in player.Items:
-            item.name = "Carly\'s Blessing of Defense"
-            item.power += player.level * item_buff
-        
-    if themed_names[2] in player.PlayerName.lower():
-        player.MHP = int(player.MHP * 15)
-        player.Atk = int(player.Atk * 8)
-        player.CritRate = player.CritRate / 1000
-
-    if themed_names[4] in player.PlayerName.lower():
-        player.Atk = int(player.Atk * 1.5)
-        player.Def = int(player.Def * 0.5) + 1
-        player.gain_crit_rate(1)
-        player.CritDamageMod = player.CritDamageMod * ((0.035 * player.level) + 1)
-
-    if themed_names[5] in player.PlayerName.lower():
-        player.Vitality = player.Vitality + (0.0001 * player.level)
-
-    if themed_names[6] in player.PlayerName.lower():
-        tempname = player.PlayerName
-        player.PlayerName = "Player"
-        player.load()
-        player.isplayer = False
-        player.HOTS = []
-        player.MHP = int(player.MHP / ((10000 * player.level) + 1))
-        player.Atk = int(player.Atk / 5)
-        player.Def = int(player.Def / 4)
-        player.Regain = player.Regain / 5
-        player.DodgeOdds = 0
-        player.Vitality -= player.Vitality / 4
-
-        if player.Vitality > 1:
-            player.Vitality = 1
-
-        if player.Mitigation > 1:
-            player.Mitigation = 1
-
-        player.PlayerName = tempname
-
-    if themed_names[7] in player.PlayerName.lower():
-        player.MHP = int(player.MHP * 150)
-
-    if themed_names[9] in player.PlayerName.lower():
-        for item in player.Items:
-            item.name = "Bubbles\'s Blessing of Damage, Defense, and Utility"
-            item.power += (player.level * 0.0003)
+def _lady_light(player: Player) -> None:
+    player.Regain *= 2
+    player.Mitigation += 4
+    player.Vitality *= 1.5
 
 
-def _apply_themed_adj_modifiers(player: Player) -> None:
-    """Apply adjective-based modifiers to foes."""
-    if themed_ajt[0] in player.PlayerName.lower():  # atrocious
-        player.MHP = int(player.MHP * 1.9)
-        player.Atk = int(player.Atk * 1.1)
-
-    if themed_ajt[1] in player.PlayerName.lower(): # baneful
-        player.Atk = int(player.Atk * 1.95)
-        player.CritDamageMod = player.CritDamageMod * 1.05
-
-    if themed_ajt[2] in player.PlayerName.lower(): # barbaric
-        player.MHP = int(player.MHP * 1.1)
-        player.Def = int(player.Def * 1.9)
-
-    if themed_ajt[3] in player.PlayerName.lower(): # beastly
-        player.MHP = int(player.MHP * 1.05)
-        player.Atk = int(player.Atk * 1.05)
-
-    if themed_ajt[4] in player.PlayerName.lower(): # belligerent
-        player.DodgeOdds = player.DodgeOdds * 1.9
-        player.Atk = int(player.Atk * 1.1)
-
-    if themed_ajt[5] in player.PlayerName.lower(): # bloodthirsty
-        player.MHP = int(player.MHP - (player.MHP * 0.1))
-        player.Atk = int(player.Atk + (player.Atk * 0.2))
+def _lady_dark(player: Player) -> None:
+    player.Regain /= 2
+    player.Mitigation /= 5
+    player.Vitality *= 2.5
 
-    if themed_ajt[6] in player.PlayerName.lower(): # brutal
-        player.CritRate = player.CritRate + 0.1
-        player.DodgeOdds = player.DodgeOdds * 1.9
 
-    if themed_ajt[7] in player.PlayerName.lower(): # callous
-        player.Def = int(player.Def * 1.1)
-        player.DodgeOdds = player.DodgeOdds * 1.9
+def _lady_fire(player: Player) -> None:
+    player.Regain /= 2
+    player.Mitigation *= 2
+    player.Atk *= 4
 
-    if themed_ajt[8] in player.PlayerName.lower(): # cannibalistic
-        player.MHP = int(player.MHP + (player.MHP * 0.05))
 
-    if themed_ajt[9] in player.PlayerName.lower(): # cowardly
-        player.MHP = int(player.MHP * 1.2)
-        player.Atk = int(player.Atk * 0.8)
+def _lady_ice(player: Player) -> None:
+    player.Regain *= 2
+    player.Mitigation *= 5
+    player.Vitality *= 2.5
 
-    if themed_ajt[10] in player.PlayerName.lower(): # cruel
-        player.CritDamageMod = player.CritDamageMod * 1.05
 
-    if themed_ajt[11] in player.PlayerName.lower(): # cunning
-        player.DodgeOdds = player.DodgeOdds * 1.1
+LADY_MODIFIERS = {
+    "light": _lady_light,
+    "dark": _lady_dark,
+    "fire": _lady_fire,
+    "ice": _lady_ice,
+}
 
-    if themed_ajt[12] in player.PlayerName.lower(): # dangerous
-        player.Atk = int(player.Atk * 1.05)
-        player.CritRate = player.CritRate + 0.05
 
-    if themed_ajt[13] in player.PlayerName.lower(): # demonic
-        player.MHP = int(player.MHP * 1.9)
-        player.Atk = int(player.Atk * 1.15)
-
-    if themed_ajt[14] in player.PlayerName.lower(): # depraved
-        player.Def = int(player.Def - (player.Def * 0.1))
-        player.Atk = int(player.Atk + (player.Atk * 0.1))
-
-    if themed_ajt[15] in player.PlayerName.lower(): # destructive
-        player.Atk = int(player.Atk * 1.1)
-        player.CritRate = player.CritRate + 0.05
-
-    if themed_ajt[16] in player.PlayerName.lower(): # diabolical
-        player.Atk = int(player.Atk * 1.1)
-        player.DodgeOdds = player.DodgeOdds * 1.9
+def _apply_themed_name_modifiers(player: Player, mimic: bytes | None = None) -> None:
+    """Tweak foe stats based on specific character names."""
+    for character in player.traits.characters:
+        if character == "mimic":
+            _mimic(player, mimic)
+        elif character in NAME_MODIFIERS:
+            NAME_MODIFIERS[character](player)
 
-    if themed_ajt[17] in player.PlayerName.lower(): # disgusting
-        player.Def = int(player.Def * 1.9)
 
-    if themed_ajt[18] in player.PlayerName.lower(): # dishonorable
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
+def _luna(player: Player) -> None:
+    dodge_buff = shed_hp_for_dodge(player, 0.35)
 
-    if themed_ajt[19] in player.PlayerName.lower(): # dreadful
-        player.Atk = int(player.Atk * 1.05)
+    player.Atk = int(player.Atk * 1)
+    player.Def = int(player.Def * 2)
+    player.gain_crit_rate(0.00001 * player.level)
+    player.DodgeOdds += dodge_buff * player.Vitality
 
-    if themed_ajt[20] in player.PlayerName.lower(): # eerie
-        player.DodgeOdds = player.DodgeOdds * 1.05
 
-    if themed_ajt[21] in player.PlayerName.lower(): # evil
-        player.MHP = int(player.MHP * 1.95)
-        player.Atk = int(player.Atk * 1.05)
+def _carly(player: Player) -> None:
+    def_to_add = 10000
 
-    if themed_ajt[22] in player.PlayerName.lower(): # execrable
-        player.MHP = int(player.MHP * 1.9)
+    player.MHP *= 10
+    player.Mitigation *= 10
+    player.EffectRES += 255
 
-    if themed_ajt[23] in player.PlayerName.lower(): # fiendish
-        player.DodgeOdds = player.DodgeOdds * 1.9
-        player.CritRate = player.CritRate + 0.1
+    max_hp_debuff = max(player.MHP - player.rng.randint(5 * player.level, 15 * player.level), 10)
+    max_crit_rate = player.CritRate / 100
+    max_atk_stat = round(player.Atk * 0.95)
+    item_buff = player.rng.uniform(0.4, 0.9)
 
-    if themed_ajt[24] in player.PlayerName.lower(): # filthy
-        player.Def = int(player.Def * 1.95)
+    # Above level 1, Vitality is always above Vitality / level, so only
+    # the 0.2 floor stops the trade.
+    vitality_steps = steps_above(player.Vitality, 0.2, 0.001) if player.level > 1 else 0
+    item_buff += uniform_sum(player.rng, vitality_steps, 0.01, 0.3)
+    player.Vitality = player.Vitality - (vitality_steps * 0.001)
 
-    if themed_ajt[25] in player.PlayerName.lower(): # foul
-        player.Def = int(player.Def * 1.95)
-        player.DodgeOdds = player.DodgeOdds * 1.95
+    # Every MHP, crit rate, Atk and Regain step buys the same Def gain.
+    def_steps = steps_above(player.MHP, max_hp_debuff)
+    player.MHP = player.MHP - def_steps
 
-    if themed_ajt[26] in player.PlayerName.lower(): # frightening
-        player.Atk = int(player.Atk * 1.05)
-        player.DodgeOdds = player.DodgeOdds * 1.95
+    while player.CritRate > max_crit_rate:
+        def_steps += 1
+        player.CritRate -= player.CritRate / 15
 
-    if themed_ajt[27] in player.PlayerName.lower(): # ghastly
-        player.MHP = int(player.MHP * 1.95)
-        player.DodgeOdds = player.DodgeOdds * 1.05
+    atk_steps = steps_above(player.Atk, max_atk_stat)
+    player.Atk = player.Atk - atk_steps
 
-    if themed_ajt[28] in player.PlayerName.lower(): # ghoulish
-        player.MHP = int(player.MHP * 1.95)
-        player.Atk = int(player.Atk * 1.05)
+    regain_steps = steps_above(player.Regain, 5, 0.001)
+    player.Regain = player.Regain - (regain_steps * 0.001)
 
-    if themed_ajt[29] in player.PlayerName.lower(): # gruesome
-        player.Atk = int(player.Atk * 1.05)
-        player.CritDamageMod = player.CritDamageMod * 1.05
+    player.Def = base_stat_after(player, player.Def, def_to_add, def_steps + atk_steps + regain_steps)
 
-    if themed_ajt[30] in player.PlayerName.lower(): # heinous
-        player.Atk = int(player.Atk * 1.1)
-        player.CritDamageMod = player.CritDamageMod * 1.1
+    player.Atk = int(player.Atk) + 1
+    player.Def += player.check_base_stats(player.Def, int(player.Def * player.level) + 1)
 
-    if themed_ajt[31] in player.PlayerName.lower(): # hideous
-        player.Def = int(player.Def * 1.9)
-        player.MHP = int(player.MHP * 1.1)
+    player.gain_crit_damage((0.0002 * player.level))
 
-    if themed_ajt[32] in player.PlayerName.lower(): # homicidal
-        player.Atk = int(player.Atk * 1.15)
+    def_steps = steps_above(player.Def, 25000, 5)
+    item_buff += uniform_sum(player.rng, def_steps, 0.05, 0.25)
+    player.Def = player.Def - (def_steps * 5)
 
-    if themed_ajt[33] in player.PlayerName.lower(): # horrible
-        player.Atk = int(player.Atk * 1.02)
-        player.CritRate = player.CritRate + 0.02
+    for item in player.Items:
+        item.name = "Carly\'s Blessing of Defense"
+        item.power += player.level * item_buff
 
-    if themed_ajt[34] in player.PlayerName.lower(): # hostile
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
 
-    if themed_ajt[35] in player.PlayerName.lower(): # inhumane
-        player.CritDamageMod = player.CritDamageMod * 1.1
+def _becca(player: Player) -> None:
+    player.MHP = int(player.MHP * 15)
+    player.Atk = int(player.Atk * 8)
+    player.CritRate = player.CritRate / 1000
 
-    if themed_ajt[36] in player.PlayerName.lower(): # insidious
-        player.Atk = int(player.Atk * 1.05)
-        player.DodgeOdds = player.DodgeOdds * 1.05
 
-    if themed_ajt[37] in player.PlayerName.lower(): # intimidating
-        player.Atk = int(player.Atk * 1.95)
-        player.Def = int(player.Def * 1.05)
+def _hilander(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.5)
+    player.Def = int(player.Def * 0.5) + 1
+    player.gain_crit_rate(1)
+    player.CritDamageMod = player.CritDamageMod * ((0.035 * player.level) + 1)
 
-    if themed_ajt[38] in player.PlayerName.lower(): # malevolent
-        player.CritDamageMod = player.CritDamageMod * 1.05
-        player.DodgeOdds = player.DodgeOdds * 1.95
 
-    if themed_ajt[39] in player.PlayerName.lower(): # malicious
-        player.Atk = int(player.Atk * 1.07)
+def _chibi(player: Player) -> None:
+    player.Vitality = player.Vitality + (0.0001 * player.level)
 
-    if themed_ajt[40] in player.PlayerName.lower(): # monstrous
-        player.MHP = int(player.MHP * 1.1)
-        player.Atk = int(player.Atk * 1.1)
 
-    if themed_ajt[41] in player.PlayerName.lower(): # murderous
-        player.CritRate = player.CritRate + 0.15
+def _mimic(player: Player, mimic: bytes | None = None) -> None:
+    tempname = player.PlayerName
+    player.PlayerName = "Player"
+    player.load(mimic)
+    player.isplayer = False
+    player.HOTS = []
+    player.MHP = int(player.MHP / ((10000 * player.level) + 1))
+    player.Atk = int(player.Atk / 5)
+    player.Def = int(player.Def / 4)
+    player.Regain = player.Regain / 5
+    player.DodgeOdds = 0
+    player.Vitality -= player.Vitality / 4
 
-    if themed_ajt[42] in player.PlayerName.lower(): # nasty
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
-        player.DodgeOdds = player.DodgeOdds * 1.95
+    if player.Vitality > 1:
+        player.Vitality = 1
 
-    if themed_ajt[43] in player.PlayerName.lower(): # nefarious
-        player.CritRate = player.CritRate + 0.05
-        player.CritDamageMod = player.CritDamageMod * 1.05
+    if player.Mitigation > 1:
+        player.Mitigation = 1
 
-    if themed_ajt[44] in player.PlayerName.lower(): # noxious
-        player.Atk = int(player.Atk * 1.05)
-        player.MHP = int(player.MHP * 1.95)
+    player.PlayerName = tempname
 
-    if themed_ajt[45] in player.PlayerName.lower(): # obscene
-        player.Def = int(player.Def * 1.9)
-        player.DodgeOdds = player.DodgeOdds * 1.9
 
-    if themed_ajt[46] in player.PlayerName.lower(): # odious
-        player.Def = int(player.Def * 1.95)
+def _mezzy(player: Player) -> None:
+    player.MHP = int(player.MHP * 150)
 
-    if themed_ajt[47] in player.PlayerName.lower(): # ominous
-        player.CritRate = player.CritRate + 0.02
-        player.CritDamageMod = player.CritDamageMod * 1.03
 
-    if themed_ajt[48] in player.PlayerName.lower(): # pernicious
-        player.MHP = int(player.MHP * 1.95)
-        player.CritRate = player.CritRate + 0.05
+def _bubbles(player: Player) -> None:
+    for item in player.Items:
+        item.name = "Bubbles\'s Blessing of Damage, Defense, and Utility"
+        item.power += (player.level * 0.0003)
 
-    if themed_ajt[49] in player.PlayerName.lower(): # perverted
-        player.Def = int(player.Def * 1.9)
-        player.DodgeOdds = player.DodgeOdds * 1.1
 
-    if themed_ajt[50] in player.PlayerName.lower(): # poisonous
-        player.Atk = int(player.Atk * 1.07)
-        player.MHP = int(player.MHP * 1.93)
+NAME_MODIFIERS = {
+    "luna": _luna,
+    "carly": _carly,
+    "becca": _becca,
+    "hilander": _hilander,
+    "chibi": _chibi,
+    "mezzy": _mezzy,
+    "bubbles": _bubbles,
+}
 
-    if themed_ajt[51] in player.PlayerName.lower(): # predatory
-        player.DodgeOdds = player.DodgeOdds * 1.1
-        player.CritRate = player.CritRate + 0.05
 
-    if themed_ajt[52] in player.PlayerName.lower(): # premeditated
-        player.CritRate = player.CritRate + 0.1
+def _apply_themed_adj_modifiers(player: Player) -> None:
+    """Apply adjective-based modifiers to foes."""
+    adjective_modifier(player.traits.adjectives).apply(player)
 
-    if themed_ajt[53] in player.PlayerName.lower(): # primal
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
-        player.MHP = int(player.MHP * 1.05)
 
-    if themed_ajt[54] in player.PlayerName.lower(): # primitive
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
+@functools.lru_cache(maxsize=256)
+def adjective_modifier(adjectives: tuple[str, ...]) -> StatModifier:
+    """The compiled modifiers of ``adjectives``, chained in order."""
+    modifier = IDENTITY
 
-    if themed_ajt[55] in player.PlayerName.lower(): # profane
-        player.MHP = int(player.MHP * 1.9)
-        player.CritDamageMod = player.CritDamageMod * 1.1
+    for adjective in adjectives:
+        modifier = modifier.then(ADJECTIVE_MODIFIERS[adjective])
 
-    if themed_ajt[56] in player.PlayerName.lower(): # psychopathic
-        player.DodgeOdds = player.DodgeOdds * 1.9
-        player.Atk = int(player.Atk * 1.1)
-        player.CritDamageMod = player.CritDamageMod * 1.1
-
-    if themed_ajt[57] in player.PlayerName.lower(): # rabid
-        player.Atk = int(player.Atk * 1.1)
-        player.Def = int(player.Def * 1.9)
-
-    if themed_ajt[58] in player.PlayerName.lower(): # relentless
-        player.DodgeOdds = player.DodgeOdds * 1.9
-        player.Atk = int(player.Atk * 1.05)
-        player.CritRate = player.CritRate + 0.05
-
-    if themed_ajt[59] in player.PlayerName.lower(): # repulsive
-        player.Def = int(player.Def * 1.9)
-        player.DodgeOdds = player.DodgeOdds * 1.1
-
-    if themed_ajt[60] in player.PlayerName.lower(): # ruthless
-        player.CritDamageMod = player.CritDamageMod * 1.15
-
-    if themed_ajt[61] in player.PlayerName.lower(): # sadistic
-        player.Atk = int(player.Atk * 1.02)
-        player.CritDamageMod = player.CritDamageMod * 1.08
-
-    if themed_ajt[62] in player.PlayerName.lower(): # savage
-        player.Atk = int(player.Atk * 1.1)
-        player.Def = int(player.Def * 1.9)
-        player.MHP = int(player.MHP * 1.1)
-
-    if themed_ajt[63] in player.PlayerName.lower(): # scary
-        player.Atk = int(player.Atk * 1.95)
-        player.DodgeOdds = player.DodgeOdds * 1.05
-        player.CritDamageMod = player.CritDamageMod * 1.05
-
-    if themed_ajt[64] in player.PlayerName.lower(): # sinister
-        player.DodgeOdds = player.DodgeOdds * 1.05
-        player.CritDamageMod = player.CritDamageMod * 1.05
-
-    if themed_ajt[65] in player.PlayerName.lower(): # sociopathic
-        player.DodgeOdds = player.DodgeOdds * 1.9
-        player.Atk = int(player.Atk * 1.15)
-
-    if themed_ajt[66] in player.PlayerName.lower(): # spiteful
-        player.Atk = int(player.Atk * 1.07)
-        player.MHP = int(player.MHP * 1.93)
-
-    if themed_ajt[67] in player.PlayerName.lower(): # squalid
-        player.Def = int(player.Def * 1.95)
-        player.MHP = int(player.MHP * 1.05)
-
-    if themed_ajt[68] in player.PlayerName.lower(): # terrifying
-        player.Atk = int(player.Atk * 1.9)
-        player.Def = int(player.Def * 1.1)
-
-    if themed_ajt[69] in player.PlayerName.lower(): # threatening
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
-        player.DodgeOdds = player.DodgeOdds * 1.95
-
-    if themed_ajt[70] in player.PlayerName.lower(): # treacherous
-        player.Atk = int(player.Atk * 1.05)
-        player.DodgeOdds = player.DodgeOdds * 1.05
-        player.CritRate = player.CritRate + 0.05
-
-    if themed_ajt[71] in player.PlayerName.lower(): # ugly
-        player.Def = int(player.Def * 1.1)
-        player.MHP = int(player.MHP * 1.9)
-
-    if themed_ajt[72] in player.PlayerName.lower(): # unholy
-        player.MHP = int(player.MHP * 5)
-        player.Atk = int(player.Atk * 2)
-        player.CritDamageMod = player.CritDamageMod * 0.8
-
-    if themed_ajt[73] in player.PlayerName.lower(): # venomous
-        player.Atk = int(player.Atk * 1.1)
-        player.MHP = int(player.MHP * 1.9)
-
-    if themed_ajt[74] in player.PlayerName.lower(): # vicious
-        player.Atk = int(player.Atk * 1.1)
-        player.CritRate = player.CritRate + 0.05
-
-    if themed_ajt[75] in player.PlayerName.lower(): # villainous
-        player.Atk = int(player.Atk * 1.05)
-        player.DodgeOdds = player.DodgeOdds * 1.95
-        player.CritRate = player.CritRate + 0.05
-
-    if themed_ajt[76] in player.PlayerName.lower(): # violent
-        player.Atk = int(player.Atk * 1.15)
-        player.Def = int(player.Def * 0.85)
-
-    if themed_ajt[77] in player.PlayerName.lower(): # wicked
-        player.Atk = int(player.Atk * 1.08)
-        player.CritDamageMod = player.CritDamageMod * 1.02
-
-    if themed_ajt[78] in player.PlayerName.lower(): # wrongful
-        player.Atk = int(player.Atk * 1.05)
-        player.Def = int(player.Def * 1.95)
-        player.CritDamageMod = player.CritDamageMod * 1.05
-
-    if themed_ajt[79] in player.PlayerName.lower(): # xenophobic
-        player.Def = int(player.Def * 1.1)
+    return modifier
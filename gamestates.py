@@ -9,25 +9,25 @@ from halo import Halo
 
 from screendata import Screen
 
-from timerhelper import timmer
-
-from damagestate import check_passive_mod
+from autofighter.sim.battle import Battle, WON, LOST
+from autofighter.sim.foe_cache import FoeCache
+from autofighter.sim.pacing import FramePacer
+from autofighter.sim.roster import RosterPool
+from autofighter.sim.replay import ReplayWriter
+from autofighter.sim.wave import NUMBER_OF_FOES, WavePipeline, build_wave, mimic_source, wave_level
 
 from load_photos import set_bg_photo
 from load_photos import set_bg_music
 from load_photos import resource_path
 
-from themedstuff import themed_ajt
 from themedstuff import themed_names
 
-from damagetypes import all_damage_types, Generic
+from damagetypes import all_damage_types
 
 from typing import Tuple
 
 from colorama import Fore, Style
 
-from damage_over_time import dot as damageovertimetype
-
 spinner = Halo(text='Loading', spinner='dots', color='green')
     
 red = Fore.RED
@@ -42,55 +42,34 @@ SCREEN_HEIGHT = 900
 photo_size = 128 * 3
 
 CONFIG_FILE = "config.json"
-
-enrage_timer = timmer()
+REPLAY_FILE = "last_wave.afr"
 
 def log(color, text):
     print(color + text + Style.RESET_ALL)
     return text
 
-def debug_log(filename, text):
-    with open(filename, "a") as f:
-        f.write(f"\n{text}")
-    
-    return text
+def load_foe_photo(foe):
+    try:
+        foe.photodata = pygame.image.load(os.path.join(foe.photo))
+        foe.photodata = pygame.transform.flip(foe.photodata, True, False)
+        foe.photodata = pygame.transform.scale(foe.photodata, (photo_size, photo_size))
+    except FileNotFoundError as e:
+        print(f"Error loading image: {e}")
+
+def wait_a_frame(pygame, clock):
+    pygame.display.flip()
+    clock.tick(10)
+
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
 
 def kill_person(dead, killer):
     if dead.isplayer:
         spinner.fail(text=f"Your {dead.Type.colorama_color}{dead.PlayerName}{white} at {blue}{dead.level}{white} kill by {killer.Type.colorama_color}{killer.PlayerName}{white}")
     else:
         spinner.succeed(text=f"The {dead.Type.colorama_color}{dead.PlayerName}{white} at {blue}{dead.level}{white} kill by {killer.Type.colorama_color}{killer.PlayerName}{white}")
-        return
-
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"{killer.PlayerName} killed {dead.PlayerName}, Below are stats for both...")
-
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Dead Person")
-
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Name: {dead.PlayerName}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Level: {dead.level}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"MHP: {dead.MHP}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"HP: {dead.HP}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Defense: {dead.Def}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Attack: {dead.Atk}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Regain: {dead.Regain}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"True Vitality: {dead.Vitality}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Crit Rate: {dead.CritRate}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Crit Damage Modifier: {dead.CritDamageMod}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Dodge Odds: {dead.DodgeOdds}")
-    
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Killer")
-
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Name: {killer.PlayerName}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Level: {killer.level}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"MHP: {killer.MHP}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"HP: {killer.HP}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Defense: {killer.Def}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Attack: {killer.Atk}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Regain: {killer.Regain}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"True Vitality: {killer.Vitality}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Crit Rate: {killer.CritRate}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Crit Damage Modifier: {killer.CritDamageMod}")
-    debug_log(os.path.join("logs", f"{dead.PlayerName.lower()}.txt"), f"Dodge Odds: {killer.DodgeOdds}")
 
 def load_config():
     """Loads the configuration from config.json."""
@@ -105,12 +84,37 @@ def load_config():
         print(f"Error decoding JSON from {CONFIG_FILE}. Using default settings.")
         return {"preferred_allies": []}  # Default empty list
 
+def render_battle(pygame, screen, background_image, battle: Battle, render_player_obj):
+    """Draw the current state of ``battle``; never advances the simulation."""
+    battle.sync_action_points()
+
+    screen.fill((0, 0, 0))
+    screen.blit(background_image, (0, 0))
+
+    foe_top = 10
+    player_bottom = 620
+    photo_offset = 15
+    side_offset = 15
+    srink_setting = 0.95
+    item_total_size = photo_size - (photo_size / 4)
+    player_size = (item_total_size * srink_setting, item_total_size * srink_setting)
+    foe_size = (item_total_size * srink_setting, item_total_size * srink_setting)
+
+    for i, foe in enumerate(battle.foelist):
+        if foe.HP > 1:
+            item_total_position = ((photo_offset * i) + (side_offset + (item_total_size * i)), foe_top)
+            render_player_obj(pygame, foe, foe.photodata, screen, battle.enrage_timer, battle.def_mod, battle.bleed_mod, item_total_position, foe_size, True)
+
+    for i, person in enumerate(battle.playerlist):
+        if person.HP > 1:
+            item_total_position = ((photo_offset * i) + (side_offset + (item_total_size * i)), player_bottom)
+            render_player_obj(pygame, person, person.photodata, screen, battle.enrage_timer, battle.def_mod, battle.bleed_mod, item_total_position, player_size, True)
+
 def main(level):
     from player import Player
     from player import render_player_obj
 
     running = True
-    is_deading = False
 
     wave_number = 0
 
@@ -220,6 +224,13 @@ def main(level):
     pygame.display.set_caption("Midori AI Auto Fighter", "Welcome to the fighting zone!")
 
     clock = pygame.time.Clock()
+    pacer = FramePacer.from_config(config)
+    roster_pool = RosterPool()
+    # Only the pipeline's single worker builds waves, so it can share one cache.
+    foe_cache = FoeCache()
+    replay = None
+    os.makedirs("logs", exist_ok=True)
+    wave_pipeline = WavePipeline(lambda next_level, mimic=None: build_wave(next_level, load_photo=load_foe_photo, rng=random.Random(), pool=roster_pool, mimic=mimic, cache=foe_cache))
 
     font = pygame.font.SysFont('Arial', 44)
 
@@ -244,10 +255,7 @@ def main(level):
 
     while True:
 
-        level_sum = 0
         wave_number += 1
-        foelist: list[Player] = []
-        backup_foes_list: list[Player] = []
         
         spinner.start(text=f"Wave :: {wave_number} :: Loading...")
 
@@ -255,111 +263,53 @@ def main(level):
             player.DamageDealt = 0
             player.DamageTaken = 0
 
-            level_sum += player.level
-
-        level = round((level_sum + foes_killed) / (len(playerlist)))
+        level = wave_level(playerlist, foes_killed)
 
         if level < max(round(past_level / 2) - 10, 1):
             level = random.randint(max(round(past_level / 2) - 10, 1), round(past_level / 2) + 10)
         else:
             past_level = level
 
-        number_of_foes = 4
-        foes_killed += number_of_foes
-
-        temp_foe_themed_names: list[str] = []
-
-        for item in themed_names:
-            temp_foe_themed_names.append(item)
-        
-        random.shuffle(temp_foe_themed_names)
-
-        if level < 1000:
-            temp_foe_themed_names.remove("Carly".lower())
-
-        if level < 2000:
-            temp_foe_themed_names.remove("Mezzy".lower())
-            temp_foe_themed_names.remove("Mimic".lower())
-
-        if level < 10000:
-            temp_foe_themed_names.remove("Luna".lower())
-
-        for i in range(number_of_foes):
-            themed_name = random.choice(temp_foe_themed_names).capitalize()
-            temp_foe_themed_names.remove(themed_name.lower())
-            themed_title = random.choice(themed_ajt).capitalize()
-
-            foe_pre_name = f"{themed_title} {themed_name.replace("_", " ")}"
-
-            foe = Player(f"{foe_pre_name}")
-            foe.set_photo(themed_name.lower())
-            
-            foelist.append(foe)
-        
-        while len(temp_foe_themed_names) > 0:
-            themed_name = random.choice(temp_foe_themed_names).capitalize()
-            temp_foe_themed_names.remove(themed_name.lower())
-            themed_title = random.choice(themed_ajt).capitalize()
+        foes_killed += NUMBER_OF_FOES
 
-            foe_pre_name = f"{themed_title} {themed_name.replace("_", " ")}"
-
-            foe = Player(f"{foe_pre_name}")
-            foe.set_photo(themed_name.lower())
-
-            backup_foes_list.append(foe)
-
-        threads = []
-
-        all_foes = foelist + backup_foes_list
         all_allys = playerlist + backup_players_list
 
-        for foe in all_foes:
-            thread = threading.Thread(target=foe.set_level, args=(random.randint(max(level - 10, 1), level + 55),))
-            threads.append(thread)
-            thread.start()
+        # Snapshot the Player for Mimics before the level-up below starts
+        # rewriting its save.
+        wave_future = wave_pipeline.request(level, mimic=mimic_source(all_allys))
 
-            if level > 20000:
-                thread = threading.Thread(target=foe.load_past_lives)
-                threads.append(thread)
-                thread.start()
-
-        for player in all_allys:
-            thread = threading.Thread(target=player.level_up)
-            threads.append(thread)
-            thread.start()
+        threads = []
 
-        for player in all_allys:
-            thread = threading.Thread(target=player.save)
-            threads.append(thread)
-            thread.start()
+        thread = threading.Thread(target=roster_pool.level_up, args=(all_allys,))
+        threads.append(thread)
+        thread.start()
 
         for thread in threads:
             while thread.is_alive():
+                wait_a_frame(pygame, clock)
 
-                pygame.display.flip()
-                clock.tick(10)
+            thread.join()
 
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
+        while not wave_future.done():
+            wait_a_frame(pygame, clock)
 
-            thread.join()
+        wave = wave_future.result()
+        foelist = wave.foelist
+        backup_foes_list = wave.backup_foes_list
 
-        for foe in all_foes:
-            try:
-                foe.photodata = pygame.image.load(os.path.join(foe.photo))
-                foe.photodata = pygame.transform.flip(foe.photodata, True, False)
-                foe.photodata = pygame.transform.scale(foe.photodata, (photo_size, photo_size))
-            except FileNotFoundError as e:
-                print(f"Error loading image: {e}")
-        
         spinner.succeed(text=f"Wave :: {wave_number} :: Fully Loaded")
 
         player.HP = player.MHP
 
-        enrage_timer.reset()
-        enrage_timer.start()
+        if replay is not None:
+            replay.close()
+
+        replay = ReplayWriter.open(os.path.join("logs", REPLAY_FILE))
+        battle = Battle(playerlist, foelist, backup_players_list, backup_foes_list, level, on_kill=kill_person, recorder=replay)
+
+        # Party levels only change between waves, so the next level is known
+        # now unless someone dies or the level drop rule kicks in.
+        wave_pipeline.prefetch(wave_level(playerlist, foes_killed), mimic=mimic_source(all_allys))
 
         # Main game loop
         while running:
@@ -368,7 +318,7 @@ def main(level):
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_d: 
-                    is_deading = True
+                    battle.is_deading = True
 
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_b:  
                     for player in foelist:
@@ -379,181 +329,28 @@ def main(level):
                         if player.PlayerName.lower() == "player":
                             player.Type = random.choice(all_damage_types)
 
-            enrage_timer.tick()
-            enrage_timer.check_timeout()
-            
             fps = clock.get_fps()
 
-            enrage_mod = enrage_timer.get_timeout_duration()
-            level_base_enrage_mod = (level / max(min(level / 1000, 10000), 2))
-            player_base_enrage_mod = (enrage_mod * level_base_enrage_mod)
-            foe_base_enrage_mod = (enrage_mod * level_base_enrage_mod)
-
-            if enrage_mod > 10:
-                buffed_starter = ((enrage_mod - 10) * 0.0000004) + ((enrage_mod - 5) * 0.0000002)
-                bleed_mod = ((0.0000002 + buffed_starter) * (player_base_enrage_mod * foe_base_enrage_mod)) + 1
-            elif enrage_mod > 5:
-                buffed_starter = ((enrage_mod - 5) * 0.0000002)
-                bleed_mod = ((0.0000002 + buffed_starter) * (player_base_enrage_mod * foe_base_enrage_mod)) + 1
-            else:
-                bleed_mod = (0.0000002 * (player_base_enrage_mod * foe_base_enrage_mod)) + 1
-
-            def_mod = max(1, (bleed_mod * 0.0005))
-
-            if bleed_mod > 1.2:
-                def_mod = max(1, (bleed_mod * 0.002) + (bleed_mod * 0.002) + (bleed_mod * 0.001) + 1)
-            
-            if bleed_mod > 2:
-                def_mod = max(1, (bleed_mod * 0.004) + (bleed_mod * 0.004) + (bleed_mod * 0.002) + 1)
-            
-            if is_deading:
-                for player in playerlist:
-                    player.save_past_life()
-                    playerlist.remove(player)
-            
-            for player in playerlist:
-                if player.HP < 1:
-                    player.save_past_life()
-                    playerlist.remove(player)
-            
-            for foe in foelist:
-                if foe.HP < 1:
-                    foelist.remove(foe)
-
-            if len(playerlist) < 5:
-                if len(backup_players_list) > 1:
-                    new_player = random.choice(backup_players_list)
-                    backup_players_list.remove(new_player)
-                    playerlist.append(new_player)
-
-            if len(foelist) < 5:
-                if len(backup_foes_list) > 0:
-                    new_player = random.choice(backup_foes_list)
-                    backup_foes_list.remove(new_player)
-                    foelist.append(new_player)
-
-            enrage_dot = damageovertimetype("Enrage Bleed", min(5000, (bleed_mod ** 5) * level), max(300, min(6000, round(25 * bleed_mod))), Generic, "Enrage Mech", 1)
-
-            fps_cap = 65
-    
-            # Render the screen
-            screen.fill((0, 0, 0))
-            screen.blit(background_image, (0, 0))
-
-            foe_top = 10
-            player_bottom = 620
-            photo_offset = 15
-            side_offset = 15
-            srink_setting = 0.95
-            item_total_size = photo_size - (photo_size / 4)
-            player_size = (item_total_size * srink_setting, item_total_size * srink_setting)
-            foe_size = (item_total_size * srink_setting, item_total_size * srink_setting)
-            
-            if len(foelist) > 0:
-                for i, foe in enumerate(foelist):
-                    if foe.HP > 1:
-                        item_total_position = ((photo_offset * i) + (side_offset + (item_total_size * i)), foe_top)
-                        render_player_obj(pygame, foe, foe.photodata, screen, enrage_timer, def_mod, bleed_mod, item_total_position, foe_size, True)
-
-                    if foe.tick(bleed_mod):
-                        for foe_action in foe.ActionsPerTurn:
-                            dt = clock.tick(fps_cap) / 1000
-                        
-                            if bleed_mod > 1.5:
-                                foe.RushStat = 0
-                                foe.gain_damage_over_time(enrage_dot, 1.1 * bleed_mod)
-
-                            if foe.HP > 1:
-                                foe.do_pre_turn()
-
-                                if len(playerlist) > 0:
-                                    max_def = 0
-                                    target_to_damage = random.choice(playerlist)
-
-                                    for target in playerlist:
-                                        if target.Def > max_def:
-                                            max_def = target.Def
-                                        else:
-                                            target_to_damage = target
-
-                                    if target_to_damage.HP > 0:
-                                        target_to_damage.take_damage(bleed_mod, check_passive_mod(foelist, playerlist, foe, target_to_damage, foe.deal_damage(bleed_mod, target_to_damage.Type)))
-                                    
-                                    if target_to_damage.HP < 1:
-                                        target_to_damage.save_past_life()
-                                        kill_person(target_to_damage, foe)
-                                        playerlist.remove(target_to_damage)
-                    else:
-                        if foe.HP > 0: foe.do_pre_turn()
-            else:
+            pacer.advance(battle)
+
+            if battle.outcome == WON:
                 break
 
-            if len(playerlist) > 0:
-                for i, person in enumerate(playerlist):
-                    if person.HP > 1:
-                        item_total_position = ((photo_offset * i) + (side_offset + (item_total_size * i)), player_bottom)
-                        render_player_obj(pygame, person, person.photodata, screen, enrage_timer, def_mod, bleed_mod, item_total_position, player_size, True)
-
-                    if person.tick(bleed_mod):
-                        for turn in person.ActionsPerTurn:
-                            dt = clock.tick(fps_cap) / 1000
-                        
-                            if bleed_mod > 1.5:
-                                person.gain_damage_over_time(enrage_dot, 1.1 * bleed_mod)
-
-                            if bleed_mod > 1.2:
-                                person.RushStat = 0
-
-                            if person.HP > 0:
-                                person.do_pre_turn()
-
-                                if len(foelist) > 0:
-                                    target_to_damage = random.choice(foelist)
-
-                                    if target_to_damage.HP > 0:
-                                        pre_damage_to_deal = person.deal_damage(bleed_mod, target_to_damage.Type)
-                                        damge_to_deal = check_passive_mod(foelist, playerlist, person, target_to_damage, pre_damage_to_deal)
-                                        target_to_damage.take_damage(bleed_mod, damge_to_deal)
-
-                                    if target_to_damage.HP < 1:
-                                        foelist.remove(target_to_damage)
-                                        kill_person(target_to_damage, person)
-                                        person.Kills += 1
-                                        total_rushmod = 0
-
-                                        if bleed_mod < 100:
-                                            person.RushStat += 1
-
-                                        for player in playerlist:
-                                            total_rushmod += max(1, player.RushStat)
-
-                                        for player in playerlist:
-                                            if person.PlayerName == player.PlayerName:
-                                                player.gain_exp(mod=bleed_mod * total_rushmod, foe_level=target_to_damage.level)
-                                            else:
-                                                player.gain_exp(mod=bleed_mod * total_rushmod, foe_level=max(5, round(target_to_damage.level * 1.25)))
-                                        for player in backup_players_list:
-                                            player.gain_exp(mod=(bleed_mod * total_rushmod) * 0.25, foe_level=max(1, round(target_to_damage.level * 0.25)))
-
-                                    elif target_to_damage.HP > target_to_damage.MHP:
-                                        target_to_damage.HP = target_to_damage.MHP
-                    else:
-                        if person.HP > 0: person.do_pre_turn()
-
-                    if person.HP > person.MHP:
-                        person.HP = person.MHP
-            else:
+            if battle.outcome == LOST:
                 spinner.fail(text=f"You lost!")
+                log(red, f"replay of the lost wave: python -m autofighter.sim.replay {os.path.join('logs', REPLAY_FILE)}")
                 log(red, "you lose... restart game to load a new buffed save file")
                 pygame.quit()
                 exit()
-                
-            if enrage_timer.timed_out:
+
+            render_battle(pygame, screen, background_image, battle, render_player_obj)
+
+            if battle.enrage_timer.timed_out:
                 fps_stat = font.render(f"FPT: {int(fps)}", True, (255, 255, 255))
                 fps_rect = fps_stat.get_rect(center=((SCREEN_WIDTH // 8) + 600, (SCREEN_HEIGHT // 2) - 0))
                 screen.blit(fps_stat, fps_rect)
 
-                enrage_timer_stat = font.render(f"Enrage: {(enrage_mod):.1f} ({(bleed_mod):.2f}x)", True, (255, 255, 255))
+                enrage_timer_stat = font.render(f"Enrage: {(battle.enrage_mod):.1f} ({(battle.bleed_mod):.2f}x)", True, (255, 255, 255))
                 enrage_timer_rect = fps_stat.get_rect(center=((SCREEN_WIDTH // 8) + 600, (SCREEN_HEIGHT // 2) + 50))
                 screen.blit(enrage_timer_stat, enrage_timer_rect)
             else:
@@ -561,4 +358,5 @@ def main(level):
                 fps_rect = fps_stat.get_rect(center=((SCREEN_WIDTH // 8) + 600, (SCREEN_HEIGHT // 2) - 0))
                 screen.blit(fps_stat, fps_rect)
 
-            pygame.display.flip()
\ No newline at end of file
+            pygame.display.flip()
+            pacer.limit(clock)
@@ -7,23 +7,87 @@ item_mods = ["Powerful", "Strong", "Enhanced", "Fortified", "Empowered", "Reinfo
 #item_types = ["damage", "defense", "utility", "blocking", "healing", "passive"]
 item_types = ["damage", "defense", "utility"]
 
-class ItemType():
-    def __init__(self):
-        """Initialises an Item object."""
-        self.type = [random.choice(item_types)]
-        self.power = round(random.uniform(1.001, 1.2), 2)
-        self.name = f"{random.choice(item_mods).lower().title()} Blessing of {self.type[0].title()}"
+UPGRADE_BATCH = 16
+
+
+def upgrade_moments(scale: float, low: float = 0.001, high: float = 0.01, floor: float = 0.00001):
+    """Mean and variance of ``max(uniform(low, high) * scale, floor)``, one upgrade's roll."""
+    if scale <= 0 or high * scale <= floor:
+        return floor, 0.0
+
+    cut = max(floor / scale, low)
+    width = high - low
+    below = (cut - low) / width
+
+    mean = floor * below + scale * (high ** 2 - cut ** 2) / (2 * width)
+    square = floor ** 2 * below + scale ** 2 * (high ** 3 - cut ** 3) / (3 * width)
+    return mean, max(square - mean ** 2, 0.0)
+
+
+def split_upgrades(times: int, items: int, rng=None) -> list[int]:
+    """Share ``times`` upgrades out over ``items`` items, each picked at random.
+
+    The counts are distributed like picking an item ``times`` times with
+    ``rng.choice``, but take one binomial draw per item.
+    """
+    rng = rng or random
+    counts = []
+
+    for index in range(items):
+        picked = rng.binomialvariate(times, 1 / (items - index))
+        counts.append(picked)
+        times -= picked
+
+    return counts
 
-    def upgrade(self, mod_fixed):
+
+class ItemType():
+    def __init__(self, rng=None):
+        """Initialises an Item object, rolling it from ``rng`` (default :mod:`random`)."""
+        rng = rng or random
+        self.type = [rng.choice(item_types)]
+        self.power = round(rng.uniform(1.001, 1.2), 2)
+        self.name = f"{rng.choice(item_mods).lower().title()} Blessing of {self.type[0].title()}"
+
+    def upgrade(self, mod_fixed, rng=None):
         """Upgrades the item's power stat."""
+        rng = rng or random
         try:
-            temp_math = max(random.uniform(0.001, 0.01) * self.check_mods(mod_fixed / 10) / (100 * self.power), 0.00001)
+            temp_math = max(rng.uniform(0.001, 0.01) * self.check_mods(mod_fixed / 10) / (100 * self.power), 0.00001)
 
             self.power += temp_math * 0.0001
 
         except Exception as error:
             print(f"The Item ({self.name}) errored: `{str(error)}`")
     
+    def upgrade_many(self, mod_fixed, times, rng=None):
+        """Applies ``times`` upgrades in one call.
+
+        Fewer than ``UPGRADE_BATCH`` upgrades are applied one by one. For more,
+        the total power gained is drawn from a normal distribution with the
+        mean and variance of ``times`` upgrades, kept within what they could
+        add at the least and at the most. An upgrade moves the power by well
+        under 1e-6, so all of them are rolled at the current power.
+        """
+        rng = rng or random
+
+        if times < UPGRADE_BATCH:
+            for _ in range(times):
+                self.upgrade(mod_fixed, rng)
+            return
+
+        try:
+            scale = self.check_mods(mod_fixed / 10) / (100 * self.power)
+            mean, variance = upgrade_moments(scale)
+            low = max(0.001 * scale, 0.00001)
+            high = max(0.01 * scale, 0.00001)
+
+            temp_math = rng.gauss(times * mean, math.sqrt(times * variance))
+            self.power += min(max(temp_math, times * low), times * high) * 0.0001
+
+        except Exception as error:
+            print(f"The Item ({self.name}) errored: `{str(error)}`")
+
     def check_mods(self, temp_power: float):
         for index, item_mod in enumerate(item_mods):
             if item_mod.lower() in self.name.lower():
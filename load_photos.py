@@ -12,11 +12,13 @@ from typing import Optional, List
 spinner = Halo(text='Loading', spinner='dots', color='green')
 
 TEMP_DIRS = []
+RESOURCE_COPIES = {}
 
 def resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource, works for dev and for PyInstaller.
     If possible, load the resource into memory (RAM disk or temporary directory).
+    Each resource is copied once; later calls return the same copy.
 
     Args:
         relative_path: The relative path to the resource.
@@ -31,6 +33,10 @@ def resource_path(relative_path: str) -> str:
         if not os.path.isfile(full_path):
             return full_path
 
+        cached_path = RESOURCE_COPIES.get(full_path)
+        if cached_path is not None and os.path.isfile(cached_path):
+            return cached_path
+
         if platform.system() == "Windows":
             temp_dir = tempfile.mkdtemp(prefix="resource_")
         elif platform.system() == "Linux":
@@ -44,6 +50,8 @@ def resource_path(relative_path: str) -> str:
         temp_resource_path = os.path.join(temp_dir, resource_name)
         shutil.copy2(full_path, temp_resource_path)
 
+        RESOURCE_COPIES[full_path] = temp_resource_path
+
         return temp_resource_path
     except OSError as e:
         print(f"Failed to load resource into memory: {e}. Falling back to original path.")
@@ -63,6 +71,9 @@ def cleanup_temp_dirs():
             shutil.rmtree(temp_dir)
         except OSError as e:
             spinner.fail(text=f"Failed to clean up temporary directory {temp_dir}: {e}")
+
+    TEMP_DIRS.clear()
+    RESOURCE_COPIES.clear()
     
     spinner.succeed(text="Successfully cleaned up temporary directorys")
 
@@ -1,5 +1,6 @@
 import os
 import getpass
+import multiprocessing
 
 from gamestates import main
 
@@ -11,6 +12,8 @@ except Exception as e:
     pass
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
     try:
         if getpass.getuser() == "lunamidori":
             import cProfile
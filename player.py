@@ -9,6 +9,7 @@ import pickle
 from halo import Halo
 
 from items import ItemType
+from items import split_upgrades
 
 from damagetypes import DamageType
 from damagetypes import get_damage_type
@@ -30,6 +31,11 @@ from load_photos import resource_path
 from load_photos import set_themed_photo
 from plugins.plugin_loader import PluginLoader
 
+from autofighter.stats.base import diminish_base_gain
+from autofighter.stats.curves import crit_damage_gain, crit_rate_gain, dodge_odds_gain, past_life_vitality, vitality_gain
+from autofighter.stats.leveling import BULK_LEVELS, bulk_available, bulk_level_up, exp_curve, levels_gained
+from autofighter.traits import Traits, resolve_traits
+
 spinner = Halo(text='Loading', spinner='dots', color='green')
 
 starting_max_blessing = 5
@@ -37,10 +43,19 @@ starting_max_blessing = 5
 _plugin_loader: PluginLoader | None = None
 
 class Player:
-    def __init__(self, name: str):
+    rng = random
+    bulk_levels = BULK_LEVELS
+
+    def __init__(self, name: str, rng: random.Random | None = None):
         """
         Initializes a new player character.
+
+        ``rng`` is the random stream every roll this player makes draws from.
+        It defaults to the global :mod:`random` module.
         """
+        if rng is not None:
+            self.rng = rng
+
         self.PlayerName: str = ' '.join(word.capitalize() for word in name.split())
         self.level: int = 1
         self.EXP: int = 0
@@ -50,7 +65,7 @@ class Player:
         self.Def: int = 1500
         self.Atk: int = 250
         self.CanAct: bool = False
-        self.ActionPointsPerTurn: int = random.randint(150, 655)
+        self.ActionPointsPerTurn: int = self.rng.randint(150, 655)
         self.ActionPointsPerTick: float = 1
         self.ActionPoints: int = 125
         self.Mitigation: float = 1.5
@@ -67,8 +82,9 @@ class Player:
         self.Kills: int = 0
         self.RushStat: int = 3
         self.isplayer: bool = False
-        self.Type: DamageType = get_damage_type(name)
+        self.Type: DamageType = get_damage_type(name, self.rng)
         self.above_threshold_ticks: int = 0
+        self.last_crit: bool = False
         self.ActionsPerTurn: list[str] = ["action"]
         self.Logs: list[str] = []
         self.Inv: list[WeaponType] = []
@@ -79,47 +95,73 @@ class Player:
         self.photodata = ""
         
     def save(self):
+        lives_folder = "lives"
+
+        if not os.path.exists(lives_folder):
+            os.makedirs(lives_folder)
+
+        with open(os.path.join(lives_folder, f'{self.PlayerName}.dat'), 'wb') as f:
+            f.write(self.save_data())
+
+    def save_data(self) -> bytes:
+        """The pickled save :meth:`save` writes and :meth:`load` reads."""
         temp_data = self.photodata
         self.photodata = "No Photo Data"
         temp_dots = self.DOTS
         temp_hots = self.HOTS
+        temp_rng = self.__dict__.pop("rng", None)
         self.DOTS = []
         self.HOTS = []
 
-        lives_folder = "lives"
-
-        if not os.path.exists(lives_folder):
-            os.makedirs(lives_folder)
+        try:
+            return pickle.dumps(self.__dict__)
+        finally:
+            self.photodata = temp_data
 
-        with open(os.path.join(lives_folder, f'{self.PlayerName}.dat'), 'wb') as f:
-            pickle.dump(self.__dict__, f)
+            self.DOTS = temp_dots
+            self.HOTS = temp_hots
 
-        self.photodata = temp_data
+            if temp_rng is not None:
+                self.rng = temp_rng
 
-        self.DOTS = temp_dots
-        self.HOTS = temp_hots
+    def load(self, data: bytes | None = None):
+        """Load this player's save file, or the save in ``data`` instead."""
+        temp_rng = self.__dict__.get("rng")
 
-    def load(self):
         try:
+            if data is not None:
+                self.__dict__ = pickle.loads(data)
+            else:
+                lives_folder = "lives"
 
-            lives_folder = "lives"
-
-            if not os.path.exists(lives_folder):
-                os.makedirs(lives_folder)
+                if not os.path.exists(lives_folder):
+                    os.makedirs(lives_folder)
 
-            with open(os.path.join(lives_folder, f'{self.PlayerName}.dat'), 'rb') as f:
-                self.__dict__ = pickle.load(f)
+                with open(os.path.join(lives_folder, f'{self.PlayerName}.dat'), 'rb') as f:
+                    self.__dict__ = pickle.load(f)
 
         except FileNotFoundError:
             pass
         except Exception as e:
             print(f"Error loading save file: {e}")
 
+        if temp_rng is not None:
+            self.rng = temp_rng
+
         self.check_stats()
 
     def set_photo(self, photo: str):
         self.photo: str = set_themed_photo(photo)
 
+    @property
+    def traits(self) -> Traits:
+        """Themed traits of ``PlayerName``, resolved once per name.
+
+        Looked up by name rather than stored, so a rename (or a ``load``
+        that swaps ``__dict__``) can never leave stale traits behind.
+        """
+        return resolve_traits(self.PlayerName)
+
     def load_past_lives(self):
         past_lives_folder = "past_lives"
         if not os.path.exists(past_lives_folder):
@@ -129,7 +171,7 @@ class Player:
 
         past_lives_folder_list = os.listdir(past_lives_folder)
         total_items = len(past_lives_folder_list)
-        random.shuffle(past_lives_folder_list)
+        self.rng.shuffle(past_lives_folder_list)
         starting_items = 0
         for filename in past_lives_folder_list:
             if filename.endswith(".pastlife"):
@@ -179,17 +221,7 @@ class Player:
                             continue
 
                         elif past_life_data['Vitality'] > 1.0000001:
-                            temp_past_life_vitality = past_life_data['Vitality'] - 1
-                            while temp_past_life_vitality > 0:
-                                bonus = max(0.001, self.Vitality - 1)
-                                
-                                scaling_factor = 0.95
-                                
-                                vit_gain = (bonus * scaling_factor)
-                                
-                                self.gain_vit(vit_gain)
-
-                                temp_past_life_vitality -= vit_gain
+                            self.Vitality = past_life_vitality(self.Vitality, past_life_data['Vitality'] - 1)
                         
                         self.check_stats()
 
@@ -227,6 +259,7 @@ class Player:
         past_life_filename = os.path.join(past_lives_folder, f"{past_life_id}.pastlife")
 
         self.Logs = []
+        temp_rng = self.__dict__.pop("rng", None)
 
         try:
             with open(past_life_filename, 'wb') as f:
@@ -235,6 +268,9 @@ class Player:
         except Exception as e:
             print(f"Error saving past life: {str(e)}")
 
+        if temp_rng is not None:
+            self.rng = temp_rng
+
         try:
             os.remove(os.path.join(lives_folder, f'{self.PlayerName}.dat'))
         except FileNotFoundError:
@@ -248,110 +284,48 @@ class Player:
 
     def gain_dodgeodds_rate(self, points):
         """Increases dodge odds based on points, with increasing cost.
-        """
-        cost = 1 + self.DodgeOdds
-        to_be_lowered_by = 100
 
-        temppoints = points / (to_be_lowered_by ** 3.5)
-
-        while temppoints > 0.01:
-            self.DodgeOdds += max(0.00001 ** 0.00001, 0.1 / ((to_be_lowered_by * (self.DodgeOdds ** 3)) + 1))
-            cost += 1
-            temppoints -= 0.0005 * cost
+        See :func:`autofighter.stats.curves.dodge_odds_gain` for the curve.
+        """
+        self.DodgeOdds += dodge_odds_gain(self.DodgeOdds, points)
 
     def gain_crit_rate(self, points):
         """Increases crit rate based on points, with increasing cost.
 
         Every 0.05 crit rate increase costs 2500x more points.
         """
-        to_be_lowered_by = 2500
-        desired_increase = 0
-        
-        if self.CritRate > 1:
-            desired_increase = points / ((to_be_lowered_by * (self.CritRate * 2)) + 1)
-        elif points > 0.25:
-            desired_increase = points / ((to_be_lowered_by * (self.CritRate * 2)) + 1)
-        else:
-            desired_increase = points
-
-        self.CritRate = self.CritRate + desired_increase
+        self.CritRate = self.CritRate + crit_rate_gain(self.CritRate, points)
 
     def gain_crit_damage(self, points):
         """Increases crit damage based on points, with increasing cost.
 
         Every 10 crit damage increase costs 100x more points.
         """
-        current_damage = self.CritDamageMod
-        to_be_lowered_by = 100
-
-        if current_damage > 10:
-            desired_increase = points / ((to_be_lowered_by * (current_damage // 10)) + 1)
-        else:
-            desired_increase = points
-
-        self.CritDamageMod += desired_increase 
+        self.CritDamageMod += crit_damage_gain(self.CritDamageMod, points)
     
     def check_base_stats(self, stat_total: int, stat_gain: int):
-        stats_to_start_lower = 50
-        to_be_lowered_by = 10 + (stat_total // 1000)
-
-        stat_modifiers = {}
-
-        for i in range(45):
-            new_key = (i * 100)
-            new_value = to_be_lowered_by ** max(0.7 * (i + 1), 1.0)
-            stat_modifiers[new_key] = new_value
-
-        stat_modifiers[stats_to_start_lower] = to_be_lowered_by
+        """Diminished gain for a base stat at ``stat_total``, after item bonuses.
 
+        See :func:`autofighter.stats.base.diminish_base_gain` for the curve.
+        """
         desired_increase = stat_gain
 
         for item in self.Items:
             desired_increase = item.stat_gain(desired_increase)
 
-        for threshold, modifier in stat_modifiers.items():
-            if stat_total > threshold:
-                desired_increase = desired_increase / max((modifier * (stat_total // stats_to_start_lower)), 1)
-                break
-
-        return max(min(int(desired_increase), 1000), 1)
+        return diminish_base_gain(stat_total, desired_increase)
     
     def gain_vit(self, points):
         """
-        Increases the player's Vitality stat based on the input points, applying diminishing returns
-        and item bonuses.
+        Increases the player's Vitality stat based on the input points, applying diminishing returns.
 
-        The amount of Vitality gained decreases as the player's Vitality increases,
-        simulating diminishing returns.  This diminishing return is controlled by a series
-        of stat modifiers that apply based on thresholds of existing Vitality. Items the player
-        possesses can also affect the amount of vitality gained.
+        The amount of Vitality gained decreases steeply as the player's Vitality increases
+        (see :func:`autofighter.stats.curves.vitality_gain`).
 
         Args:
-            points (float): The base number of Vitality points to be added.  This value is modified
-                           by item effects and diminishing returns.
+            points (float): The base number of Vitality points to be added.
         """
-        stats_to_start_lower = 1.2
-        to_be_lowered_by = (self.Vitality ** 1.5)
-
-        stat_modifiers = {}
-
-        for i in range(65):
-            new_key = (i * 0.25)
-            new_value = to_be_lowered_by ** max(0.3 * (i + 1), 1.0)
-            stat_modifiers[new_key] = new_value
-
-        stat_modifiers[stats_to_start_lower] = to_be_lowered_by
-
-        desired_increase = points
-
-        for item in self.Items:
-            desired_increase = item.stat_gain(desired_increase)
-
-        for threshold, modifier in stat_modifiers.items():
-            if self.Vitality > threshold:
-                desired_increase = max(((points) / (self.Vitality ** modifier)), 0.0000000001)
-                self.Vitality += desired_increase
-                break
+        self.Vitality += vitality_gain(self.Vitality, points)
 
     def check_stats(self):
         max_dodgeodds = 5
@@ -397,10 +371,27 @@ class Player:
     def tick(self, mod):
         if self.HP < 1:
             return False
-        
-        self.ActionPoints += round(self.ActionPointsPerTick * max(mod, 1))
 
-        if self.ActionPointsPerTick >= round(self.ActionPointsPerTurn * 0.1):
+        self.ActionPoints += self.action_point_gain(mod)
+
+        self.check_action_speed()
+
+        if self.ActionPoints >= self.ActionPointsPerTurn:
+            self.ActionPoints -= self.ActionPointsPerTurn
+            return True
+        else:
+            return False
+
+    def action_point_gain(self, mod):
+        """Action points gained per tick at enrage multiplier ``mod``."""
+        return round(self.ActionPointsPerTick * max(mod, 1))
+
+    def needs_speed_check(self):
+        return self.ActionPointsPerTick >= round(self.ActionPointsPerTurn * 0.1)
+
+    def check_action_speed(self):
+        """Trade excess action point gain for extra actions or stats."""
+        if self.needs_speed_check():
             self.ActionPointsPerTick -= min(self.ActionPointsPerTurn, self.ActionPointsPerTick / 2)
             self.ActionPointsPerTurn *= 2
 
@@ -413,12 +404,6 @@ class Player:
                 self.Mitigation += 1
                 self.EffectRES += 0.1
 
-        if self.ActionPoints >= self.ActionPointsPerTurn:
-            self.ActionPoints -= self.ActionPointsPerTurn
-            return True
-        else:
-            return False
-
     def do_pre_turn(self):
         self.regain_hp()
         self.heal_over_time()
@@ -429,9 +414,13 @@ class Player:
         if self.HP > self.MHP: self.HP = self.MHP
 
     def take_damage(self, input_damage_mod: float, input_damage: float):
+        """Apply a hit unless it is dodged. Returns ``False`` on a dodge."""
         if self.check_dodge(input_damage_mod):
             total_damage = on_damage_taken(self.Items, self.damage_mitigation(input_damage))
             self.HP -= round(total_damage)
+            return True
+
+        return False
 
     def take_damage_nododge(self, input_damage_mod: float, input_damage: float):
         total_damage = on_damage_taken(self.Items, self.damage_mitigation(input_damage * input_damage_mod))
@@ -442,9 +431,10 @@ class Player:
 
         damage_dealt = self.Type.damage_mod(damage_dealt, input_damage_type)
 
-        if self.check_crit(): damage_dealt = self.crit_damage_mod(damage_dealt)
+        self.last_crit = self.check_crit()
+        if self.last_crit: damage_dealt = self.crit_damage_mod(damage_dealt)
 
-        return damage_dealt * random.uniform(0.95, 1.05) * input_damage_mod
+        return damage_dealt * self.rng.uniform(0.95, 1.05) * input_damage_mod
 
     def damage_mitigation(self, damage_pre: float):
         return max(damage_pre / (self.mitigation_buff() * self.Def), 1 / self.Def)
@@ -468,10 +458,10 @@ class Player:
             EffectHitRate = min(1.95, EffectHitRate)
 
         for _ in range(num_applications):
-            starter_tohit = max(((EffectHitRate / num_applications) - (self.effectres())) * random.uniform(0.90, 1.10), 0.01)
+            starter_tohit = max(((EffectHitRate / num_applications) - (self.effectres())) * self.rng.uniform(0.90, 1.10), 0.01)
             tohit = max(0.01, min(1, starter_tohit))
 
-            if random.random() < tohit:
+            if self.rng.random() < tohit:
                 for dots in self.DOTS:
                     if DOT.name == dots.name:
                         dots.damage += max(DOT.damage, 50)
@@ -485,9 +475,9 @@ class Player:
                 if len(self.DOTS) < 5:
                     self.DOTS.append(DOT)
                 else:
-                    random.choice(self.DOTS).damage += DOT.damage
-                    random.choice(self.DOTS).tick_interval += DOT.tick_interval
-                    random.choice(self.DOTS).turns += DOT.turns
+                    self.rng.choice(self.DOTS).damage += DOT.damage
+                    self.rng.choice(self.DOTS).tick_interval += DOT.tick_interval
+                    self.rng.choice(self.DOTS).turns += DOT.turns
 
     def gain_healing_over_time(self, HOT: healingovertimetype):
         for hot in self.HOTS:
@@ -500,9 +490,9 @@ class Player:
         if len(self.HOTS) < 2:
             self.HOTS.append(HOT)
         else:
-            random.choice(self.HOTS).healing += HOT.healing
-            random.choice(self.HOTS).tick_interval += HOT.tick_interval
-            random.choice(self.HOTS).turns += HOT.turns
+            self.rng.choice(self.HOTS).healing += HOT.healing
+            self.rng.choice(self.HOTS).tick_interval += HOT.tick_interval
+            self.rng.choice(self.HOTS).turns += HOT.turns
     
     def damage_over_time(self):
         for dot in self.DOTS:
@@ -536,7 +526,7 @@ class Player:
         return damage_pre * self.CritDamageMod * max(1, self.CritRate)
     
     def check_dodge(self, enrage_buff: float):
-        if self.DodgeOdds / enrage_buff >= random.random():
+        if self.DodgeOdds / enrage_buff >= self.rng.random():
             # Cant be hit
             return False
         else:
@@ -544,7 +534,7 @@ class Player:
             return True
     
     def check_crit(self):
-        if self.CritRate >= random.random():
+        if self.CritRate >= self.rng.random():
             return True
         else:
             return False
@@ -561,11 +551,31 @@ class Player:
             self.EXP += min(max(round(((foe_level * 4) ** 0.55) * int_mod_novit), round((foe_level * 4) ** 0.75)) + 1, EXP_to_levelup * 5)
 
     def exp_to_levelup(self):
-        return min(max((self.level ** 1.55) / (self.EXPMod ** 0.55), 1), 10 ** 10)
+        return exp_curve(self.EXPMod).exp_to_levelup(self.level)
+
+    def levels_ready(self):
+        """How many levels the EXP in hand would buy right now."""
+        return levels_gained(self.level, self.EXP, self.EXPMod)[0]
 
     def level_up(self, mod=float(1), foe_level=int(1)):
         """
         Levels up the player.
+
+        Once ``bulk_levels`` or more levels are due and every item slot is
+        filled, they are applied at once by
+        :func:`autofighter.stats.leveling.bulk_level_up` (which needs NumPy).
+        Set ``bulk_levels`` to ``None`` to always take :meth:`level_up_each`.
+        """
+        if self.bulk_levels is not None and bulk_available() and len(self.Items) >= starting_max_blessing:
+            if self.levels_ready() >= self.bulk_levels:
+                bulk_level_up(self, mod)
+                return
+
+        self.level_up_each(mod, foe_level)
+
+    def level_up_each(self, mod=float(1), foe_level=int(1)):
+        """
+        Levels up the player one level at a time (the reference for the bulk path).
         """
 
         mod_fixed = on_stat_gain(self.Items, (mod * 0.35) + 1) * self.Vitality * (self.level / 1000)
@@ -577,15 +587,15 @@ class Player:
 
             self.EXP = max(self.EXP - (self.exp_to_levelup()), 0)
             
-            hp_up: int = random.randint(5, 10 * int_mod)
-            def_up: int = random.randint(2, 5 * int_mod)
-            atk_up: int = random.randint(2, 5 * int_mod)
-            regain_up: float = random.uniform(0.0000001, 0.0000005)
-            critrate_up: float = random.uniform(0.001, 0.0025) * max((mod_fixed / 10000), 1)
-            critdamage_up: float = random.uniform(0.004, 0.008) * max((mod_fixed / 10000), 1)
-            dodgeodds_up: float = random.uniform(0.000002, 0.00004) * max((mod_fixed / 10000), 1)
-            mitigation_up: float = (random.uniform(0.0000000001, 0.0000000002) / self.Mitigation) * max((mod_fixed / 1000000), 1)
-            vitality_up: float = (random.uniform(0.000000001, 0.000000002) / self.Vitality) * max((mod_fixed / 1000000), 1)
+            hp_up: int = self.rng.randint(5, 10 * int_mod)
+            def_up: int = self.rng.randint(2, 5 * int_mod)
+            atk_up: int = self.rng.randint(2, 5 * int_mod)
+            regain_up: float = self.rng.uniform(0.0000001, 0.0000005)
+            critrate_up: float = self.rng.uniform(0.001, 0.0025) * max((mod_fixed / 10000), 1)
+            critdamage_up: float = self.rng.uniform(0.004, 0.008) * max((mod_fixed / 10000), 1)
+            dodgeodds_up: float = self.rng.uniform(0.000002, 0.00004) * max((mod_fixed / 10000), 1)
+            mitigation_up: float = (self.rng.uniform(0.0000000001, 0.0000000002) / self.Mitigation) * max((mod_fixed / 1000000), 1)
+            vitality_up: float = (self.rng.uniform(0.000000001, 0.000000002) / self.Vitality) * max((mod_fixed / 1000000), 1)
 
             hp_up = self.check_base_stats(self.MHP, round(hp_up * self.Vitality))
             def_up = self.check_base_stats(self.Def, round(def_up * self.Vitality))
@@ -613,9 +623,9 @@ class Player:
                 self.gain_dodgeodds_rate(dodgeodds_up)
             elif choice == 8:
                 if len(self.Items) < starting_max_blessing:
-                    self.Items.append(ItemType())
+                    self.Items.append(ItemType(self.rng))
                 else:
-                    random.choice(self.Items).upgrade(mod_fixed * 25)
+                    self.rng.choice(self.Items).upgrade(mod_fixed * 25, self.rng)
             elif choice == 9:
                 if self.level > 500:
                     self.MHP += int(hp_up)
@@ -628,10 +638,10 @@ class Player:
                     self.gain_dodgeodds_rate(dodgeodds_up)
 
                     if len(self.Items) < starting_max_blessing:
-                        self.Items.append(ItemType())
+                        self.Items.append(ItemType(self.rng))
                     else:
                         for item in self.Items:
-                            item.upgrade(mod_fixed)
+                            item.upgrade(mod_fixed, self.rng)
 
                 else:
                     self.MHP += int(hp_up / 2)
@@ -644,10 +654,10 @@ class Player:
                     self.gain_dodgeodds_rate(dodgeodds_up)
                     
                     if len(self.Items) < starting_max_blessing:
-                        self.Items.append(ItemType())
+                        self.Items.append(ItemType(self.rng))
                     else:
                         for item in self.Items:
-                            item.upgrade(mod_fixed)
+                            item.upgrade(mod_fixed, self.rng)
 
             if self.level > 300:
                 self.Mitigation += mitigation_up
@@ -663,29 +673,25 @@ class Player:
         top_level_full = top_level * 2
 
         self.level = level
-        hp_up: int = random.randint(self.level, 3 * self.level) + 1000
-        def_up: int = random.randint((self.level * 2) + 1000, (self.level * 5) + 2500) + 15
-        atk_up: int = random.randint(2 * self.level, 3 * self.level)
-        self.Regain: float = random.uniform(0.0001 * self.level, (self.level * 0.002)) + (self.level * 0.004)
-        self.CritRate: float = random.uniform(0.000001 * self.level, (self.level * 0.000002)) + (self.level * 0.000001)
+        hp_up, def_up, atk_up, self.Regain, self.CritRate = roll_level_gains(level, self.rng)
         self.CritDamageMod: float = 2 + (self.level * 0.00025)
         dodgeodds_up: float = 0.03 + (self.level * 0.0001)
         self.Vitality: float = 1 + (self.level * 0.00002)
         self.Mitigation: float = 1 + (self.level * 0.00003)
 
         if level > top_level:
-            hp_up = hp_up + (2 * level)
-            atk_up = atk_up + (4 * level)
-            
             # Apply bonus every xyz levels past top_level
             xyz = 5
             bonus_levels = (level - top_level) // xyz
 
-            for i in range(int((level - 50) // 50) + 1):
-                if len(self.Items) > starting_max_blessing:
-                    random.choice(self.Items).upgrade((bonus_levels * 200) / level)
-                else:
-                    self.Items.append(ItemType())
+            upgrades = int((level - 50) // 50) + 1
+            while upgrades > 0 and len(self.Items) <= starting_max_blessing:
+                self.Items.append(ItemType(self.rng))
+                upgrades -= 1
+
+            if upgrades > 0:
+                for item, times in zip(self.Items, split_upgrades(upgrades, len(self.Items), self.rng)):
+                    item.upgrade_many((bonus_levels * 200) / level, times, self.rng)
 
         self.EffectRES /= 4
         self.EffectHitRate = 2
@@ -696,24 +702,54 @@ class Player:
 
         self.check_stats()
 
-        post_temp_vit = (self.Vitality * (level / (top_level_full)))
+        vitality = self.Vitality
         post_temp_mit = (self.Mitigation * (level / (top_level / 2)))
-        self.Vitality = max(min(post_temp_vit, 10 ** 4), 0.75)
+        self.Vitality = max(min(vitality * (level / (top_level_full)), 10 ** 4), 0.75)
         self.Mitigation = max(min(post_temp_mit, 525), 0.15)
 
-        hp_up = self.check_base_stats(self.MHP, round(hp_up * self.Vitality))
-        def_up = self.check_base_stats(self.Def, round(def_up * self.Vitality))
-        atk_up = self.check_base_stats(self.Atk, round(atk_up * self.Vitality)) * 8
-
-        self.MHP = int((self.MHP + hp_up) * min((level / top_level), (25)) * post_temp_vit) + 5
-        self.Atk = int((self.Atk + atk_up) * min((level / top_level), (5)) * post_temp_vit) + 5
-        self.Def = int((self.Def + def_up) * min((level / (top_level * 4)), (2))) + 5
+        self.MHP, self.Atk, self.Def = self.level_base_stats(level, hp_up, def_up, atk_up, (self.MHP, self.Atk, self.Def), vitality)
     
         self.gain_crit_rate(0.0002 * (level / top_level_full))
         self.gain_dodgeodds_rate(dodgeodds_up * (level / (top_level_full * 15)))
 
         self.check_stats(); self.HP: int = self.MHP
 
+    def level_base_stats(self, level: int, hp_up: int, def_up: int, atk_up: int, start: tuple[int, int, int], vitality: float) -> tuple[int, int, int]:
+        """MHP, Atk and Def that :meth:`set_level` ends with for its rolled gains.
+
+        ``start`` is the fighter's ``(MHP, Atk, Def)`` before the gains and
+        ``vitality`` its Vitality before scaling with the level; item bonuses
+        come from the fighter's current items.
+        """
+        top_level = 1000
+        post_temp_vit = vitality * (level / (top_level * 2))
+        vitality = max(min(post_temp_vit, 10 ** 4), 0.75)
+        mhp, atk, defense = start
+
+        hp_up = self.check_base_stats(mhp, round(hp_up * vitality))
+        def_up = self.check_base_stats(defense, round(def_up * vitality))
+        atk_up = self.check_base_stats(atk, round(atk_up * vitality)) * 8
+
+        return (
+            int((mhp + hp_up) * min((level / top_level), (25)) * post_temp_vit) + 5,
+            int((atk + atk_up) * min((level / top_level), (5)) * post_temp_vit) + 5,
+            int((defense + def_up) * min((level / (top_level * 4)), (2))) + 5,
+        )
+
+def roll_level_gains(level: int, rng) -> tuple[int, int, int, float, float]:
+    """The HP, Def and Atk gains, Regain and crit rate :meth:`Player.set_level` rolls, in its order."""
+    hp_up: int = rng.randint(level, 3 * level) + 1000
+    def_up: int = rng.randint((level * 2) + 1000, (level * 5) + 2500) + 15
+    atk_up: int = rng.randint(2 * level, 3 * level)
+    regain: float = rng.uniform(0.0001 * level, (level * 0.002)) + (level * 0.004)
+    crit_rate: float = rng.uniform(0.000001 * level, (level * 0.000002)) + (level * 0.000001)
+
+    if level > 1000:
+        hp_up = hp_up + (2 * level)
+        atk_up = atk_up + (4 * level)
+
+    return hp_up, def_up, atk_up, regain, crit_rate
+
 def render_player_obj(pygame, player: Player, player_profile_pic, screen, enrage_timer, def_mod, bleed_mod, position, size, show_stats_on_hover=True):
     x, y = position
     width, height = size
@@ -773,7 +809,8 @@ def render_player_obj(pygame, player: Player, player_profile_pic, screen, enrage
         stat_data = []
 
         stat_data.append(("Stats of:", f"{player.PlayerName} ({player.Type.name.capitalize()})"))
-        stat_data.append(("Level:", player.level))
+        levels_ready = player.levels_ready() if player.isplayer else 0
+        stat_data.append(("Level:", f"{player.level} (+{levels_ready})" if levels_ready else player.level))
 
         if player.isplayer:
             stat_data.append(("Speed:", f"{round(player.ActionPoints)} :: {round(player.ActionPointsPerTurn)}"))
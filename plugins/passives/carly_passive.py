@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import random
-
 from plugins.passives.base import PassivePlugin
 
+from autofighter.stats.transfers import base_stat_after, steps_above, uniform_sum
+
 
 class CarlyPassive(PassivePlugin):
     """Rebalance Carly's stats toward defense.
@@ -28,20 +28,19 @@ class CarlyPassive(PassivePlugin):
                 player.check_base_stats(player.Def, player.Items[0].power / 2)
                 + (player.Atk // 2)
             )
-        while player.Atk > max_atk_stat:
-            player.Def += player.check_base_stats(player.Def, def_to_add)
-            player.Atk -= 1
-        while player.Regain > 5:
-            player.Def += player.check_base_stats(player.Def, def_to_add)
-            player.Regain -= 0.001
+        atk_steps = steps_above(player.Atk, max_atk_stat)
+        player.Atk -= atk_steps
+        regain_steps = steps_above(player.Regain, 5, 0.001)
+        player.Regain -= regain_steps * 0.001
+        player.Def = base_stat_after(player, player.Def, def_to_add, atk_steps + regain_steps)
         player.Atk = int(player.Atk) + 1
         player.Def += player.check_base_stats(
             player.Def, int(player.Def * player.level) + 1
         )
         player.gain_crit_damage(0.0002 * player.level)
-        while player.Def > 25000:
-            item_buff += random.uniform(0.05, 0.25)
-            player.Def -= 5
+        def_steps = steps_above(player.Def, 25000, 5)
+        item_buff += uniform_sum(player.rng, def_steps, 0.05, 0.25)
+        player.Def -= def_steps * 5
         for item in player.Items:
             item.name = "Carly's Blessing of Defense"
             item.power += player.level * item_buff
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from plugins.passives.base import PassivePlugin
 
+from autofighter.stats.transfers import shed_hp_for_dodge
+
 
 class LunaPassive(PassivePlugin):
     """Reduce max HP for evasion and boost defense."""
@@ -21,12 +23,7 @@ class LunaPassive(PassivePlugin):
 
     def on_apply(self, player) -> None:
         """Apply Luna's unique stat modifiers."""
-        dodge_buff = 0.35
-        max_hp_debuff = player.MHP / 4
-
-        while player.MHP > max_hp_debuff:
-            dodge_buff += 0.001 * player.Vitality
-            player.MHP -= 1
+        dodge_buff = shed_hp_for_dodge(player, 0.35)
 
         player.Atk = int(player.Atk * 1)
         player.Def = int(player.Def * 2)
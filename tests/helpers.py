@@ -0,0 +1,36 @@
+"""Fighters shared by the battle engine tests.
+
+Import this after the test module's stubs for ``halo``, ``colorama`` and
+``pygame``: it imports :mod:`player`.
+"""
+
+import random
+
+from damagetypes import Generic
+from player import Player
+
+
+# Low Def, some dodge and plenty of crits: fights that exercise every roll.
+SKIRMISH_STATS = {"Def": 10, "DodgeOdds": 0.1, "CritRate": 0.3}
+
+
+def make_fighter(name: str, atk: int, mhp: int, isplayer: bool, rng: random.Random | None = None, *, roll_speed: bool = False, **stats) -> Player:
+    """A Generic fighter with ``atk`` and full ``mhp``, and ``stats`` set on top.
+
+    ``roll_speed`` re-rolls ``ActionPointsPerTurn`` from the fighter's
+    ``rng`` after the other stats are set.
+    """
+    fighter = Player(name, rng)
+    fighter.Type = Generic
+    fighter.Atk = atk
+    fighter.MHP = mhp
+    fighter.HP = mhp
+    fighter.isplayer = isplayer
+
+    for stat, value in stats.items():
+        setattr(fighter, stat, value)
+
+    if roll_speed:
+        fighter.ActionPointsPerTurn = fighter.rng.randint(150, 655)
+
+    return fighter
@@ -0,0 +1,491 @@
+"""The adjective modifiers as they were written before ``ADJECTIVE_TABLE``.
+
+One hand-written function per adjective, kept as the reference
+``tests/test_modifiers.py`` checks the compiled table against.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+def _atrocious(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.9)
+    player.Atk = int(player.Atk * 1.1)
+
+
+def _baneful(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.95)
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _barbaric(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.1)
+    player.Def = int(player.Def * 1.9)
+
+
+def _beastly(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.05)
+    player.Atk = int(player.Atk * 1.05)
+
+
+def _belligerent(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.9
+    player.Atk = int(player.Atk * 1.1)
+
+
+def _bloodthirsty(player: Player) -> None:
+    player.MHP = int(player.MHP - (player.MHP * 0.1))
+    player.Atk = int(player.Atk + (player.Atk * 0.2))
+
+
+def _brutal(player: Player) -> None:
+    player.CritRate = player.CritRate + 0.1
+    player.DodgeOdds = player.DodgeOdds * 1.9
+
+
+def _callous(player: Player) -> None:
+    player.Def = int(player.Def * 1.1)
+    player.DodgeOdds = player.DodgeOdds * 1.9
+
+
+def _cannibalistic(player: Player) -> None:
+    player.MHP = int(player.MHP + (player.MHP * 0.05))
+
+
+def _cowardly(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.2)
+    player.Atk = int(player.Atk * 0.8)
+
+
+def _cruel(player: Player) -> None:
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _cunning(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.1
+
+
+def _dangerous(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.CritRate = player.CritRate + 0.05
+
+
+def _demonic(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.9)
+    player.Atk = int(player.Atk * 1.15)
+
+
+def _depraved(player: Player) -> None:
+    player.Def = int(player.Def - (player.Def * 0.1))
+    player.Atk = int(player.Atk + (player.Atk * 0.1))
+
+
+def _destructive(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.CritRate = player.CritRate + 0.05
+
+
+def _diabolical(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.DodgeOdds = player.DodgeOdds * 1.9
+
+
+def _disgusting(player: Player) -> None:
+    player.Def = int(player.Def * 1.9)
+
+
+def _dishonorable(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+
+
+def _dreadful(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+
+
+def _eerie(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.05
+
+
+def _evil(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.95)
+    player.Atk = int(player.Atk * 1.05)
+
+
+def _execrable(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.9)
+
+
+def _fiendish(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.9
+    player.CritRate = player.CritRate + 0.1
+
+
+def _filthy(player: Player) -> None:
+    player.Def = int(player.Def * 1.95)
+
+
+def _foul(player: Player) -> None:
+    player.Def = int(player.Def * 1.95)
+    player.DodgeOdds = player.DodgeOdds * 1.95
+
+
+def _frightening(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.DodgeOdds = player.DodgeOdds * 1.95
+
+
+def _ghastly(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.95)
+    player.DodgeOdds = player.DodgeOdds * 1.05
+
+
+def _ghoulish(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.95)
+    player.Atk = int(player.Atk * 1.05)
+
+
+def _gruesome(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _heinous(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.CritDamageMod = player.CritDamageMod * 1.1
+
+
+def _hideous(player: Player) -> None:
+    player.Def = int(player.Def * 1.9)
+    player.MHP = int(player.MHP * 1.1)
+
+
+def _homicidal(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.15)
+
+
+def _horrible(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.02)
+    player.CritRate = player.CritRate + 0.02
+
+
+def _hostile(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+
+
+def _inhumane(player: Player) -> None:
+    player.CritDamageMod = player.CritDamageMod * 1.1
+
+
+def _insidious(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.DodgeOdds = player.DodgeOdds * 1.05
+
+
+def _intimidating(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.95)
+    player.Def = int(player.Def * 1.05)
+
+
+def _malevolent(player: Player) -> None:
+    player.CritDamageMod = player.CritDamageMod * 1.05
+    player.DodgeOdds = player.DodgeOdds * 1.95
+
+
+def _malicious(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.07)
+
+
+def _monstrous(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.1)
+    player.Atk = int(player.Atk * 1.1)
+
+
+def _murderous(player: Player) -> None:
+    player.CritRate = player.CritRate + 0.15
+
+
+def _nasty(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+    player.DodgeOdds = player.DodgeOdds * 1.95
+
+
+def _nefarious(player: Player) -> None:
+    player.CritRate = player.CritRate + 0.05
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _noxious(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.MHP = int(player.MHP * 1.95)
+
+
+def _obscene(player: Player) -> None:
+    player.Def = int(player.Def * 1.9)
+    player.DodgeOdds = player.DodgeOdds * 1.9
+
+
+def _odious(player: Player) -> None:
+    player.Def = int(player.Def * 1.95)
+
+
+def _ominous(player: Player) -> None:
+    player.CritRate = player.CritRate + 0.02
+    player.CritDamageMod = player.CritDamageMod * 1.03
+
+
+def _pernicious(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.95)
+    player.CritRate = player.CritRate + 0.05
+
+
+def _perverted(player: Player) -> None:
+    player.Def = int(player.Def * 1.9)
+    player.DodgeOdds = player.DodgeOdds * 1.1
+
+
+def _poisonous(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.07)
+    player.MHP = int(player.MHP * 1.93)
+
+
+def _predatory(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.1
+    player.CritRate = player.CritRate + 0.05
+
+
+def _premeditated(player: Player) -> None:
+    player.CritRate = player.CritRate + 0.1
+
+
+def _primal(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+    player.MHP = int(player.MHP * 1.05)
+
+
+def _primitive(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+
+
+def _profane(player: Player) -> None:
+    player.MHP = int(player.MHP * 1.9)
+    player.CritDamageMod = player.CritDamageMod * 1.1
+
+
+def _psychopathic(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.9
+    player.Atk = int(player.Atk * 1.1)
+    player.CritDamageMod = player.CritDamageMod * 1.1
+
+
+def _rabid(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.Def = int(player.Def * 1.9)
+
+
+def _relentless(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.9
+    player.Atk = int(player.Atk * 1.05)
+    player.CritRate = player.CritRate + 0.05
+
+
+def _repulsive(player: Player) -> None:
+    player.Def = int(player.Def * 1.9)
+    player.DodgeOdds = player.DodgeOdds * 1.1
+
+
+def _ruthless(player: Player) -> None:
+    player.CritDamageMod = player.CritDamageMod * 1.15
+
+
+def _sadistic(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.02)
+    player.CritDamageMod = player.CritDamageMod * 1.08
+
+
+def _savage(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.Def = int(player.Def * 1.9)
+    player.MHP = int(player.MHP * 1.1)
+
+
+def _scary(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.95)
+    player.DodgeOdds = player.DodgeOdds * 1.05
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _sinister(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.05
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _sociopathic(player: Player) -> None:
+    player.DodgeOdds = player.DodgeOdds * 1.9
+    player.Atk = int(player.Atk * 1.15)
+
+
+def _spiteful(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.07)
+    player.MHP = int(player.MHP * 1.93)
+
+
+def _squalid(player: Player) -> None:
+    player.Def = int(player.Def * 1.95)
+    player.MHP = int(player.MHP * 1.05)
+
+
+def _terrifying(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.9)
+    player.Def = int(player.Def * 1.1)
+
+
+def _threatening(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+    player.DodgeOdds = player.DodgeOdds * 1.95
+
+
+def _treacherous(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.DodgeOdds = player.DodgeOdds * 1.05
+    player.CritRate = player.CritRate + 0.05
+
+
+def _ugly(player: Player) -> None:
+    player.Def = int(player.Def * 1.1)
+    player.MHP = int(player.MHP * 1.9)
+
+
+def _unholy(player: Player) -> None:
+    player.MHP = int(player.MHP * 5)
+    player.Atk = int(player.Atk * 2)
+    player.CritDamageMod = player.CritDamageMod * 0.8
+
+
+def _venomous(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.MHP = int(player.MHP * 1.9)
+
+
+def _vicious(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.1)
+    player.CritRate = player.CritRate + 0.05
+
+
+def _villainous(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.DodgeOdds = player.DodgeOdds * 1.95
+    player.CritRate = player.CritRate + 0.05
+
+
+def _violent(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.15)
+    player.Def = int(player.Def * 0.85)
+
+
+def _wicked(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.08)
+    player.CritDamageMod = player.CritDamageMod * 1.02
+
+
+def _wrongful(player: Player) -> None:
+    player.Atk = int(player.Atk * 1.05)
+    player.Def = int(player.Def * 1.95)
+    player.CritDamageMod = player.CritDamageMod * 1.05
+
+
+def _xenophobic(player: Player) -> None:
+    player.Def = int(player.Def * 1.1)
+
+
+LEGACY_ADJECTIVES = {
+    "atrocious": _atrocious,
+    "baneful": _baneful,
+    "barbaric": _barbaric,
+    "beastly": _beastly,
+    "belligerent": _belligerent,
+    "bloodthirsty": _bloodthirsty,
+    "brutal": _brutal,
+    "callous": _callous,
+    "cannibalistic": _cannibalistic,
+    "cowardly": _cowardly,
+    "cruel": _cruel,
+    "cunning": _cunning,
+    "dangerous": _dangerous,
+    "demonic": _demonic,
+    "depraved": _depraved,
+    "destructive": _destructive,
+    "diabolical": _diabolical,
+    "disgusting": _disgusting,
+    "dishonorable": _dishonorable,
+    "dreadful": _dreadful,
+    "eerie": _eerie,
+    "evil": _evil,
+    "execrable": _execrable,
+    "fiendish": _fiendish,
+    "filthy": _filthy,
+    "foul": _foul,
+    "frightening": _frightening,
+    "ghastly": _ghastly,
+    "ghoulish": _ghoulish,
+    "gruesome": _gruesome,
+    "heinous": _heinous,
+    "hideous": _hideous,
+    "homicidal": _homicidal,
+    "horrible": _horrible,
+    "hostile": _hostile,
+    "inhumane": _inhumane,
+    "insidious": _insidious,
+    "intimidating": _intimidating,
+    "malevolent": _malevolent,
+    "malicious": _malicious,
+    "monstrous": _monstrous,
+    "murderous": _murderous,
+    "nasty": _nasty,
+    "nefarious": _nefarious,
+    "noxious": _noxious,
+    "obscene": _obscene,
+    "odious": _odious,
+    "ominous": _ominous,
+    "pernicious": _pernicious,
+    "perverted": _perverted,
+    "poisonous": _poisonous,
+    "predatory": _predatory,
+    "premeditated": _premeditated,
+    "primal": _primal,
+    "primitive": _primitive,
+    "profane": _profane,
+    "psychopathic": _psychopathic,
+    "rabid": _rabid,
+    "relentless": _relentless,
+    "repulsive": _repulsive,
+    "ruthless": _ruthless,
+    "sadistic": _sadistic,
+    "savage": _savage,
+    "scary": _scary,
+    "sinister": _sinister,
+    "sociopathic": _sociopathic,
+    "spiteful": _spiteful,
+    "squalid": _squalid,
+    "terrifying": _terrifying,
+    "threatening": _threatening,
+    "treacherous": _treacherous,
+    "ugly": _ugly,
+    "unholy": _unholy,
+    "venomous": _venomous,
+    "vicious": _vicious,
+    "villainous": _villainous,
+    "violent": _violent,
+    "wicked": _wicked,
+    "wrongful": _wrongful,
+    "xenophobic": _xenophobic,
+}
@@ -0,0 +1,147 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+import pickle
+import random
+
+from functools import partial
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from autofighter.sim.arrays import ArrayPlayer, ArrayRoster
+from autofighter.sim.battle import Battle
+from autofighter.sim.roster import to_record
+from damagetypes import Fire, Light, Lightning
+from player import Player
+from tests.helpers import SKIRMISH_STATS, make_fighter
+
+
+spawn = partial(make_fighter, roll_speed=True, Regain=40, **SKIRMISH_STATS)
+
+
+def skirmish(seed: int, **kwargs) -> Battle:
+    rng = random.Random(seed)
+    party = [spawn(f"Hero {i}", 40000 + i * 15000, 400000, True, rng) for i in range(4)]
+    foes = [spawn(f"Foe {i}", 35000 + i * 10000, 300000, False, rng) for i in range(4)]
+    backups = [spawn(f"Backup Foe {i}", 30000, 250000, False, rng) for i in range(3)]
+    party[0].ActionPointsPerTick = 40
+    party[1].Type = Lightning
+    party[2].Type = Light
+    foes[0].Type = Fire
+    foes[1].ActionsPerTurn = ["action", "action"]
+    return Battle(party, foes, backup_foes_list=backups, level=50, persist=False, timeout_ticks=300, rng=rng, **kwargs)
+
+
+def battle_state(battle: Battle) -> list:
+    battle.sync_action_points()
+    fighters = battle.playerlist + battle.foelist + battle.backup_foes_list
+    state = [repr((f.PlayerName, f.HP, f.MHP, f.ActionPoints, f.ActionPointsPerTick, f.ActionPointsPerTurn, f.DamageDealt)) for f in fighters]
+    return state + [battle.ticks, battle.outcome]
+
+
+@pytest.mark.parametrize("event_scheduler", [False, True])
+def test_array_roster_matches_object_roster(event_scheduler):
+    for seed in range(3):
+        plain = skirmish(seed, event_scheduler=event_scheduler)
+        arrays = skirmish(seed, event_scheduler=event_scheduler, arrays=True)
+
+        while not plain.finished and plain.ticks < 3000:
+            plain.step()
+            arrays.step()
+            assert battle_state(arrays) == battle_state(plain)
+
+        assert arrays.outcome == plain.outcome
+
+
+def test_fighters_are_released_when_the_wave_ends():
+    battle = skirmish(5, arrays=True)
+    assert all(isinstance(fighter, ArrayPlayer) for fighter in battle.fighters)
+
+    battle.run_wave(max_ticks=20000)
+
+    assert battle.finished
+    assert all(type(fighter) is Player for fighter in battle.fighters)
+    assert all("HP" in fighter.__dict__ and "_slot" not in fighter.__dict__ for fighter in battle.fighters)
+
+
+def test_bound_fighter_saves_its_stats(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    hero = spawn("Hero", 100, 5000, True, random.Random(1))
+    roster = ArrayRoster([hero])
+    hero.HP = 1234
+
+    hero.save()
+
+    with open(tmp_path / "lives" / "Hero.dat", "rb") as f:
+        saved = pickle.load(f)
+    assert saved["HP"] == 1234 and "_roster" not in saved
+    assert isinstance(hero, ArrayPlayer) and hero in roster
+    assert to_record(hero)["HP"] == 1234
+
+
+def test_roster_grows_and_releases():
+    rng = random.Random(2)
+    fighters = [spawn(f"Foe {i}", 10, 100 + i, False, rng) for i in range(40)]
+    roster = ArrayRoster(fighters, capacity=4)
+
+    assert [fighter.MHP for fighter in fighters] == [100 + i for i in range(40)]
+    assert roster.fallen(fighters) == []
+
+    fighters[7].HP = 0
+    assert roster.fallen(fighters) == [fighters[7]]
+
+    roster.release_all()
+    assert len(roster) == 0
+    assert fighters[7].__dict__["HP"] == 0 and type(fighters[7].MHP) is int
+
+
+def test_snapshot_restores_into_array_battle():
+    battle = skirmish(6, arrays=True)
+    for _ in range(100):
+        battle.step()
+    snapshot = battle.snapshot()
+
+    expected = []
+    for _ in range(200):
+        battle.step()
+        expected.append(battle_state(battle))
+
+    battle.restore(snapshot)
+    for state in expected:
+        battle.step()
+        assert battle_state(battle) == state
@@ -0,0 +1,239 @@
+import sys
+import types
+import random
+
+from functools import partial
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from autofighter.sim.battle import Battle, WON, LOST
+from autofighter.sim.pacing import FramePacer
+from damagetypes import Ice, Lightning
+from player import Player
+from tests.helpers import make_fighter
+
+
+spawn = partial(make_fighter, DodgeOdds=0)
+
+
+def test_strong_party_wins_wave_headless():
+    random.seed(1)
+    hero = spawn("Hero", 10 ** 6, 10 ** 6, True)
+    foes = [spawn(f"Foe {i}", 1, 100, False) for i in range(3)]
+    kills = []
+
+    battle = Battle([hero], list(foes), level=1, persist=False, on_kill=lambda dead, killer: kills.append(dead))
+
+    assert battle.run_wave(max_ticks=10000) == WON
+    assert battle.foelist == []
+    assert hero.Kills == 3
+    assert len(kills) == 3
+    assert hero.EXP > 0
+    assert hero.DamageDealt > 0
+
+
+def test_weak_party_loses_wave_headless():
+    random.seed(2)
+    hero = spawn("Hero", 1, 100, True)
+    foe = spawn("Foe", 10 ** 6, 10 ** 6, False)
+
+    battle = Battle([hero], [foe], level=1, persist=False)
+
+    assert battle.run_wave(max_ticks=10000) == LOST
+    assert battle.playerlist == []
+    assert hero.DamageTaken > 0
+
+
+def test_backups_replace_fallen_foes():
+    random.seed(3)
+    hero = spawn("Hero", 10 ** 6, 10 ** 6, True)
+    foe = spawn("Foe", 1, 100, False)
+    backup = spawn("Backup Foe", 1, 100, False)
+
+    battle = Battle([hero], [foe], backup_foes_list=[backup], level=1, persist=False)
+
+    assert battle.run_wave(max_ticks=10000) == WON
+    assert backup.HP < 1
+    assert hero.Kills == 2
+
+
+def test_run_wave_respects_tick_budget():
+    random.seed(4)
+    hero = spawn("Hero", 1, 10 ** 6, True)
+    foe = spawn("Foe", 1, 10 ** 6, False)
+
+    battle = Battle([hero], [foe], level=1, persist=False)
+
+    assert battle.run_wave(max_ticks=5) is None
+    assert battle.ticks == 5
+    assert not battle.finished
+
+
+class CountingBattle:
+    def __init__(self, ticks_left: int) -> None:
+        self.ticks_left = ticks_left
+        self.steps = 0
+
+    def step(self) -> bool:
+        self.steps += 1
+        self.ticks_left -= 1
+        return self.ticks_left > 0
+
+
+class CountingClock:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def tick(self, fps_cap: int = 0) -> int:
+        self.calls.append(fps_cap)
+        return 15
+
+
+def test_pacer_runs_turbo_ticks_per_frame_and_limits_once():
+    pacer = FramePacer(fps_cap=30, turbo=6)
+    battle = CountingBattle(ticks_left=100)
+    clock = CountingClock()
+
+    assert pacer.advance(battle) == 6
+    pacer.limit(clock)
+
+    assert battle.steps == 6
+    assert clock.calls == [30]
+
+
+def test_pacer_stops_when_battle_finishes():
+    pacer = FramePacer(turbo=10)
+    battle = CountingBattle(ticks_left=3)
+
+    assert pacer.advance(battle) == 3
+
+
+def test_pacer_uncapped_fills_frame_budget():
+    pacer = FramePacer(fps_cap=1000, turbo=1, uncapped=True)
+    battle = CountingBattle(ticks_left=10 ** 9)
+
+    assert pacer.advance(battle) >= 1
+
+
+def test_pacer_from_config():
+    pacer = FramePacer.from_config({"turbo": 20, "fps_cap": 30, "uncapped": True})
+
+    assert pacer.turbo == 20
+    assert pacer.fps_cap == 30
+    assert pacer.uncapped is True
+    assert FramePacer.from_config({}) == FramePacer()
+    assert FramePacer().turbo == 1
+
+
+def build_skirmish(seed: int) -> Battle:
+    random.seed(seed)
+    party = [spawn(f"Hero {i}", 400 + i * 150, 4000, True) for i in range(3)]
+    foes = [spawn(f"Foe {i}", 350 + i * 100, 3000, False) for i in range(3)]
+    backups = [spawn(f"Backup Foe {i}", 300, 2500, False) for i in range(2)]
+    for fighter in party + foes + backups:
+        fighter.ActionPointsPerTurn = random.randint(150, 655)
+    party[0].ActionPointsPerTick = 40
+    party[1].Type = Lightning
+    foes[0].ActionsPerTurn = ["action", "action"]
+    foes[1].Type = Ice
+    return Battle(party, foes, backup_foes_list=backups, level=50, persist=False, timeout_ticks=200)
+
+
+def fighter_state(battle: Battle) -> list[tuple]:
+    battle.sync_action_points()
+    fighters = battle.playerlist + battle.foelist + battle.backup_foes_list
+    return [(f.PlayerName, f.HP, f.ActionPoints, f.ActionPointsPerTurn, len(f.ActionsPerTurn)) for f in fighters]
+
+
+def test_event_scheduler_matches_polling():
+    for seed in range(5):
+        polled = build_skirmish(seed)
+        polled.foe_schedule = polled.player_schedule = None
+        polled_states = []
+        for _ in range(400):
+            polled.step()
+            polled_states.append(fighter_state(polled))
+
+        scheduled = build_skirmish(seed)
+        for expected in polled_states:
+            scheduled.step()
+            assert fighter_state(scheduled) == expected
+
+        assert polled.outcome == scheduled.outcome
+
+
+def seeded_skirmish(seed: int) -> Battle:
+    rng = random.Random(seed)
+    party = [spawn(f"Hero {i}", 400 + i * 150, 4000, True, rng) for i in range(3)]
+    foes = [spawn(f"Foe {i}", 350 + i * 100, 3000, False, rng) for i in range(3)]
+    for fighter in party + foes:
+        fighter.ActionPointsPerTurn = rng.randint(150, 655)
+        fighter.DodgeOdds = 0.2
+        fighter.CritRate = 0.3
+    return Battle(party, foes, level=50, persist=False, timeout_ticks=200, rng=rng)
+
+
+def test_injected_rng_makes_battles_reproducible():
+    random.seed(0)
+    first = seeded_skirmish(11)
+    first.run_wave(max_ticks=2000)
+    first_state = fighter_state(first)
+
+    random.seed(99)
+    second = seeded_skirmish(11)
+    second.run_wave(max_ticks=2000)
+
+    assert fighter_state(second) == first_state
+    assert (first.outcome, first.ticks) == (second.outcome, second.ticks)
+
+
+def test_injected_rng_leaves_global_stream_alone():
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    seeded_skirmish(3).run_wave(max_ticks=500)
+
+    assert random.random() == expected
+
+
+def test_injected_rng_is_not_saved(tmp_path, monkeypatch):
+    import pickle
+
+    monkeypatch.chdir(tmp_path)
+    hero = Player("Hero", random.Random(1))
+    hero.save()
+
+    with open(tmp_path / "lives" / "Hero.dat", "rb") as f:
+        assert "rng" not in pickle.load(f)
+    assert isinstance(hero.rng, random.Random)
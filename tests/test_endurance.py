@@ -0,0 +1,79 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+
+from autofighter.endurance import Endurance
+
+
+def run_state(run: Endurance) -> list:
+    party = [(player.PlayerName, player.level, player.HP, player.MHP, player.Atk, player.EXP) for player in run.party]
+    return party + [run.wave, run.past_level, run.foes_killed, run.wins, run.losses, run.timeouts, run.errors, run.ticks]
+
+
+def test_waves_reuse_foes_and_keep_logs_empty():
+    run = Endurance(seed=1, max_ticks=2000)
+
+    run.run(2)
+    previous = list(run.foes)
+    run.run(1)
+
+    assert run.wave == 3
+    assert run.wins + run.losses + run.timeouts + run.errors == 3
+    assert all(foe is old for foe, old in zip(run.foes, previous))
+    assert all(player.Logs == [] and player.HP >= 1 for player in run.party)
+
+
+def test_breakpoints_are_bounded():
+    run = Endurance(seed=2, max_ticks=2000, recent=2)
+    run.run(8)
+
+    assert len(run.breakpoints) <= 2
+    assert len(run.summary()["recent_breakpoints"]) == len(run.breakpoints)
+
+
+def test_checkpoint_resumes_the_same_run(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+
+    straight = Endurance(seed=3, max_ticks=2000)
+    straight.run(6)
+
+    first = Endurance(seed=3, max_ticks=2000, checkpoint=path, checkpoint_every=2)
+    first.run(4)
+    resumed = Endurance.load(path)
+    resumed.run(2)
+
+    assert run_state(resumed) == run_state(straight)
+    assert not (tmp_path / "run.ckpt.tmp").exists()
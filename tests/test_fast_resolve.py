@@ -0,0 +1,96 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+
+import random
+
+from functools import partial
+
+from autofighter.sim import fast_resolve
+from autofighter.sim.battle import Battle, WON
+from tests.helpers import make_fighter
+
+
+spawn = partial(make_fighter, Def=10)
+
+
+def make_battle(seed: int, party_atk: int, foe_atk: int, **kwargs) -> Battle:
+    rng = random.Random(seed)
+    party = [spawn(f"Hero {i}", party_atk, 4000, True, rng) for i in range(3)]
+    foes = [spawn(f"Foe {i}", foe_atk, 3000, False, rng) for i in range(3)]
+    backups = [spawn(f"Backup Foe {i}", foe_atk, 2500, False, rng) for i in range(2)]
+    return Battle(party, foes, backup_foes_list=backups, level=50, persist=False, timeout_ticks=5000, rng=rng, **kwargs)
+
+
+def test_lopsided_wave_is_skipped_with_kills_and_exp():
+    kills = []
+    battle = make_battle(1, 10 ** 6, 1, fast_resolve=0.9, on_kill=lambda dead, killer: kills.append(dead))
+
+    battle.run_wave(max_ticks=20000)
+
+    assert battle.fast_resolved
+    assert battle.outcome == WON
+    assert battle.foelist == [] and battle.backup_foes_list == []
+    assert len(kills) == 5
+    assert sum(player.Kills for player in battle.playerlist) == 5
+    assert all(player.HP >= 1 and player.EXP > 0 for player in battle.playerlist)
+
+
+def test_estimate_picks_the_stronger_side():
+    result = fast_resolve.estimate(make_battle(2, 10 ** 6, 1))
+
+    assert result.winner == WON
+    assert result.foe_ticks == float("inf")
+    assert result.confidence == 1.0
+
+
+def test_even_wave_is_simulated():
+    battle = make_battle(3, 20000, 20000, fast_resolve=0.9)
+
+    result = fast_resolve.estimate(battle)
+    assert result.confidence < 0.9
+
+    battle.run_wave(max_ticks=20000)
+    assert not battle.fast_resolved
+    assert battle.outcome is not None
+
+
+def test_no_threshold_never_probes():
+    battle = make_battle(4, 10 ** 6, 1)
+    battle.run_wave(max_ticks=20000)
+
+    assert battle.fast_resolve_probe is None
+    assert not battle.fast_resolved
@@ -0,0 +1,189 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import random
+
+import pytest
+
+from autofighter.endurance import Endurance, main
+from autofighter.sim.foe_cache import ITEM_LEVEL, FoeCache, bucket_level, level_bucket
+from autofighter.sim.wave import FoeSpec, build_foe, build_foes, mimic_source
+from player import Player
+
+
+STATS = ["PlayerName", "MHP", "HP", "Atk", "Def", "Regain", "CritRate", "CritDamageMod", "DodgeOdds", "Vitality", "Mitigation"]
+
+
+def stats(foe) -> list:
+    return [getattr(foe, stat) for stat in STATS] + [(item.name, item.power) for item in foe.Items]
+
+
+def test_level_buckets_hold_their_middle() -> None:
+    for level in [1, 2, 50, 999, 5000, 123456]:
+        bucket = level_bucket(level)
+        assert level_bucket(bucket_level(bucket)) in (bucket, bucket + 1)
+        assert abs(bucket_level(bucket) - level) <= max(level * 0.02, 1)
+
+
+def items(foe) -> list:
+    return [(item.name, item.power) for item in foe.Items]
+
+
+def test_clones_roll_their_own_stats_and_items() -> None:
+    cache = FoeCache()
+    specs = [FoeSpec("Brutal Becca", "becca", 5000 + 10 * i, i, i) for i in range(6)]
+    clones = [cache.build(spec) for spec in specs]
+    fresh = [build_foe(spec) for spec in specs]
+
+    assert (cache.hits, cache.misses) == (5, 1)
+    assert [clone.level for clone in clones] == [spec.level for spec in specs]
+    assert len({clone.MHP for clone in clones}) == len(clones)
+    assert len({tuple(items(clone)) for clone in clones}) == len(clones)
+
+    for clone, foe in zip(clones, fresh):
+        assert clone.ActionPointsPerTurn == foe.ActionPointsPerTurn
+        assert clone.Type == foe.Type
+        assert clone.Regain == pytest.approx(foe.Regain, rel=1e-9)
+        assert clone.MHP == pytest.approx(foe.MHP, rel=0.01)
+        assert [item.name for item in clone.Items] == [item.name for item in foe.Items]
+        assert [item.power for item in clone.Items] == pytest.approx([item.power for item in foe.Items], abs=1e-5)
+
+    clones[0].Items[0].power += 1
+    clones[0].Logs.append("hit")
+    assert stats(cache.build(specs[1])) == stats(clones[1])
+    assert clones[1].Logs == []
+
+
+@pytest.mark.parametrize("level", [3000, 20000])
+def test_clones_follow_their_passives(level: int) -> None:
+    cache = FoeCache()
+    for seed in range(4):
+        build_foes(level, rng=random.Random(seed), cache=cache)
+
+    for seed in range(4):
+        clones, _ = build_foes(level, rng=random.Random(seed), cache=cache)
+        fresh, _ = build_foes(level, rng=random.Random(seed))
+
+        for clone, foe in zip(clones, fresh):
+            assert clone.PlayerName == foe.PlayerName
+            assert [clone.MHP, clone.Atk, clone.Def, clone.Regain] == pytest.approx(
+                [foe.MHP, foe.Atk, foe.Def, foe.Regain], rel=0.03
+            )
+            assert [item.name for item in clone.Items] == [item.name for item in foe.Items]
+
+
+def test_low_level_foes_are_built_as_without_a_cache() -> None:
+    cache = FoeCache()
+    spec = FoeSpec("Cruel Becca", "becca", ITEM_LEVEL, 1, 2)
+
+    assert stats(cache.build(spec)) == stats(build_foe(spec))
+    assert len(cache) == 0
+
+
+def test_carly_is_built_in_full() -> None:
+    cache = FoeCache()
+    spec = FoeSpec("Cruel Carly", "carly", 5000, 1, 2)
+
+    assert stats(cache.build(spec)) == stats(build_foe(spec))
+    assert len(cache) == 0
+
+
+def test_cached_mimics_copy_the_player(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    player = Player("Player")
+    player.Atk = 50000
+
+    foe = FoeCache().build(FoeSpec("Mimic", "mimic", 5000, 1, 2, mimic_source([player])))
+
+    assert foe.PlayerName == "Mimic"
+    assert foe.Atk == 10000
+
+
+def test_templates_do_not_depend_on_what_was_cached() -> None:
+    becca = FoeSpec("Cruel Becca", "becca", 5000, 1, 2)
+    chibi = FoeSpec("Vicious Chibi", "chibi", 5000, 3, 4)
+
+    cache = FoeCache(maxsize=1)
+    cache.build(becca)
+    cache.build(chibi)
+    again = cache.build(becca)
+
+    assert len(cache) == 1
+    assert cache.misses == 3
+    assert stats(again) == stats(FoeCache().build(becca))
+
+
+def test_cached_waves_are_reproducible() -> None:
+    def wave(cache: FoeCache, seed: int) -> list:
+        foelist, backups = build_foes(3000, rng=random.Random(seed), cache=cache)
+        return [stats(foe) + [foe.level, foe.ActionPointsPerTurn, foe.Type.name] for foe in foelist + backups]
+
+    warm = FoeCache()
+    wave(warm, 1)
+    cold = wave(warm, 2)
+    hits = warm.hits
+    again = wave(warm, 2)
+
+    assert again == cold == wave(FoeCache(), 2)
+    # Every foe but Carly and the Mimic is cloned from a cached template.
+    assert warm.hits - hits == sum("Carly" not in foe[0] and "Mimic" not in foe[0] for foe in again)
+
+
+def test_endurance_resumes_with_a_foe_cache(tmp_path) -> None:
+    path = str(tmp_path / "run.ckpt")
+
+    straight = Endurance(seed=3, max_ticks=2000, foe_cache=64)
+    straight.run(4)
+
+    first = Endurance(seed=3, max_ticks=2000, checkpoint=path, checkpoint_every=2, foe_cache=64)
+    first.run(2)
+    resumed = Endurance.load(path)
+    resumed.run(2)
+
+    assert resumed.templates is not None
+    assert [player.level for player in resumed.party] == [player.level for player in straight.party]
+    assert (resumed.wins, resumed.losses, resumed.ticks) == (straight.wins, straight.losses, straight.ticks)
+
+
+def test_resuming_keeps_the_saved_foe_cache(tmp_path) -> None:
+    path = str(tmp_path / "run.ckpt")
+    common = ["--checkpoint", path, "--checkpoint-every", "1", "--max-ticks", "2000", "--report-every", "0", "--json"]
+
+    main(["--waves", "1", "--foe-cache", "64", *common])
+    main(["--waves", "1", "--resume", *common])
+    assert Endurance.load(path).foe_cache == 64
+
+    main(["--waves", "1", "--resume", "--foe-cache", "0", *common])
+    assert Endurance.load(path).templates is None
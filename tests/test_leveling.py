@@ -0,0 +1,163 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import random
+import statistics
+
+import pytest
+
+from autofighter.stats import leveling
+from autofighter.stats.base import diminish_base_gain
+from items import ItemType
+from player import Player
+
+
+STATS = ["MHP", "Def", "Atk", "Regain", "CritRate", "CritDamageMod"]
+
+
+def leveled(name: str, seed: int, level: int, levels: int) -> Player:
+    player = Player(name, rng=random.Random(seed))
+    player.set_level(level)
+    while len(player.Items) < 5:
+        player.Items.append(ItemType(player.rng))
+    player.EXP = sum(leveling.exp_needed(at, player.EXPMod) for at in range(level, level + levels))
+    return player
+
+
+def test_base_gains_match_check_base_stats_in_order():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(3)
+    for stat in [-20, 0, 1, 49, 50, 999, 1234, 98765]:
+        desired = [float(rng.randint(1, 200000)) for _ in range(300)]
+        halved = [rng.random() < 0.3 for _ in range(300)]
+
+        total = stat
+        for gain, half in zip(desired, halved):
+            gain = diminish_base_gain(total, gain)
+            total += gain // 2 if half else gain
+
+        assert leveling._base_gains(stat, np.array(desired), np.array(halved)) == total - stat
+
+
+def test_levels_gained_matches_the_loop():
+    player = leveled("Carly", 1, 700, 250)
+    gained, exp = leveling.levels_gained(player.level, player.EXP, player.EXPMod)
+
+    player.bulk_levels = None
+    player.level_up()
+
+    assert player.level == 700 + gained
+    assert player.EXP == pytest.approx(exp, rel=1e-12)
+
+
+def test_exp_curve_binary_search_matches_walking_the_levels():
+    rng = random.Random(8)
+    for _ in range(500):
+        level = rng.choice([0, 1, rng.randint(1, 100), rng.randint(1, 5000), rng.randint(1, 100000)])
+        exp_mod = rng.choice([1, 2, 7, 30])
+        exp = rng.choice([0, rng.uniform(0, 1e3), rng.uniform(0, 1e6), rng.uniform(0, 50 * leveling.exp_needed(level + 50, exp_mod)), leveling.exp_needed(level, exp_mod)])
+
+        gained, left = leveling.levels_gained(level, exp, exp_mod)
+        walked, walked_left = leveling._walk_levels(level, exp, exp_mod)
+
+        assert gained == walked
+        # The table subtracts running totals, so it rounds at their scale.
+        scale = leveling.exp_curve(exp_mod).paid[level + 1]
+        assert left == pytest.approx(walked_left, rel=1e-9, abs=1e-12 * scale + 1e-6)
+
+
+def test_exp_curve_follows_exp_mod():
+    player = Player("Tester")
+    player.level = 400
+    before = player.exp_to_levelup()
+
+    player.EXPMod += 1
+
+    assert player.exp_to_levelup() == leveling.exp_needed(400, player.EXPMod) < before
+    assert leveling.exp_curve(player.EXPMod) is leveling.exp_curve(player.EXPMod)
+
+
+def test_small_level_ups_take_the_loop(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("bulk path taken")
+
+    monkeypatch.setattr("player.bulk_level_up", fail)
+
+    player = leveled("Luna", 2, 50, 10)
+    gained, _ = leveling.levels_gained(player.level, player.EXP, player.EXPMod)
+    assert 0 < gained < leveling.BULK_LEVELS
+    player.level_up()
+    assert player.level == 50 + gained
+
+    player = leveled("Luna", 2, 50, 200)
+    gained, _ = leveling.levels_gained(player.level, player.EXP, player.EXPMod)
+    player.bulk_levels = None
+    player.level_up()
+    assert player.level == 50 + gained
+
+
+@pytest.mark.parametrize("name, level", [("Player", 200), ("Becca", 3000)])
+def test_bulk_level_up_matches_the_loop_in_distribution(name, level):
+    pytest.importorskip("numpy")
+    results = {True: [], False: []}
+    for seed in range(40):
+        for bulk in results:
+            player = leveled(name, seed, level, 400)
+            player.rng = random.Random(seed * 2 + bulk)
+            player.bulk_levels = 1 if bulk else None
+            player.level_up()
+            results[bulk].append(player)
+
+    bulk, each = results[True], results[False]
+    assert [player.level for player in bulk] == [player.level for player in each]
+
+    for stat in STATS:
+        bulk_values = [getattr(player, stat) for player in bulk]
+        each_values = [getattr(player, stat) for player in each]
+        spread = statistics.pstdev(each_values) + statistics.pstdev(bulk_values) + 1e-12
+        # Means of 40 runs agree to well within a few standard errors.
+        assert abs(statistics.mean(bulk_values) - statistics.mean(each_values)) <= spread, stat
+
+
+def test_bulk_level_up_is_reproducible():
+    pytest.importorskip("numpy")
+    first = leveled("Bubbles", 4, 1200, 300)
+    second = leveled("Bubbles", 4, 1200, 300)
+    first.bulk_levels = second.bulk_levels = 1
+
+    first.level_up()
+    second.level_up()
+
+    assert [getattr(first, stat) for stat in STATS] == [getattr(second, stat) for stat in STATS]
@@ -0,0 +1,94 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import random
+
+import pytest
+
+from autofighter.stats.modifiers import MODIFIED_STATS, compile_modifier
+from foe_passive_builder import ADJECTIVE_MODIFIERS, ADJECTIVE_TABLE, adjective_modifier
+from player import Player
+from tests.legacy_adjectives import LEGACY_ADJECTIVES
+from themedstuff import themed_ajt
+
+
+def random_foe(rng: random.Random, name: str) -> Player:
+    foe = Player(name, random.Random(rng.getrandbits(64)))
+    foe.MHP = rng.randint(1, 10 ** rng.randint(1, 15))
+    foe.Atk = rng.randint(1, 10 ** 6)
+    foe.Def = rng.randint(1, 10 ** 6)
+    foe.DodgeOdds = rng.random()
+    foe.CritDamageMod = rng.uniform(1, 5)
+    foe.CritRate = rng.random()
+    return foe
+
+
+def stats(player: Player) -> list[float]:
+    return [getattr(player, stat) for stat in MODIFIED_STATS]
+
+
+def test_every_adjective_has_a_modifier() -> None:
+    assert list(ADJECTIVE_TABLE) == themed_ajt
+    assert set(ADJECTIVE_MODIFIERS) == set(themed_ajt)
+
+
+@pytest.mark.parametrize("adjective", list(ADJECTIVE_TABLE))
+def test_compiled_modifiers_match_the_branches(adjective) -> None:
+    rng = random.Random(adjective)
+    legacy = LEGACY_ADJECTIVES[adjective]
+
+    for _ in range(500):
+        foe = random_foe(rng, f"{adjective} Becca")
+        expected = random_foe(random.Random(), "Expected")
+        for stat in MODIFIED_STATS:
+            setattr(expected, stat, getattr(foe, stat))
+
+        ADJECTIVE_MODIFIERS[adjective].apply(foe)
+        legacy(expected)
+
+        assert stats(foe) == stats(expected)
+        assert type(foe.MHP) is int
+
+
+def test_modifiers_chain_in_order() -> None:
+    foe = random_foe(random.Random(1), "Brutal Cruel Ally")
+    expected = adjective_modifier(("brutal",)).then(adjective_modifier(("cruel",)))
+
+    assert adjective_modifier(foe.traits.adjectives) == expected
+
+
+def test_unknown_stats_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        compile_modifier({"Speed": 2})
@@ -0,0 +1,87 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from autofighter.montecarlo import WaveResult, make_jobs, run_many, run_wave, summarize, main
+from autofighter.sim.wave import pick_foe_names
+
+
+def test_wave_jobs_are_reproducible_from_seed():
+    jobs = make_jobs(3, ("luna", "becca"), 60, 60, seed=7, max_ticks=3000)
+
+    first = run_many(jobs, workers=1)
+    second = [run_wave(job) for job in jobs]
+
+    assert first == second
+    assert [result.seed for result in first] == [7, 8, 9]
+
+
+def test_process_pool_matches_serial_run():
+    jobs = make_jobs(2, ("player", "ally"), 40, 40, seed=3, max_ticks=2000)
+
+    assert run_many(jobs, workers=2) == run_many(jobs, workers=1)
+
+
+def test_summarize_aggregates_results():
+    results = [
+        WaveResult(seed=0, outcome="won", ticks=100, damage_dealt=50, damage_taken=10, enrage_reached=False, party_survivors=2),
+        WaveResult(seed=1, outcome="won", ticks=300, damage_dealt=150, damage_taken=30, enrage_reached=True, party_survivors=1),
+        WaveResult(seed=2, outcome="lost", ticks=200, damage_dealt=10, damage_taken=80, enrage_reached=True, party_survivors=0),
+        WaveResult(seed=3, outcome=None, ticks=400, damage_dealt=0, damage_taken=0, enrage_reached=True, party_survivors=1),
+    ]
+
+    summary = summarize(results)
+
+    assert summary["runs"] == 4
+    assert summary["win_rate"] == 0.5
+    assert summary["loss_rate"] == 0.25
+    assert summary["timeout_rate"] == 0.25
+    assert summary["mean_ticks_to_kill"] == 200
+    assert summary["mean_damage_dealt"] == 52.5
+    assert summary["mean_damage_taken"] == 30
+    assert summary["enrage_rate"] == 0.75
+
+
+def test_cli_entry_point(capsys):
+    summary = main(["--runs", "2", "--workers", "1", "--level", "30", "--party", "luna", "--max-ticks", "1500", "--json"])
+
+    assert summary["runs"] == 2
+    assert '"win_rate"' in capsys.readouterr().out
+
+
+def test_low_level_waves_skip_late_game_foes():
+    names = [themed_name for _, themed_name in pick_foe_names(1)]
+
+    assert len(names) == len(set(names)) == 12
+    assert not {"carly", "mezzy", "mimic", "luna"} & set(names)
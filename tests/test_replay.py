@@ -0,0 +1,121 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+import io
+import random
+
+from functools import partial
+
+import pytest
+
+from autofighter.sim.battle import Battle
+from autofighter.sim.replay import ActionRecord, FighterRecord, OutcomeRecord, ReplayPlayer, ReplayWriter, read_replay, summarize
+from tests.helpers import make_fighter
+
+
+spawn = partial(make_fighter, Def=10, DodgeOdds=0.1, CritRate=0.2)
+
+
+def recorded_battle(seed: int) -> tuple[Battle, bytes]:
+    rng = random.Random(seed)
+    party = [spawn(f"Hero {i}", 3_000_000, 20000, True, rng) for i in range(2)]
+    foes = [spawn(f"Foe {i}", 600_000, 12000, False, rng) for i in range(2)]
+    backups = [spawn("Backup Foe", 600_000, 12000, False, rng)]
+
+    stream = io.BytesIO()
+    battle = Battle(party, foes, backup_foes_list=backups, level=10, persist=False, rng=rng, recorder=ReplayWriter(stream, hp_interval=5))
+    battle.run_wave(max_ticks=20000)
+    return battle, stream.getvalue()
+
+
+def test_replay_reaggregates_the_wave():
+    battle, data = recorded_battle(1)
+    records = list(read_replay(io.BytesIO(data)))
+    summary = summarize(records)
+
+    fighters = {fighter.PlayerName: fighter for fighter in battle.playerlist + battle.backup_players_list}
+    heroes = [fighter for fighter in summary.fighters.values() if fighter.isplayer]
+
+    assert summary.outcome == battle.outcome
+    assert summary.ticks == battle.ticks
+    assert isinstance(records[-1], OutcomeRecord)
+    for hero in heroes:
+        if hero.name in fighters:
+            assert hero.damage_dealt == fighters[hero.name].DamageDealt
+    assert sum(fighter.kills for fighter in heroes) == sum(player.Kills for player in battle.playerlist)
+
+
+def test_replay_flags_kills_and_declares_fighters_first():
+    _, data = recorded_battle(2)
+    records = list(read_replay(io.BytesIO(data)))
+
+    declared = {record.fighter for record in records if isinstance(record, FighterRecord) and record.tick == 0}
+    actions = [record for record in records if isinstance(record, ActionRecord)]
+
+    assert len(declared) == 5
+    assert all(action.source in declared and action.target in declared for action in actions)
+    assert sum(action.kill for action in actions if action.target in declared) >= 3
+    assert any(action.crit for action in actions)
+
+
+def test_replay_player_fast_forwards_to_the_end():
+    battle, data = recorded_battle(3)
+    records = list(read_replay(io.BytesIO(data)))
+
+    player = ReplayPlayer(records)
+    frames = list(player.frames(speed=250))
+
+    assert player.finished
+    assert frames[-1][0] >= battle.ticks
+    foes = [state for state in player.fighters.values() if not state.isplayer]
+    assert all(state.HP < 1 for state in foes)
+
+
+def test_replay_is_compact():
+    battle, data = recorded_battle(4)
+    actions = sum(1 for record in read_replay(io.BytesIO(data)) if isinstance(record, ActionRecord))
+
+    assert len(data) < 200 + actions * 40 + battle.ticks * 5
+
+
+def test_truncated_replay_is_rejected():
+    _, data = recorded_battle(5)
+
+    with pytest.raises(ValueError):
+        list(read_replay(io.BytesIO(data[:-3])))
+
+    with pytest.raises(ValueError):
+        list(read_replay(io.BytesIO(b"nope")))
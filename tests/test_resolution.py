@@ -0,0 +1,129 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+import random
+
+from functools import partial
+
+import pytest
+
+from autofighter.sim import resolution
+from autofighter.sim.battle import Battle, WON
+from autofighter.sim.resolution import Attack, roll_damage
+from damagetypes import Fire, Lightning
+from tests.helpers import SKIRMISH_STATS, make_fighter
+
+
+spawn = partial(make_fighter, roll_speed=True, **SKIRMISH_STATS)
+
+
+def skirmish(seed: int, **kwargs) -> Battle:
+    rng = random.Random(seed)
+    party = [spawn(f"Hero {i}", 60000 + i * 15000, 400000, True, rng) for i in range(3)]
+    foes = [spawn(f"Foe {i}", 35000 + i * 10000, 300000, False, rng) for i in range(3)]
+    backups = [spawn(f"Backup Foe {i}", 30000, 250000, False, rng) for i in range(2)]
+    party[1].Type = Lightning
+    foes[0].Type = Fire
+    return Battle(party, foes, backup_foes_list=backups, level=50, persist=False, timeout_ticks=300, rng=rng, batched=True, **kwargs)
+
+
+def battle_state(battle: Battle) -> list:
+    fighters = battle.playerlist + battle.foelist + battle.backup_foes_list
+    return [(f.PlayerName, f.HP, f.DamageDealt, f.Kills, f.EXP) for f in fighters] + [battle.ticks, battle.outcome]
+
+
+def test_batched_wave_is_decided_with_kills_and_exp():
+    kills = []
+    battle = skirmish(3, on_kill=lambda dead, killer: kills.append((dead, killer)))
+
+    assert battle.run_wave(max_ticks=20000) is not None
+    assert battle.attacks == []
+
+    foe_kills = [dead for dead, killer in kills if not dead.isplayer]
+    assert sum(player.Kills for player in battle.fighters if player.isplayer) == len(foe_kills)
+    if battle.outcome == WON:
+        assert len(foe_kills) == 5
+        assert all(player.EXP > 0 for player in battle.playerlist)
+
+
+def test_first_declared_attack_takes_the_kill():
+    rng = random.Random(1)
+    hero = spawn("Hero", 1, 1000, True, rng)
+    hero.Def = 1
+    first = spawn("First", 10 ** 6, 1000, False, rng)
+    second = spawn("Second", 10 ** 6, 1000, False, rng)
+    for foe in (first, second):
+        foe.CritRate = 0
+    hero.DodgeOdds = 0
+
+    kills = []
+    battle = Battle([hero], [first, second], level=1, persist=False, rng=rng, batched=True, on_kill=lambda dead, killer: kills.append(killer))
+    battle.attacks = [Attack(first, hero), Attack(second, hero)]
+    battle.resolve_attacks()
+
+    assert kills == [first]
+    assert first.DamageDealt >= 1000 and second.DamageDealt == 0
+    assert battle.playerlist == []
+
+
+def test_rolls_match_deal_damage():
+    source = spawn("Source", 12345, 1000, True, random.Random(7))
+    target = spawn("Target", 1, 1000, False, random.Random(8))
+    target.Type = Fire
+
+    expected = []
+    source.rng = random.Random(9)
+    for _ in range(20):
+        expected.append((source.deal_damage(1.3, target.Type), source.last_crit))
+
+    source.rng = random.Random(9)
+    attacks = [Attack(source, target) for _ in range(20)]
+    roll_damage(attacks, 1.3)
+
+    assert [attack.crit for attack in attacks] == [crit for _, crit in expected]
+    assert [attack.damage for attack in attacks] == pytest.approx([damage for damage, _ in expected])
+
+
+def test_vectorized_path_matches_python_path(monkeypatch):
+    monkeypatch.setattr(resolution, "VECTOR_MIN", 10 ** 9)
+    plain = skirmish(5)
+    plain.run_wave(max_ticks=5000)
+
+    monkeypatch.setattr(resolution, "VECTOR_MIN", 0)
+    vectorized = skirmish(5)
+    vectorized.run_wave(max_ticks=5000)
+
+    assert battle_state(vectorized) == battle_state(plain)
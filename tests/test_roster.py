@@ -0,0 +1,93 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+import pickle
+import random
+import multiprocessing
+
+from autofighter.sim.roster import RosterPool, hydrate, to_record
+from autofighter.sim.wave import build_foes
+from damagetypes import Fire
+from player import Player
+
+
+def foe_stats(foes: list[Player]) -> list[tuple]:
+    return [(foe.PlayerName, foe.level, foe.MHP, foe.Atk, foe.Def, foe.Type, foe.ActionPointsPerTurn) for foe in foes]
+
+
+def test_record_round_trip_keeps_stats_and_type_identity():
+    hero = Player("Hero", random.Random(3))
+    hero.Type = Fire
+    hero.set_level(120)
+    hero.photodata = object()
+
+    record = pickle.loads(pickle.dumps(to_record(hero)))
+    clone = hydrate(record)
+
+    assert "photodata" not in record and "rng" not in record
+    assert clone.Type is Fire
+    assert (clone.MHP, clone.Atk, clone.level, len(clone.Items)) == (hero.MHP, hero.Atk, hero.level, len(hero.Items))
+    assert clone.DOTS == [] and clone.HOTS == []
+
+
+def test_pool_builds_the_same_foes_as_serial_build():
+    pool = RosterPool(workers=2, mp_context=multiprocessing.get_context("fork"))
+
+    try:
+        pooled, pooled_backups = build_foes(80, rng=random.Random(6), pool=pool)
+    finally:
+        pool.close()
+
+    serial, serial_backups = build_foes(80, rng=random.Random(6))
+
+    assert foe_stats(pooled + pooled_backups) == foe_stats(serial + serial_backups)
+
+
+def test_pool_levels_up_allies_in_place(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    hero = Player("Hero")
+    hero.EXP = 10 ** 6
+    hero.photodata = photo = object()
+
+    pool = RosterPool(workers=1, mp_context=multiprocessing.get_context("fork"))
+    try:
+        pool.level_up([hero])
+    finally:
+        pool.close()
+
+    assert hero.level > 1
+    assert hero.photodata is photo
+    assert (tmp_path / "lives" / "Hero.dat").exists()
@@ -0,0 +1,138 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+import pickle
+import random
+
+from functools import partial
+
+from autofighter.sim.battle import Battle
+from damagetypes import Fire, Lightning
+from tests.helpers import SKIRMISH_STATS, make_fighter
+
+
+spawn = partial(make_fighter, roll_speed=True, **SKIRMISH_STATS)
+
+
+def skirmish(seed: int) -> Battle:
+    rng = random.Random(seed)
+    party = [spawn(f"Hero {i}", 40000 + i * 15000, 400000, True, rng) for i in range(3)]
+    foes = [spawn(f"Foe {i}", 35000 + i * 10000, 300000, False, rng) for i in range(3)]
+    backups = [spawn(f"Backup Foe {i}", 30000, 250000, False, rng) for i in range(2)]
+    party[1].Type = Lightning
+    foes[0].Type = Fire
+    return Battle(party, foes, backup_foes_list=backups, level=50, persist=False, timeout_ticks=200, rng=rng)
+
+
+def battle_state(battle: Battle) -> list[tuple]:
+    battle.sync_action_points()
+    fighters = battle.playerlist + battle.foelist + battle.backup_foes_list
+    return [
+        (f.PlayerName, f.HP, f.ActionPoints, f.DamageDealt, f.Kills, [(type(d).__name__, d.turns) for d in f.DOTS])
+        for f in fighters
+    ] + [battle.ticks, battle.outcome, battle.enrage_mod]
+
+
+def run(battle: Battle, ticks: int) -> list:
+    states = []
+    for _ in range(ticks):
+        battle.step()
+        states.append(battle_state(battle))
+    return states
+
+
+def test_restore_replays_the_same_ticks():
+    battle = skirmish(4)
+    run(battle, 150)
+    snapshot = battle.snapshot()
+
+    expected = run(battle, 400)
+    battle.restore(snapshot)
+
+    assert battle.ticks == snapshot.ticks
+    assert run(battle, 400) == expected
+
+
+def test_restore_brings_back_dots_and_dead_fighters():
+    battle = skirmish(7)
+    run(battle, 100)
+    snapshot = battle.snapshot()
+    before = battle_state(battle)
+
+    battle.run_wave(max_ticks=5000)
+    assert battle.outcome is not None
+
+    battle.restore(snapshot)
+    assert battle_state(battle) == before
+    assert battle.outcome is None
+
+
+def test_snapshot_branches_in_an_independent_battle():
+    battle = skirmish(9)
+    run(battle, 120)
+    snapshot = pickle.loads(pickle.dumps(battle.snapshot()))
+
+    branch = Battle.from_snapshot(snapshot)
+    assert run(branch, 300) == run(battle, 300)
+
+    branch.restore(snapshot)
+    assert branch.ticks == snapshot.ticks
+
+
+def test_branches_do_not_share_fighters_or_streams():
+    battle = skirmish(2)
+    run(battle, 50)
+    snapshot = battle.snapshot()
+
+    branch = Battle.from_snapshot(snapshot)
+    branch.playerlist[0].Atk *= 100
+    run(branch, 200)
+
+    assert battle.ticks == 50
+    assert battle.playerlist[0].Atk == snapshot.fighters[0]["Atk"]
+    assert branch.rng is not battle.rng
+    assert all(fighter not in battle.fighters for fighter in branch.fighters)
+
+
+def test_snapshot_leaves_photos_behind():
+    battle = skirmish(1)
+    surface = object()
+    for fighter in battle.fighters:
+        fighter.photodata = surface
+
+    snapshot = battle.snapshot()
+
+    assert all("photodata" not in record for record in snapshot.fighters)
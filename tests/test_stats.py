@@ -0,0 +1,338 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+
+import random
+import statistics
+
+import pytest
+
+from autofighter.stats import curves
+from autofighter.stats.base import diminish_base_gain
+from items import ItemType, split_upgrades, upgrade_moments
+from player import Player
+
+
+def legacy_check_base_stats(player: Player, stat_total: int, stat_gain: int):
+    """``Player.check_base_stats`` before the closed form, kept as the reference."""
+    stats_to_start_lower = 50
+    to_be_lowered_by = 10 + (stat_total // 1000)
+
+    stat_modifiers = {}
+
+    for i in range(45):
+        new_key = (i * 100)
+        new_value = to_be_lowered_by ** max(0.7 * (i + 1), 1.0)
+        stat_modifiers[new_key] = new_value
+
+    stat_modifiers[stats_to_start_lower] = to_be_lowered_by
+
+    desired_increase = stat_gain
+
+    for item in player.Items:
+        desired_increase = item.stat_gain(desired_increase)
+
+    for threshold, modifier in stat_modifiers.items():
+        if stat_total > threshold:
+            desired_increase = desired_increase / max((modifier * (stat_total // stats_to_start_lower)), 1)
+            break
+
+    return max(min(int(desired_increase), 1000), 1)
+
+
+def stat_totals(rng: random.Random) -> list:
+    edges = [-5000, -1, 0, 1, 49, 50, 51, 99, 100, 101, 999, 1000, 1001, 4399, 4400, 4401, 10 ** 6, 2 * 10 ** 9, 10 ** 12]
+    spread = [rng.randint(1, 10 ** rng.randint(1, 12)) for _ in range(400)]
+    floats = [rng.uniform(-10, 10 ** rng.randint(1, 9)) for _ in range(200)]
+    return edges + spread + floats
+
+
+@pytest.mark.parametrize("items", [0, 3, 5])
+def test_check_base_stats_matches_legacy(items):
+    rng = random.Random(items)
+    player = Player("Tester", rng)
+    player.Items = [ItemType(rng) for _ in range(items)]
+
+    for stat_total in stat_totals(rng):
+        for stat_gain in [0, 1, 5, 1000, rng.randint(1, 10 ** 7), rng.uniform(0, 10 ** 12), -3]:
+            assert player.check_base_stats(stat_total, stat_gain) == legacy_check_base_stats(player, stat_total, stat_gain)
+
+
+def test_gain_is_clamped():
+    assert diminish_base_gain(0, 10 ** 9) == 1000
+    assert diminish_base_gain(10 ** 9, 1) == 1
+
+
+def test_huge_totals_do_not_overflow():
+    # The old table raised OverflowError here building entries it never used.
+    assert diminish_base_gain(10 ** 15, 5000) == 1
+
+
+def legacy_gain_vit(player: Player, points):
+    """``Player.gain_vit`` before the closed form."""
+    stats_to_start_lower = 1.2
+    to_be_lowered_by = (player.Vitality ** 1.5)
+
+    stat_modifiers = {}
+
+    for i in range(65):
+        new_key = (i * 0.25)
+        new_value = to_be_lowered_by ** max(0.3 * (i + 1), 1.0)
+        stat_modifiers[new_key] = new_value
+
+    stat_modifiers[stats_to_start_lower] = to_be_lowered_by
+
+    for threshold, modifier in stat_modifiers.items():
+        if player.Vitality > threshold:
+            player.Vitality += max(((points) / (player.Vitality ** modifier)), 0.0000000001)
+            break
+
+
+def test_gain_vit_matches_legacy():
+    rng = random.Random(11)
+    player = Player("Tester", rng)
+    reference = Player("Reference", rng)
+
+    for _ in range(2000):
+        vitality = rng.choice([rng.uniform(0.001, 1.2), rng.uniform(1, 6), 0.25, 1.2, 16.0])
+        points = rng.uniform(0, 10 ** rng.randint(-6, 3))
+        player.Vitality = reference.Vitality = vitality
+
+        player.gain_vit(points)
+        legacy_gain_vit(reference, points)
+
+        assert player.Vitality == reference.Vitality
+
+
+def test_past_life_budget_matches_loop():
+    rng = random.Random(12)
+
+    for _ in range(200):
+        player = Player("Tester", rng)
+        player.Vitality = rng.uniform(0.5, 3)
+        budget = rng.uniform(0, 50)
+        start = player.Vitality
+
+        remaining = budget
+        while remaining > 0:
+            vit_gain = max(0.001, player.Vitality - 1) * 0.95
+            player.gain_vit(vit_gain)
+            remaining -= vit_gain
+
+        assert curves.vitality_after_budget(start, budget) == player.Vitality
+
+
+def test_past_life_vitality_follows_the_loop():
+    rng = random.Random(13)
+    cases = [(1.0, 300.0), (1.0005, 232.0), (2.5, 0.3), (8.0, 5000.0), (0.2, 10.0), (-1.0, 10.0)]
+    cases += [(rng.choice([1.0, rng.uniform(0.5, 2), rng.uniform(1, 6)]), rng.choice([rng.uniform(0, 5), rng.uniform(0, 500)])) for _ in range(100)]
+
+    for vitality, budget in cases:
+        assert curves.past_life_vitality(vitality, budget) == pytest.approx(curves.vitality_after_budget(vitality, budget), rel=3e-4)
+
+    np = pytest.importorskip("numpy")
+    vitality = np.array([case[0] for case in cases])
+    budget = np.array([case[1] for case in cases])
+    assert curves.past_life_vitality(vitality, budget).tolist() == [curves.past_life_vitality(v, b) for v, b in cases]
+
+
+def test_crit_gains_match_player_methods():
+    rng = random.Random(13)
+    player = Player("Tester", rng)
+
+    for _ in range(2000):
+        crit_rate = rng.choice([rng.uniform(0, 1), rng.uniform(1, 15), 1.0])
+        crit_damage = rng.choice([rng.uniform(1, 10), rng.uniform(10, 500), 10.0])
+        points = rng.choice([rng.uniform(0, 0.25), rng.uniform(0.25, 100)])
+
+        player.CritRate = crit_rate
+        player.gain_crit_rate(points)
+        assert player.CritRate == crit_rate + curves.crit_rate_gain(crit_rate, points)
+
+        player.CritDamageMod = crit_damage
+        player.gain_crit_damage(points)
+        assert player.CritDamageMod == crit_damage + curves.crit_damage_gain(crit_damage, points)
+
+
+@pytest.mark.parametrize("start, points", [(0.03, 0.5), (0.8, 3), (2.0, 40), (14.0, 10)])
+def test_crit_rate_after_integrates_small_gains(start, points):
+    player = Player("Tester")
+    player.CritRate = start
+    for _ in range(10000):
+        player.gain_crit_rate(points / 10000)
+
+    assert curves.crit_rate_after(start, points) == pytest.approx(player.CritRate, rel=1e-4)
+
+
+@pytest.mark.parametrize("start, gain", [(0.03, 0.3), (0.5, 2.0), (3.0, 25.0)])
+def test_crit_rate_after_without_free_points_matches_large_gains(start, gain):
+    player = Player("Tester")
+    player.CritRate = start
+    for _ in range(2000):
+        player.gain_crit_rate(gain)
+
+    assert curves.crit_rate_after(start, gain * 2000, free=False) == pytest.approx(player.CritRate, rel=1e-3)
+
+
+@pytest.mark.parametrize("start, points", [(2, 5), (9, 500), (15, 3000), (42, 20000)])
+def test_crit_damage_after_integrates_small_gains(start, points):
+    player = Player("Tester")
+    player.CritDamageMod = start
+    for _ in range(10000):
+        player.gain_crit_damage(points / 10000)
+
+    assert curves.crit_damage_after(start, points) == pytest.approx(player.CritDamageMod, rel=1e-3)
+
+
+def test_curves_accept_arrays():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(14)
+    vitality = np.array([rng.uniform(0.5, 4) for _ in range(50)] + [0.0, -1.0])
+    crit_rate = np.array([rng.uniform(0, 12) for _ in range(52)])
+    crit_damage = np.array([rng.uniform(1, 300) for _ in range(52)])
+    points = np.array([rng.uniform(0, 2) for _ in range(52)])
+
+    assert curves.vitality_gain(vitality, points).tolist() == pytest.approx([curves.vitality_gain(v, p) for v, p in zip(vitality.tolist(), points.tolist())])
+    assert curves.crit_rate_gain(crit_rate, points).tolist() == pytest.approx([curves.crit_rate_gain(c, p) for c, p in zip(crit_rate.tolist(), points.tolist())])
+    assert curves.crit_damage_gain(crit_damage, points).tolist() == pytest.approx([curves.crit_damage_gain(c, p) for c, p in zip(crit_damage.tolist(), points.tolist())])
+
+    budgets = points * 20
+    assert curves.vitality_after_budget(vitality[:50], budgets[:50]).tolist() == pytest.approx([curves.vitality_after_budget(v, b) for v, b in zip(vitality[:50].tolist(), budgets[:50].tolist())])
+    assert curves.crit_rate_after(crit_rate, budgets).tolist() == pytest.approx([curves.crit_rate_after(c, b) for c, b in zip(crit_rate.tolist(), budgets.tolist())])
+    assert curves.crit_damage_after(crit_damage, budgets * 100).tolist() == pytest.approx([curves.crit_damage_after(c, b) for c, b in zip(crit_damage.tolist(), (budgets * 100).tolist())])
+
+
+def legacy_gain_dodgeodds_rate(dodge_odds, points):
+    """``Player.gain_dodgeodds_rate`` before the closed form; returns ``(dodge_odds, steps)``."""
+    cost = 1 + dodge_odds
+    to_be_lowered_by = 100
+    steps = 0
+
+    temppoints = points / (to_be_lowered_by ** 3.5)
+
+    while temppoints > 0.01:
+        dodge_odds += max(0.00001 ** 0.00001, 0.1 / ((to_be_lowered_by * (dodge_odds ** 3)) + 1))
+        cost += 1
+        temppoints -= 0.0005 * cost
+        steps += 1
+
+    return dodge_odds, steps
+
+
+def dodge_cases(rng: random.Random, count: int) -> list:
+    cases = [(0.03, 0), (0.03, 10 ** 5), (0.03, 10 ** 5 + 1), (0, 10 ** 9), (5.0, 10 ** 7 * 0.0105)]
+    for _ in range(count):
+        dodge_odds = rng.choice([rng.uniform(0, 0.1), rng.uniform(0, 5), rng.uniform(-0.25, 0)])
+        points = rng.choice([rng.uniform(0, 10 ** rng.randint(1, 11)), rng.uniform(0, 10 ** 6)])
+        cases.append((dodge_odds, points))
+    return cases
+
+
+def test_dodge_odds_gain_matches_step_loop():
+    rng = random.Random(15)
+
+    for dodge_odds, points in dodge_cases(rng, 3000):
+        expected, steps = legacy_gain_dodgeodds_rate(dodge_odds, points)
+
+        if dodge_odds >= 0:
+            assert curves.dodge_odds_steps(dodge_odds, points) == steps
+        assert dodge_odds + curves.dodge_odds_gain(dodge_odds, points) == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_gain_dodgeodds_rate_uses_the_curve():
+    player = Player("Tester")
+    player.DodgeOdds = 0.03
+
+    player.gain_dodgeodds_rate(10 ** 10)
+
+    assert player.DodgeOdds == pytest.approx(legacy_gain_dodgeodds_rate(0.03, 10 ** 10)[0])
+
+
+def test_dodge_curve_accepts_arrays():
+    np = pytest.importorskip("numpy")
+    cases = [(dodge_odds, points) for dodge_odds, points in dodge_cases(random.Random(16), 500) if dodge_odds >= 0]
+    dodge_odds = np.array([dodge for dodge, _ in cases])
+    points = np.array([points for _, points in cases])
+
+    assert curves.dodge_odds_steps(dodge_odds, points).tolist() == [curves.dodge_odds_steps(d, p) for d, p in cases]
+
+
+@pytest.mark.parametrize("scale", [-1.0, 0.0005, 0.004, 0.02, 0.5])
+def test_upgrade_moments_match_sampled_rolls(scale):
+    rng = random.Random(19)
+    rolls = [max(rng.uniform(0.001, 0.01) * scale, 0.00001) for _ in range(200000)]
+    mean, variance = upgrade_moments(scale)
+
+    assert mean == pytest.approx(statistics.fmean(rolls), rel=1e-2)
+    assert variance == pytest.approx(statistics.pvariance(rolls), rel=5e-2, abs=1e-18)
+
+
+@pytest.mark.parametrize("mod_fixed", [0.1, 3.0, 40.0])
+def test_upgrade_many_matches_repeated_upgrades(mod_fixed):
+    rng = random.Random(20)
+    one_by_one, batched = [], []
+
+    for _ in range(300):
+        item = ItemType(rng)
+        power = item.power
+
+        item.upgrade_many(mod_fixed, 400, rng)
+        batched.append(item.power - power)
+
+        item.power = power
+        for _ in range(400):
+            item.upgrade(mod_fixed, rng)
+        one_by_one.append(item.power - power)
+
+    assert statistics.fmean(batched) == pytest.approx(statistics.fmean(one_by_one), rel=1e-2)
+    assert statistics.pstdev(batched) == pytest.approx(statistics.pstdev(one_by_one), rel=0.25)
+
+
+def test_split_upgrades_shares_out_every_upgrade():
+    rng = random.Random(21)
+    counts = [split_upgrades(399, 6, rng) for _ in range(2000)]
+
+    assert all(sum(split) == 399 for split in counts)
+    for column in zip(*counts):
+        assert statistics.fmean(column) == pytest.approx(399 / 6, rel=2e-2)
+
+
+def test_set_level_fills_and_upgrades_items():
+    player = Player("Tester", rng=random.Random(22))
+    player.set_level(20000)
+
+    assert len(player.Items) == 6
+    assert all(1.001 <= item.power < 1.3 for item in player.Items)
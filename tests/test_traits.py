@@ -0,0 +1,82 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import damagestate
+
+from autofighter.traits import LADY_ELEMENTS, resolve_traits
+from player import Player
+from themedstuff import themed_ajt, themed_names
+
+
+def legacy_characters(name: str) -> tuple[str, ...]:
+    # foe_passive_builder checked the themed name as is, damagestate checked
+    # lady_echo with a space.
+    lowered = name.lower()
+    return tuple(themed for themed in themed_names if themed in lowered or themed.replace("_", " ") in lowered)
+
+
+def test_traits_match_the_substring_checks() -> None:
+    names = [f"{adjective.capitalize()} {themed.replace('_', ' ')}" for adjective in themed_ajt for themed in themed_names]
+    names += [themed.replace("_", " ").capitalize() for themed in themed_names]
+    names += ["Player", "Cruel Nobody", "Vicious Lady Fire And Ice"]
+
+    for name in names:
+        traits = resolve_traits(name)
+        lowered = name.lower()
+
+        assert traits.characters == legacy_characters(name)
+        assert traits.adjectives == tuple(adjective for adjective in themed_ajt if adjective in lowered)
+        assert traits.lady == ("lady" in lowered)
+        assert traits.elements == (tuple(element for element in LADY_ELEMENTS if element in lowered) if traits.lady else ())
+
+
+def test_player_traits_follow_the_name() -> None:
+    player = Player("Cruel Luna")
+    assert "luna" in player.traits
+    assert "cruel" in player.traits
+
+    player.PlayerName = "Player"
+    assert player.traits.characters == ()
+    assert player.traits.adjectives == ()
+
+
+def test_passives_run_in_character_order() -> None:
+    def passives(source: str, target: str) -> list:
+        return damagestate._passives(Player(source), Player(target))
+
+    assert passives("Vicious Mezzy", "Cruel Carly") == [damagestate._carly_hit, damagestate._mezzy]
+    assert passives("Vicious Luna", "Cruel Carly") == [damagestate._luna, damagestate._carly_hit]
+    assert passives("Vicious Carly", "Cruel Carly") == [damagestate._carly]
+    assert passives("Vicious Lady Echo", "Cruel Becca") == [damagestate._lady_echo]
@@ -0,0 +1,231 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import random
+
+import pytest
+
+import statistics
+
+from autofighter.stats.transfers import base_stat_after, steps_above, uniform_sum
+from foe_passive_builder import _apply_themed_name_modifiers
+from items import ItemType
+from passives import get_passive
+from player import Player
+
+
+STATS = ["MHP", "Atk", "Def", "CritRate", "DodgeOdds"]
+
+
+def legacy_luna(player: Player) -> None:
+    dodge_buff = 0.35
+    max_hp_debuff = player.MHP / 4
+
+    while player.MHP > max_hp_debuff:
+        dodge_buff = dodge_buff + (0.001 * player.Vitality)
+        player.MHP = player.MHP - 1
+
+    player.Atk = int(player.Atk * 1)
+    player.Def = int(player.Def * 2)
+    player.gain_crit_rate(0.00001 * player.level)
+    player.DodgeOdds += dodge_buff * player.Vitality
+
+
+def luna(seed: int, mhp: float) -> Player:
+    player = Player("Luna", rng=random.Random(seed))
+    player.set_level(random.Random(seed).randint(1, 3000))
+    player.MHP = mhp
+    return player
+
+
+@pytest.mark.parametrize("seed, mhp", [(0, 0), (1, 1), (2, 3), (3, 4), (4, 1001), (5, 123457), (6, 99.5), (7, 250000.25)])
+def test_luna_foe_passive_matches_the_loop(seed, mhp):
+    new, old = luna(seed, mhp), luna(seed, mhp)
+
+    _apply_themed_name_modifiers(new)
+    legacy_luna(old)
+
+    assert new.MHP == old.MHP
+    for stat in STATS[1:]:
+        assert getattr(new, stat) == pytest.approx(getattr(old, stat), rel=1e-9)
+
+
+@pytest.mark.parametrize("mhp", [1, 4, 2001, 654321])
+def test_luna_player_passive_matches_the_loop(mhp):
+    new, old = luna(9, mhp), luna(9, mhp)
+
+    get_passive("luna_passive").on_apply(new)
+    legacy_luna(old)
+
+    for stat in STATS:
+        assert getattr(new, stat) == pytest.approx(getattr(old, stat), rel=1e-9)
+
+
+def test_luna_sheds_huge_hp_at_once():
+    player = luna(10, 1_999_999_999)
+    _apply_themed_name_modifiers(player)
+
+    assert player.MHP == 499_999_999
+
+
+def test_steps_above_counts_loop_iterations():
+    rng = random.Random(11)
+    for _ in range(300):
+        value = rng.choice([rng.randint(-5, 500), rng.uniform(-5, 500)])
+        floor = rng.uniform(-10, 500)
+        step = rng.choice([1, 0.01, rng.uniform(0.01, 50)])
+
+        steps = 0
+        while value - steps * step > floor:
+            steps += 1
+
+        assert steps_above(value, floor, step) == steps
+
+
+def test_base_stat_after_matches_repeated_check_base_stats():
+    rng = random.Random(12)
+    for _ in range(150):
+        player = Player("Tester", rng=rng)
+        player.Items = [ItemType(rng) for _ in range(rng.randint(0, 5))]
+        stat = rng.choice([rng.randint(-50, 60), rng.randint(0, 30000), rng.randint(0, 10 ** 7)])
+        stat_gain = rng.choice([0, rng.randint(1, 100), rng.randint(1, 10 ** 6), rng.randint(1, 10 ** 10)])
+        steps = rng.randint(0, 3000)
+
+        total = stat
+        for _ in range(steps):
+            total += player.check_base_stats(total, stat_gain)
+
+        assert base_stat_after(player, stat, stat_gain, steps) == total
+
+
+def test_uniform_sum_matches_the_draws_it_replaces():
+    rng = random.Random(13)
+    source = random.Random(5)
+    assert uniform_sum(random.Random(5), 10, 0.01, 0.3) == sum(source.uniform(0.01, 0.3) for _ in range(10))
+
+    sums = [uniform_sum(rng, 400, 0.05, 0.25) for _ in range(4000)]
+    assert statistics.fmean(sums) == pytest.approx(400 * 0.15, rel=1e-3)
+    assert statistics.pstdev(sums) == pytest.approx(0.2 * (400 / 12) ** 0.5, rel=5e-2)
+
+
+def legacy_carly(player: Player) -> None:
+    def_to_add = 10000
+
+    player.MHP *= 10
+    player.Mitigation *= 10
+    player.EffectRES += 255
+
+    max_hp_debuff = max(player.MHP - player.rng.randint(5 * player.level, 15 * player.level), 10)
+    max_crit_rate = player.CritRate / 100
+    max_atk_stat = round(player.Atk * 0.95)
+    item_buff = player.rng.uniform(0.4, 0.9)
+
+    while player.Vitality > max(0.2, player.Vitality / player.level):
+        item_buff += player.rng.uniform(0.01, 0.3)
+        player.Vitality = player.Vitality - 0.001
+
+    while player.MHP > max_hp_debuff:
+        player.Def += player.check_base_stats(player.Def, def_to_add)
+        player.MHP = player.MHP - 1
+
+    while player.CritRate > max_crit_rate:
+        player.Def += player.check_base_stats(player.Def, def_to_add)
+        player.CritRate -= player.CritRate / 15
+
+    while player.Atk > max_atk_stat:
+        player.Def += player.check_base_stats(player.Def, def_to_add)
+        player.Atk = player.Atk - 1
+
+    while player.Regain > 5:
+        player.Def += player.check_base_stats(player.Def, def_to_add)
+        player.Regain = player.Regain - 0.001
+
+    player.Atk = int(player.Atk) + 1
+    player.Def += player.check_base_stats(player.Def, int(player.Def * player.level) + 1)
+
+    player.gain_crit_damage((0.0002 * player.level))
+
+    while player.Def > 25000:
+        item_buff += player.rng.uniform(0.05, 0.25)
+        player.Def = player.Def - 5
+
+    for item in player.Items:
+        item.name = "Carly\'s Blessing of Defense"
+        item.power += player.level * item_buff
+
+
+def carly(seed: int, level: int) -> Player:
+    player = Player("Carly", rng=random.Random(seed))
+    player.set_level(level)
+    player.Regain *= 100
+    return player
+
+
+@pytest.mark.parametrize("seed, level", [(0, 1), (1, 40), (2, 300), (3, 700)])
+def test_carly_foe_passive_matches_the_loops(seed, level):
+    new, old = carly(seed, level), carly(seed, level)
+
+    _apply_themed_name_modifiers(new)
+    legacy_carly(old)
+
+    for stat in ["MHP", "Atk", "Def", "CritRate", "CritDamageMod", "Mitigation"]:
+        assert getattr(new, stat) == getattr(old, stat), stat
+    assert new.Vitality == pytest.approx(old.Vitality, abs=2e-3)
+    assert new.Regain == pytest.approx(old.Regain, abs=2e-3)
+
+
+def test_carly_player_passive_matches_the_loops():
+    new, old = carly(6, 800), carly(6, 800)
+    new.Items = [ItemType(random.Random(7))]
+    old.Items = [ItemType(random.Random(7))]
+
+    get_passive("carly_passive").on_apply(new)
+
+    def_to_add = old.check_base_stats(old.Def, old.Items[0].power / 2) + (old.Atk // 2)
+    while old.Atk > 0:
+        old.Def += old.check_base_stats(old.Def, def_to_add)
+        old.Atk -= 1
+    while old.Regain > 5:
+        old.Def += old.check_base_stats(old.Def, def_to_add)
+        old.Regain -= 0.001
+    old.Atk = int(old.Atk) + 1
+    old.Def += old.check_base_stats(old.Def, int(old.Def * old.level) + 1)
+    old.gain_crit_damage(0.0002 * old.level)
+    while old.Def > 25000:
+        old.Def -= 5
+
+    for stat in ["Atk", "Def", "CritDamageMod"]:
+        assert getattr(new, stat) == getattr(old, stat), stat
+    assert new.Regain == pytest.approx(old.Regain, abs=2e-3)
@@ -0,0 +1,161 @@
+import sys
+import types
+from pathlib import Path
+
+halo_stub = types.ModuleType("halo")
+
+
+class DummyHalo:
+    def __init__(self, *args, **kwargs) -> None:
+        """Stand-in for the Halo spinner."""
+
+
+halo_stub.Halo = DummyHalo
+sys.modules.setdefault("halo", halo_stub)
+
+colorama_stub = types.ModuleType("colorama")
+
+
+class DummyColor:
+    def __getattr__(self, _):
+        """Return empty string for any attribute."""
+
+        return ""
+
+
+colorama_stub.Fore = DummyColor()
+colorama_stub.Style = DummyColor()
+sys.modules.setdefault("colorama", colorama_stub)
+
+pygame_stub = types.ModuleType("pygame")
+pygame_stub.image = types.SimpleNamespace(load=lambda *args, **kwargs: object())
+sys.modules.setdefault("pygame", pygame_stub)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+import random
+
+from autofighter.sim.foe_cache import FoeCache
+from autofighter.sim.wave import NUMBER_OF_FOES, FoeSpec, Wave, WavePipeline, build_foe, build_foes, build_wave, mimic_source, wave_level
+from player import Player
+
+
+class RecordingBuilder:
+    def __init__(self) -> None:
+        self.levels: list[int] = []
+
+    def __call__(self, level: int) -> Wave:
+        self.levels.append(level)
+        return Wave(level)
+
+
+def test_pipeline_reuses_close_prefetch():
+    builder = RecordingBuilder()
+    pipeline = WavePipeline(builder, tolerance=5)
+
+    pipeline.prefetch(100)
+    wave = pipeline.request(103).result()
+    pipeline.close()
+
+    assert wave.level == 100
+    assert builder.levels == [100]
+
+
+def test_pipeline_rebuilds_when_prediction_is_off():
+    builder = RecordingBuilder()
+    pipeline = WavePipeline(builder, tolerance=5)
+
+    pipeline.prefetch(100)
+    wave = pipeline.request(200).result()
+    pipeline.close()
+
+    assert wave.level == 200
+    assert builder.levels[-1] == 200
+
+
+def test_pipeline_builds_on_demand_without_prefetch():
+    builder = RecordingBuilder()
+    pipeline = WavePipeline(builder)
+
+    assert pipeline.request(7).result().level == 7
+    pipeline.close()
+
+
+def test_build_wave_loads_every_foe_photo():
+    loaded = []
+
+    wave = build_wave(40, load_photo=loaded.append, rng=random.Random(2))
+
+    assert len(wave.foelist) == NUMBER_OF_FOES
+    assert loaded == wave.all_foes
+    assert all(foe.photo != "player.png" for foe in wave.all_foes)
+
+
+def test_build_wave_clones_foes_from_a_cache():
+    cache = FoeCache()
+
+    first = build_wave(5000, rng=random.Random(2), cache=cache)
+    second = build_wave(5000, rng=random.Random(2), cache=cache)
+
+    assert cache.hits > 0
+    assert [(foe.PlayerName, foe.level, foe.MHP) for foe in first.all_foes] == [(foe.PlayerName, foe.level, foe.MHP) for foe in second.all_foes]
+    assert all(foe.photo != "player.png" for foe in second.all_foes)
+
+
+def test_build_foes_is_reproducible():
+    first, first_backups = build_foes(60, rng=random.Random(4))
+    second, second_backups = build_foes(60, rng=random.Random(4))
+
+    assert [(foe.PlayerName, foe.level, foe.MHP, foe.Atk) for foe in first + first_backups] == [(foe.PlayerName, foe.level, foe.MHP, foe.Atk) for foe in second + second_backups]
+
+
+def test_build_foes_rebuilds_reused_foes_in_place():
+    old, old_backups = build_foes(60, rng=random.Random(3))
+    for foe in old:
+        foe.HP = 0
+        foe.Logs.append("fallen")
+        foe.stale = True
+
+    fresh = build_foes(80, rng=random.Random(4))
+    reused = build_foes(80, rng=random.Random(4), reuse=old + old_backups)
+
+    assert all(foe in old + old_backups for foe in reused[0])
+    assert [foe.__dict__.keys() for foe in reused[0] + reused[1]] == [foe.__dict__.keys() for foe in fresh[0] + fresh[1]]
+    assert [(foe.PlayerName, foe.level, foe.HP, foe.MHP, foe.Atk, foe.Logs) for foe in reused[0] + reused[1]] == [(foe.PlayerName, foe.level, foe.HP, foe.MHP, foe.Atk, foe.Logs) for foe in fresh[0] + fresh[1]]
+
+
+def test_mimic_copies_the_player_from_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lives").mkdir()
+    (tmp_path / "lives" / "Player.dat").write_bytes(b"half a pickle")
+
+    player = Player("Player")
+    player.Atk = 50000
+    party = [Player("Becca"), player]
+
+    foe = build_foe(FoeSpec("Mimic", "mimic", 100, 1, 2, mimic_source(party)))
+
+    assert foe.PlayerName == "Mimic"
+    assert foe.Atk == 10000
+    assert mimic_source(party[:1]) is None
+
+
+def test_pipeline_passes_keywords_to_the_builder():
+    calls = []
+    pipeline = WavePipeline(lambda level, mimic=None: calls.append((level, mimic)) or Wave(level))
+
+    pipeline.request(200, mimic=b"now").result()
+    pipeline.prefetch(100, mimic=b"save")
+    pipeline.request(100, mimic=b"later").result()
+    pipeline.close()
+
+    assert calls == [(200, b"now"), (100, b"save")]
+
+
+def test_wave_level_averages_party_progress():
+    party = [Player("Hero"), Player("Sidekick")]
+    party[0].level = 30
+    party[1].level = 10
+
+    assert wave_level(party, 20) == 30